@@ -0,0 +1,118 @@
+from collections import OrderedDict
+
+class FrameStrip:
+    """One full cycle of a periodic effect, sampled at frame_count phases.
+
+    Frames are rendered lazily the first time their phase is shown, so a
+    strip only costs memory for the part of the cycle actually played.
+    """
+
+    def __init__(self, render, period, frame_count):
+        self.render = render            # phase -> Surface
+        self.period = period
+        self.frame_count = frame_count
+        self.frames = [None] * frame_count
+        self.nbytes = 0
+        self.last_used = 0
+
+    def index(self, phase):
+        """Return the frame nearest to a phase"""
+        return int(round(phase / self.period * self.frame_count)) % self.frame_count
+
+    def phase(self, index):
+        """Return the phase a frame is rendered at"""
+        return index * self.period / self.frame_count
+
+    def clear(self):
+        """Drop every rendered frame"""
+        self.frames = [None] * self.frame_count
+        self.nbytes = 0
+
+def frame_bytes(frame):
+    """Return the pixel memory held by a surface"""
+    width, height = frame.get_size()
+    return width * height * frame.get_bytesize()
+
+class AnimationCache:
+    """Pre-rendered cycles of periodic animations, sharing one memory budget.
+
+    Each animated entity asks for the frame at its current phase; frames are
+    rendered once per cycle position and played back by index afterwards.
+    Strips that were not drawn for idle_frames frames belong to entities
+    that are hidden or gone and are released at the end of the frame. When
+    a new frame does not fit the budget, least recently drawn strips are
+    released first; if it still does not fit it is drawn without caching.
+    """
+
+    def __init__(self, max_bytes=64 * 1024 * 1024, idle_frames=120):
+        self.max_bytes = max_bytes
+        self.idle_frames = idle_frames
+        self.strips = OrderedDict()  # key -> FrameStrip, least recently used first
+        self.total_bytes = 0
+        self.frame_index = 0
+
+    def get_frame(self, key, phase, render, period, frame_count):
+        """Return the frame of a periodic animation nearest to phase
+
+        key identifies the animation and everything its look depends on
+        (include the owning object and its palette); render(phase) draws a
+        frame when it is not cached yet.
+        """
+        strip = self.strips.get(key)
+        if strip is None or strip.frame_count != frame_count or strip.period != period:
+            if strip is not None:
+                self.release(key)
+            strip = FrameStrip(render, period, frame_count)
+            self.strips[key] = strip
+        else:
+            self.strips.move_to_end(key)
+        strip.last_used = self.frame_index
+
+        index = strip.index(phase)
+        frame = strip.frames[index]
+        if frame is None:
+            frame = strip.render(strip.phase(index))
+            size = frame_bytes(frame)
+            self.make_room(size, keep=key)
+            if self.total_bytes + size <= self.max_bytes:
+                strip.frames[index] = frame
+                strip.nbytes += size
+                self.total_bytes += size
+        return frame
+
+    def make_room(self, size, keep=None):
+        """Release least recently drawn strips until size more bytes fit"""
+        for key in list(self.strips):
+            if self.total_bytes + size <= self.max_bytes:
+                break
+            if key != keep:
+                self.release(key)
+
+    def release(self, key):
+        """Forget a strip and its frames"""
+        strip = self.strips.pop(key, None)
+        if strip is not None:
+            self.total_bytes -= strip.nbytes
+            strip.clear()
+
+    def end_frame(self):
+        """Release strips of entities that have not been drawn recently"""
+        self.frame_index += 1
+        for key, strip in list(self.strips.items()):
+            if self.frame_index - strip.last_used <= self.idle_frames:
+                break  # Ordered by last use, so the rest are all recent
+            self.release(key)
+
+    def clear(self):
+        """Release every strip"""
+        for key in list(self.strips):
+            self.release(key)
+
+_animation_cache = None
+
+def get_animation_cache():
+    """Return the shared animation cache, creating it on first use"""
+    global _animation_cache
+    if _animation_cache is None:
+        _animation_cache = AnimationCache()
+    return _animation_cache
@@ -1,19 +1,52 @@
 import pygame
 import math
+import numpy as np
 
 class RadiationWaves:
     def __init__(self, x, y):
         self.x = x
         self.y = y
-        self.waves = []
         self.wave_timer = 0
         self.wave_interval = 30  # frames between new waves
         
         # Realistic wave properties
         self.max_radius = 80
         self.wave_speed = 1.5
+        self.wave_fade = 3  # alpha lost per frame
         self.wave_color = (0, 255, 100, 30)  # Subtle green with low transparency
         
+        # Live waves sit in a fixed-capacity ring buffer, oldest at head.
+        # All waves grow and fade at the same rate, so they always expire
+        # in the order they were spawned.
+        self.capacity = 0
+        self.radii = np.zeros(0)
+        self.alphas = np.zeros(0)
+        self.head = 0
+        self.count = 0
+        self.ensure_capacity()
+        
+        # Pre-rendered ring sprites keyed by quantized (radius, alpha)
+        self.radius_step = 0.5
+        self.alpha_step = 3
+        self.sprites = {}
+        
+    def ensure_capacity(self):
+        """Size the ring buffer for the longest a wave can live"""
+        lifetime = min(self.max_radius / self.wave_speed, 255 / self.wave_fade) + 1
+        capacity = int(math.ceil(lifetime / self.wave_interval)) + 1
+        if capacity <= self.capacity:
+            return
+        
+        # Grow while keeping live waves in order
+        order = (self.head + np.arange(self.count)) % max(1, self.capacity)
+        radii = np.zeros(capacity)
+        alphas = np.zeros(capacity)
+        radii[:self.count] = self.radii[order]
+        alphas[:self.count] = self.alphas[order]
+        self.radii, self.alphas = radii, alphas
+        self.capacity = capacity
+        self.head = 0
+    
     def update(self, x, y):
         """Update radiation waves position and animation"""
         self.x = x
@@ -22,32 +55,54 @@ class RadiationWaves:
         # Create new wave
         self.wave_timer += 1
         if self.wave_timer >= self.wave_interval:
-            self.waves.append({'radius': 0, 'alpha': 255})
+            self.ensure_capacity()
+            if self.count == self.capacity:
+                # Drop the oldest wave rather than allocate
+                self.head = (self.head + 1) % self.capacity
+                self.count -= 1
+            slot = (self.head + self.count) % self.capacity
+            self.radii[slot] = 0
+            self.alphas[slot] = 255
+            self.count += 1
             self.wave_timer = 0
         
-        # Update existing waves
-        for wave in self.waves[:]:  # Use slice to avoid modification during iteration
-            wave['radius'] += self.wave_speed
-            wave['alpha'] -= 3  # Fade out
-            
-            # Remove waves that are too big or faded
-            if wave['radius'] > self.max_radius or wave['alpha'] <= 0:
-                self.waves.remove(wave)
+        # Update every slot in place; dead slots are simply ignored
+        self.radii += self.wave_speed
+        self.alphas -= self.wave_fade
+        
+        # Remove waves that are too big or faded
+        while self.count and (self.radii[self.head] > self.max_radius or self.alphas[self.head] <= 0):
+            self.head = (self.head + 1) % self.capacity
+            self.count -= 1
+    
+    def get_sprite(self, radius, alpha):
+        """Return the cached ring sprite for a quantized radius and alpha"""
+        key = (radius, alpha)
+        sprite = self.sprites.get(key)
+        if sprite is None:
+            sprite = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+            wave_color = (*self.wave_color[:3], max(0, min(255, alpha)))
+            pygame.draw.circle(sprite, wave_color, (radius, radius), radius, 2)
+            self.sprites[key] = sprite
+        return sprite
+    
+    def get_rect(self):
+        """Return the screen area the waves can reach"""
+        size = int(self.max_radius + self.wave_speed) * 2 + 4
+        rect = pygame.Rect(0, 0, size, size)
+        rect.center = (int(self.x), int(self.y))
+        return rect
     
     def draw(self, screen):
         """Draw radiation waves"""
-        for wave in self.waves:
-            if wave['alpha'] > 0:
-                # Create surface with alpha for transparency
-                wave_surface = pygame.Surface((wave['radius'] * 2, wave['radius'] * 2), pygame.SRCALPHA)
-                wave_color = (*self.wave_color[:3], max(0, min(255, wave['alpha'])))
-                
-                pygame.draw.circle(wave_surface, wave_color, 
-                                 (wave['radius'], wave['radius']), 
-                                 wave['radius'], 2)
-                
-                screen.blit(wave_surface, 
-                           (self.x - wave['radius'], self.y - wave['radius']))
+        for i in range(self.count):
+            slot = (self.head + i) % self.capacity
+            alpha = int(self.alphas[slot])
+            if alpha > 0:
+                radius = round(self.radii[slot] / self.radius_step) * self.radius_step
+                alpha = alpha // self.alpha_step * self.alpha_step
+                sprite = self.get_sprite(radius, alpha)
+                screen.blit(sprite, (self.x - radius, self.y - radius))
 
 class ConnectionLines:
     def __init__(self):
@@ -57,6 +112,19 @@ class ConnectionLines:
         # Realistic connection line properties
         self.line_color = (100, 149, 237)    # Cornflower blue - more subtle
         self.pulse_color = (255, 165, 0)     # Orange pulse - less intense
+        self.pulse_radius = 5                # Solid pulse dot
+        self.glow_radius = 14                # Outermost glow ring around the pulse
+        
+        # Active links as (start_pos, end_pos, phase_offset, pulse_color)
+        self.links = []
+        
+        # Pre-rendered pulse dot + glow sprites keyed by (color, radius)
+        self.pulse_sprites = {}
+        
+        # Pulse progress along a line over one cycle, played back by index;
+        # four entries per step, so interpolated frames between steps move too
+        self.pulse_frames = 4 * round(2 * math.pi / self.pulse_speed)
+        self.pulse_progress = self.create_pulse_progress(self.pulse_frames)
         
     def update(self, satellite_pos, car_pos, mobile_pos):
         """Update connection line animations"""
@@ -64,44 +132,101 @@ class ConnectionLines:
         self.car_pos = car_pos
         self.mobile_pos = mobile_pos
         
+        # Satellite to car and satellite to mobile, pulsing in opposite phase
+        self.update_links([(satellite_pos, car_pos, 0), (satellite_pos, mobile_pos, math.pi)])
+    
+    def update_links(self, links):
+        """Draw a new set of links from now on and advance the pulses"""
+        self.set_links(links)
+        
         self.pulse_offset += self.pulse_speed
         if self.pulse_offset >= 2 * math.pi:
             self.pulse_offset = 0
     
+    def set_links(self, links):
+        """Replace the drawn links; each is (start, end, phase[, pulse_color])"""
+        self.links = []
+        for link in links:
+            color = link[3] if len(link) > 3 else self.pulse_color
+            self.links.append((link[0], link[1], link[2], color))
+    
+    def get_rects(self):
+        """Return rects tightly covering each line, split into short segments"""
+        rects = []
+        for start_pos, end_pos, phase_offset, color in self.links:
+            rects.extend(self.get_line_rects(start_pos, end_pos))
+        return rects
+    
+    def get_line_rects(self, start_pos, end_pos, segments=8):
+        """Cover a line (and the pulse glow travelling along it) with small rects"""
+        # Pulse sprites are at most glow_radius from the line (8px with the
+        # default dot, whose outer rings fade out), plus 2px for rounding
+        margin = self.glow_radius + 2
+        rects = []
+        for i in range(segments):
+            x1 = start_pos[0] + (end_pos[0] - start_pos[0]) * i / segments
+            y1 = start_pos[1] + (end_pos[1] - start_pos[1]) * i / segments
+            x2 = start_pos[0] + (end_pos[0] - start_pos[0]) * (i + 1) / segments
+            y2 = start_pos[1] + (end_pos[1] - start_pos[1]) * (i + 1) / segments
+            left, top = int(min(x1, x2)) - margin, int(min(y1, y2)) - margin
+            right, bottom = int(max(x1, x2)) + margin, int(max(y1, y2)) + margin
+            rects.append(pygame.Rect(left, top, right - left + 1, bottom - top + 1))
+        return rects
+    
     def draw(self, screen):
         """Draw animated connection lines"""
-        if not hasattr(self, 'satellite_pos'):
+        if not self.links:
             return
+        
+        # Base lines first, then every pulse in one batched blit
+        pulses = []
+        for start_pos, end_pos, phase_offset, color in self.links:
+            pygame.draw.line(screen, self.line_color, start_pos, end_pos, 2)
+            
+            # Look up the pulse position along the line
+            pulse_progress = self.get_pulse_progress(self.pulse_offset + phase_offset)
+            pulse_x = start_pos[0] + (end_pos[0] - start_pos[0]) * pulse_progress
+            pulse_y = start_pos[1] + (end_pos[1] - start_pos[1]) * pulse_progress
             
-        # Draw line from satellite to car
-        self.draw_pulsing_line(screen, self.satellite_pos, self.car_pos, 0)
+            sprite, half_size = self.get_pulse_sprite(color, self.pulse_radius)
+            pulses.append((sprite, (int(pulse_x) - half_size, int(pulse_y) - half_size)))
         
-        # Draw line from satellite to mobile
-        self.draw_pulsing_line(screen, self.satellite_pos, self.mobile_pos, math.pi)
+        screen.blits(pulses, False)
     
-    def draw_pulsing_line(self, screen, start_pos, end_pos, phase_offset):
-        """Draw a single pulsing connection line"""
-        # Base line
-        pygame.draw.line(screen, self.line_color, start_pos, end_pos, 2)
-        
-        # Calculate pulse position
-        pulse_progress = (math.sin(self.pulse_offset + phase_offset) + 1) / 2
-        
-        # Calculate pulse position along the line
-        pulse_x = start_pos[0] + (end_pos[0] - start_pos[0]) * pulse_progress
-        pulse_y = start_pos[1] + (end_pos[1] - start_pos[1]) * pulse_progress
+    def create_pulse_progress(self, frame_count):
+        """Return the pulse progress (0 to 1) at frame_count phases of one cycle"""
+        phases = np.arange(frame_count) * (2 * math.pi / frame_count)
+        return ((np.sin(phases) + 1) / 2).tolist()
+    
+    def get_pulse_progress(self, phase):
+        """Return the pulse progress at the cycle frame nearest to phase"""
+        index = int(round(phase / (2 * math.pi) * self.pulse_frames)) % self.pulse_frames
+        return self.pulse_progress[index]
+    
+    def get_pulse_sprite(self, color, radius):
+        """Return the cached pulse dot with its glow, and half its size"""
+        key = (color, radius)
+        cached = self.pulse_sprites.get(key)
+        if cached is None:
+            cached = self.create_pulse_sprite(color, radius)
+            self.pulse_sprites[key] = cached
+        return cached
+    
+    def create_pulse_sprite(self, color, radius):
+        """Render a pulse dot with its translucent glow rings into one sprite"""
+        glow_rings = []
+        for glow in range(radius + 3, self.glow_radius + 1, 2):
+            alpha = max(0, 100 - (glow - radius) * 20)
+            if alpha > 0:
+                glow_rings.append((glow, alpha))
         
-        # Draw pulse dot
-        pygame.draw.circle(screen, self.pulse_color, 
-                          (int(pulse_x), int(pulse_y)), 5)
+        half_size = max([radius] + [glow for glow, alpha in glow_rings])
+        sprite = pygame.Surface((half_size * 2, half_size * 2), pygame.SRCALPHA)
         
-        # Draw glow effect around pulse
-        for radius in range(8, 15, 2):
-            alpha = max(0, 100 - (radius - 5) * 20)
-            if alpha > 0:
-                glow_surface = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
-                glow_color = (*self.pulse_color, alpha)
-                pygame.draw.circle(glow_surface, glow_color, 
-                                 (radius, radius), radius)
-                screen.blit(glow_surface, 
-                           (pulse_x - radius, pulse_y - radius))
+        # Solid dot, then the glow blended over it
+        pygame.draw.circle(sprite, color, (half_size, half_size), radius)
+        for glow, alpha in glow_rings:
+            glow_surface = pygame.Surface((glow * 2, glow * 2), pygame.SRCALPHA)
+            pygame.draw.circle(glow_surface, (*color, alpha), (glow, glow), glow)
+            sprite.blit(glow_surface, (half_size - glow, half_size - glow))
+        return sprite, half_size
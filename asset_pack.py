@@ -0,0 +1,123 @@
+"""Binary container for display-ready pixel buffers.
+
+A pack is a small header, a table of entries and the raw pixels of each
+entry, so loading it is an mmap plus one pygame.image.frombuffer per frame
+with no decoding, scaling or copying. The header carries a key derived from
+the source file and the processing parameters; a pack whose key does not
+match is stale and gets rebuilt.
+
+Compile the Earth's pack ahead of time, rotation frames included, with:
+    python asset_pack.py --rotation
+"""
+import os
+import sys
+import mmap
+import struct
+import hashlib
+import argparse
+import pygame
+
+PACK_MAGIC = b"DMPK"
+PACK_VERSION = 1
+PIXEL_FORMAT = "BGRA"  # Byte order of SDL's ARGB8888, the format of pygame's alpha surfaces
+DATA_ALIGNMENT = 64    # Entry pixels start on cache-line boundaries
+
+HEADER = struct.Struct("<4sHH32s")      # magic, version, entry count, key
+ENTRY = struct.Struct("<16s4sIIIQ")     # name, pixel format, width, height, frames, data offset
+
+def pack_key(source_path, *params):
+    """Return the 32-byte key of a source file's contents and processing parameters"""
+    digest = hashlib.sha256()
+    with open(source_path, "rb") as source:
+        digest.update(source.read())
+    digest.update(repr(params).encode())
+    return digest.digest()
+
+def build_pack(key, entries):
+    """Return the bytes of a pack holding entries: {name: [frames]} of equal-size surfaces"""
+    table_size = HEADER.size + ENTRY.size * len(entries)
+    offset = align(table_size)
+    table = [HEADER.pack(PACK_MAGIC, PACK_VERSION, len(entries), key)]
+    chunks = []
+    for name, frames in entries.items():
+        width, height = frames[0].get_size()
+        table.append(ENTRY.pack(name.encode(), PIXEL_FORMAT.encode(), width, height, len(frames), offset))
+        data = b"".join(pygame.image.tobytes(frame, PIXEL_FORMAT) for frame in frames)
+        chunks.append(data + bytes(align(len(data)) - len(data)))
+        offset += len(chunks[-1])
+
+    header = b"".join(table)
+    return header + bytes(align(table_size) - table_size) + b"".join(chunks)
+
+def write_pack(path, data):
+    """Write pack bytes to disk; a partly written pack is never left behind"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    temporary = f"{path}.{os.getpid()}.tmp"
+    with open(temporary, "wb") as pack_file:
+        pack_file.write(data)
+    os.replace(temporary, path)
+
+def align(size):
+    return (size + DATA_ALIGNMENT - 1) // DATA_ALIGNMENT * DATA_ALIGNMENT
+
+class AssetPack:
+    """Read-only view of a pack held in memory or memory-mapped from disk.
+
+    Frames are Surfaces wrapping the pack's own bytes, so the buffer must
+    outlive them; the pack keeps it referenced for as long as it exists.
+    """
+
+    def __init__(self, buffer):
+        self.buffer = buffer
+        self.view = memoryview(buffer)
+        magic, version, count, self.key = HEADER.unpack_from(self.view, 0)
+        if magic != PACK_MAGIC or version != PACK_VERSION:
+            raise ValueError("Not an asset pack of a supported version")
+
+        self.entries = {}  # name -> (pixel format, size, frames, offset)
+        for index in range(count):
+            name, pixel_format, width, height, frames, offset = ENTRY.unpack_from(
+                self.view, HEADER.size + index * ENTRY.size)
+            if offset + width * height * 4 * frames > len(self.view):
+                raise ValueError("Asset pack is truncated")
+            self.entries[name.rstrip(b"\0").decode()] = (pixel_format.decode(), (width, height), frames, offset)
+
+    @classmethod
+    def open(cls, path, key):
+        """Memory-map the pack at path, or return None if it is missing, damaged or stale"""
+        try:
+            with open(path, "rb") as pack_file:
+                pack = cls(mmap.mmap(pack_file.fileno(), 0, access=mmap.ACCESS_READ))
+        except (OSError, ValueError, struct.error):
+            return None
+        return pack if pack.key == key else None
+
+    def __contains__(self, name):
+        return name in self.entries
+
+    def frame_count(self, name):
+        return self.entries[name][2]
+
+    def frame(self, name, index=0):
+        """Return one frame of an entry as a Surface over the pack's bytes"""
+        pixel_format, size, frames, offset = self.entries[name]
+        frame_bytes = size[0] * size[1] * 4
+        start = offset + index % frames * frame_bytes
+        return pygame.image.frombuffer(self.view[start:start + frame_bytes], size, pixel_format)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compile the Earth's display-ready asset pack")
+    parser.add_argument("--rotation", action="store_true",
+                        help="also pre-render every rotation frame into the pack")
+    args = parser.parse_args(argv)
+
+    from earth import Earth
+    earth = Earth(0, 0, load_image=False)
+    path = earth.compile_assets(args.rotation)
+    if path is None:
+        return 1
+    print(f"Wrote {path} ({os.path.getsize(path) / (1024 * 1024):.1f} MB)")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,96 @@
+import time
+import threading
+from collections import deque
+
+class AssetLoader:
+    """Loads assets on a background thread while the scene is already running.
+
+    Each asset is a load function, run on the worker thread, and an apply
+    function that poll() hands the result to on the main thread, so only
+    the main thread ever touches the display or live scene objects. Until
+    then the scene draws with placeholders. Time to first frame and time
+    to fully loaded are logged relative to the loader's creation.
+    """
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.condition = threading.Condition()
+        self.jobs = deque()       # (name, load, apply) waiting for the worker
+        self.finished = deque()   # (name, apply, result, seconds, failed) waiting to be applied
+        self.pending = 0          # Assets added but not applied yet
+        self.thread = None
+
+        self.first_frame_time = None  # Seconds from start to the first frame shown
+        self.loaded_time = None       # Seconds from start until every asset was applied
+
+    def add(self, name, load, apply=None):
+        """Queue an asset: load() runs in the background, apply(result) on poll()"""
+        with self.condition:
+            self.jobs.append((name, load, apply))
+            self.pending += 1
+
+    def start(self):
+        """Start loading the queued assets"""
+        self.thread = threading.Thread(target=self.run, name="asset-loader", daemon=True)
+        self.thread.start()
+
+    def run(self):
+        """Worker thread: load queued assets until none are left"""
+        while True:
+            with self.condition:
+                if not self.jobs:
+                    return
+                name, load, apply = self.jobs.popleft()
+
+            # A failed asset is reported without its apply, keeping the
+            # placeholder, and the loop goes on so wait() cannot hang
+            begin = time.perf_counter()
+            result = None
+            failed = False
+            try:
+                result = load()
+            except Exception as error:
+                print(f"Could not load {name}: {error!r}")
+                apply = None
+                failed = True
+            finally:
+                with self.condition:
+                    self.finished.append((name, apply, result, time.perf_counter() - begin, failed))
+                    self.condition.notify_all()
+
+    def poll(self):
+        """Apply the assets that finished loading; return True if any were applied"""
+        with self.condition:
+            finished = list(self.finished)
+            self.finished.clear()
+
+        for name, apply, result, seconds, failed in finished:
+            if apply is not None:
+                apply(result)
+            self.pending -= 1
+            if not failed:
+                print(f"Loaded {name} in {seconds * 1000:.0f} ms")
+
+        if finished and not self.pending:
+            self.loaded_time = time.perf_counter() - self.started
+            print(f"Time to fully loaded: {self.loaded_time * 1000:.0f} ms")
+        return bool(finished)
+
+    def wait(self):
+        """Block until every queued asset has loaded, then apply them all"""
+        if self.thread is None:
+            self.start()
+        with self.condition:
+            while len(self.finished) < self.pending:
+                self.condition.wait()
+        self.poll()
+
+    def frame_shown(self):
+        """Record that a frame reached the screen; the first one is logged"""
+        if self.first_frame_time is None:
+            self.first_frame_time = time.perf_counter() - self.started
+            print(f"Time to first frame: {self.first_frame_time * 1000:.0f} ms")
+
+    @property
+    def loaded(self):
+        return self.pending == 0
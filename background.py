@@ -0,0 +1,168 @@
+import pygame
+from geometry import petal_points
+
+class BackgroundLayer:
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+
+        # Scenery colors
+        self.sky_blue = (135, 206, 235)      # Realistic sky color
+        self.grass_green = (34, 139, 34)     # Forest green for grass
+        self.dark_grass = (0, 100, 0)        # Darker green for grass texture
+
+        # Baked surface and the layout it was baked for
+        self.surface = None
+        self.layout = None
+
+    def get_surface(self, grass_y=None):
+        """Return the baked background, rebuilding it only if the layout changed"""
+        layout = (self.width, self.height, grass_y)
+        if self.surface is None or layout != self.layout:
+            self.rebuild(grass_y)
+            self.layout = layout
+        return self.surface
+
+    def resize(self, width, height):
+        """Change the background size; the next get_surface call rebakes it"""
+        self.width = width
+        self.height = height
+
+    def rebuild(self, grass_y):
+        """Bake the sky and (optionally) the grassland into a display-format surface"""
+        surface = pygame.Surface((self.width, self.height))
+        if pygame.display.get_surface() is not None:
+            # Match the display pixel format so the per-frame blit is a plain copy
+            surface = surface.convert()
+
+        surface.fill(self.sky_blue)
+        if grass_y is not None:
+            self.draw_grassland(surface, grass_y)
+
+        self.surface = surface
+
+    def draw(self, screen, grass_y=None):
+        """Blit the whole background onto the screen"""
+        screen.blit(self.get_surface(grass_y), (0, 0))
+
+    def draw_grassland(self, surface, grass_y):
+        """Draw realistic grassland below Earth with flowers and design elements"""
+        pygame.draw.rect(surface, self.grass_green,
+                        (0, grass_y, self.width, self.height - grass_y))
+
+        # Add realistic grass texture with varying heights and colors
+        grass_colors = [self.dark_grass, (46, 125, 50), (27, 94, 32)]
+        for i in range(0, self.width, 8):
+            # Vary grass height and color for realism
+            grass_height = 8 + (i % 12)
+            color_idx = (i // 8) % len(grass_colors)
+            pygame.draw.line(surface, grass_colors[color_idx],
+                           (i, grass_y), (i, grass_y + grass_height), 2)
+            pygame.draw.line(surface, grass_colors[color_idx],
+                           (i + 3, grass_y), (i + 3, grass_y + grass_height - 2), 1)
+
+        # Add flowers scattered across the grassland
+        self.draw_flowers(surface, grass_y)
+
+        # Add bushes and small plants
+        self.draw_bushes(surface, grass_y)
+
+        # Add small rocks and pebbles
+        self.draw_rocks(surface, grass_y)
+
+        # Add dandelions and wildflowers
+        self.draw_wildflowers(surface, grass_y)
+
+    def draw_flowers(self, surface, grass_y):
+        """Draw colorful flowers scattered across the grassland"""
+        flower_colors = [
+            (255, 105, 180),  # Hot pink
+            (255, 165, 0),    # Orange
+            (255, 255, 0),    # Yellow
+            (138, 43, 226),   # Blue violet
+            (255, 20, 147),   # Deep pink
+            (255, 69, 0),     # Red orange
+        ]
+
+        # Draw flowers at specific positions for consistency
+        flower_positions = [
+            (150, grass_y + 15), (300, grass_y + 20), (450, grass_y + 12),
+            (600, grass_y + 18), (750, grass_y + 15), (900, grass_y + 22),
+            (1050, grass_y + 16), (200, grass_y + 25), (350, grass_y + 30),
+            (500, grass_y + 28), (650, grass_y + 24), (800, grass_y + 27),
+            (950, grass_y + 29), (1100, grass_y + 26), (100, grass_y + 35),
+            (250, grass_y + 32), (400, grass_y + 38), (550, grass_y + 34),
+            (700, grass_y + 36), (850, grass_y + 33), (1000, grass_y + 37)
+        ]
+
+        for i, (x, y) in enumerate(flower_positions):
+            if x < self.width:
+                color = flower_colors[i % len(flower_colors)]
+                # Flower petals
+                for petal in petal_points((x, y), 3, 5):
+                    pygame.draw.circle(surface, color, petal, 2)
+                # Flower center
+                pygame.draw.circle(surface, (255, 255, 0), (x, y), 1)
+                # Flower stem
+                pygame.draw.line(surface, (0, 100, 0), (x, y), (x, y + 8), 1)
+
+    def draw_bushes(self, surface, grass_y):
+        """Draw small bushes and shrubs"""
+        bush_positions = [
+            (180, grass_y + 20), (380, grass_y + 25), (580, grass_y + 22),
+            (780, grass_y + 24), (980, grass_y + 21), (1180, grass_y + 23)
+        ]
+
+        bush_green = (34, 139, 34)
+        dark_bush = (0, 100, 0)
+
+        for x, y in bush_positions:
+            if x < self.width:
+                # Main bush body
+                pygame.draw.ellipse(surface, bush_green, (x - 8, y, 16, 12))
+                # Bush highlight
+                pygame.draw.ellipse(surface, (60, 179, 113), (x - 6, y + 1, 12, 4))
+                # Bush shadow
+                pygame.draw.ellipse(surface, dark_bush, (x - 7, y + 8, 14, 6))
+
+    def draw_rocks(self, surface, grass_y):
+        """Draw small rocks and pebbles"""
+        rock_positions = [
+            (120, grass_y + 30), (320, grass_y + 35), (520, grass_y + 32),
+            (720, grass_y + 36), (920, grass_y + 33), (1120, grass_y + 34)
+        ]
+
+        rock_gray = (105, 105, 105)
+        dark_rock = (69, 69, 69)
+
+        for x, y in rock_positions:
+            if x < self.width:
+                # Main rock
+                pygame.draw.ellipse(surface, rock_gray, (x, y, 6, 4))
+                # Rock highlight
+                pygame.draw.ellipse(surface, (169, 169, 169), (x + 1, y, 3, 2))
+                # Rock shadow
+                pygame.draw.ellipse(surface, dark_rock, (x + 1, y + 2, 4, 3))
+
+    def draw_wildflowers(self, surface, grass_y):
+        """Draw dandelions and small wildflowers"""
+        wildflower_positions = [
+            (80, grass_y + 18), (280, grass_y + 22), (480, grass_y + 19),
+            (680, grass_y + 21), (880, grass_y + 20), (1080, grass_y + 23)
+        ]
+
+        for i, (x, y) in enumerate(wildflower_positions):
+            if x < self.width:
+                if i % 2 == 0:
+                    # Dandelion
+                    pygame.draw.circle(surface, (255, 255, 0), (x, y), 3)
+                    pygame.draw.circle(surface, (255, 215, 0), (x, y), 2)
+                    # Dandelion stem
+                    pygame.draw.line(surface, (0, 100, 0), (x, y), (x, y + 6), 1)
+                else:
+                    # Small white wildflower
+                    for petal in petal_points((x, y), 2, 4):
+                        pygame.draw.circle(surface, (255, 255, 255), petal, 1)
+                    pygame.draw.circle(surface, (255, 255, 0), (x, y), 1)
+                    # Stem
+                    pygame.draw.line(surface, (0, 100, 0), (x, y), (x, y + 5), 1)
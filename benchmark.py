@@ -0,0 +1,284 @@
+"""Headless per-component rendering benchmarks with regression thresholds.
+
+Usage:
+    python benchmark.py --save-baseline          # record benchmark_baseline.json
+    python benchmark.py                          # compare against it
+    python benchmark.py --threshold 10 --components earth car
+
+Each component's update and draw are timed over many iterations at several
+screen sizes and entity counts. The run fails (exit status 1) when any
+measurement is slower than its baseline by more than the threshold.
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import numpy as np
+
+# The dummy drivers must be selected before pygame initializes
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+from earth import Earth
+from satellite import Satellite
+from car import Car
+from mobile import Mobile
+from school import School
+from info_panel import InfoPanel
+from animation_effects import RadiationWaves, ConnectionLines
+from background import BackgroundLayer
+from fleet import CarFleet
+from orbits import Constellation, SkyProjection, OrbitLayer
+from links import LinkEngine
+from gnss import GnssSolver
+
+DEFAULT_SIZES = [(800, 600), (1200, 800), (1920, 1080)]
+DEFAULT_COUNTS = [1, 10, 50]
+DEFAULT_BASELINE = "benchmark_baseline.json"
+FLEET_SIZE = 10000  # Cars in the fleet benchmark
+ORBIT_COUNT = 5000  # Satellites in the orbit propagation benchmark
+RECEIVER_COUNT = 300  # Ground receivers in the link assignment benchmark
+GNSS_RECEIVERS = 10000  # Receivers positioned per step in the GNSS benchmark
+
+def spread_x(width, index, count):
+    """Spread count entities evenly across the screen width"""
+    return int((index + 1) * width / (count + 1))
+
+class ComponentBenchmark:
+    """How to build, update and draw one kind of scene component"""
+
+    def __init__(self, name, create, update=None, draw=None, scalable=True, warmup=0,
+                 throughput=None):
+        self.name = name
+        self.create = create          # (width, height, index, count) -> entity
+        self.update = update          # (entity) -> None, or None if static
+        self.draw = draw              # (entity, surface) -> None, or None if not drawn
+        self.scalable = scalable      # False if only one instance makes sense
+        self.warmup = warmup          # Minimum untimed iterations to fill caches
+        self.throughput = throughput  # (unit, items per update) to report a rate for
+
+def create_waves(width, height, index, count):
+    waves = RadiationWaves(spread_x(width, index, count), 80)
+    # Start from a steady state with a full set of live waves
+    for _ in range(waves.wave_interval * 4):
+        waves.update(waves.x, waves.y)
+    return waves
+
+def create_connections(width, height, index, count):
+    lines = ConnectionLines()
+    x = spread_x(width, index, count)
+    lines.update((x, 80), (x - 200, height - 120), (x + 200, height - 170))
+    return lines
+
+def create_info_panel(width, height, index, count):
+    return (InfoPanel(), Satellite(0, 0).get_info())
+
+def create_fleet(width, height, index, count):
+    return CarFleet(FLEET_SIZE, 0, width, height * 5 // 8 + 20, height - 120)
+
+def create_projection(width, height):
+    """Sky above the grassland, seen from the scene's observer"""
+    grass_y = height * 5 // 8
+    return SkyProjection(22.57, 88.36, width // 2, grass_y - 60, width // 2 - 80, grass_y - 140)
+
+def create_orbits(width, height, index, count):
+    # A Starlink-like shell of 100 planes at 550 km
+    constellation = Constellation.walker(ORBIT_COUNT, 100, 1, 550.0, 53.0)
+    return OrbitLayer(constellation, create_projection(width, height))
+
+def create_links(width, height, index, count):
+    orbits = create_orbits(width, height, index, count)
+    receivers = [(spread_x(width, i, RECEIVER_COUNT), height - 150) for i in range(RECEIVER_COUNT)]
+    ground = orbits.projection.ground_points([x for x, y in receivers])
+    return (orbits, LinkEngine(), receivers, ground, ConnectionLines())
+
+def update_links(links):
+    orbits, engine, receivers, ground, lines = links
+    orbits.update()
+    engine.update(orbits.fixed_positions, ground)
+    lines.update_links([(tuple(orbits.points[satellite]), receivers[receiver], rank)
+                        for receiver, satellite, rank in engine.get_links()])
+
+def create_gnss(width, height, index, count):
+    # GPS receivers spread across the ground, each tracking up to 8 satellites
+    satellites = Constellation.from_name('gps').earth_fixed()
+    ground = create_projection(width, height).ground_points(np.linspace(0, width, GNSS_RECEIVERS))
+    assignments = LinkEngine(links_per_receiver=8).update(satellites, ground)
+    return (GnssSolver(), satellites, ground, assignments)
+
+def create_grassland(width, height, index, count):
+    return (BackgroundLayer(width, height), height * 5 // 8)
+
+COMPONENTS = [
+    ComponentBenchmark("earth",
+                       lambda w, h, i, n: Earth(spread_x(w, i, n), h // 2),
+                       update=lambda earth: earth.update(),
+                       draw=lambda earth, surface: earth.draw(surface),
+                       scalable=False, warmup=720),
+    ComponentBenchmark("satellite",
+                       lambda w, h, i, n: Satellite(spread_x(w, i, n), 80),
+                       update=lambda satellite: satellite.update(),
+                       draw=lambda satellite, surface: satellite.draw(surface)),
+    ComponentBenchmark("car",
+                       lambda w, h, i, n: Car(spread_x(w, i, n), h - 120),
+                       update=lambda car: car.update(),
+                       draw=lambda car, surface: car.draw(surface)),
+    ComponentBenchmark("mobile",
+                       lambda w, h, i, n: Mobile(spread_x(w, i, n), h - 170),
+                       update=lambda mobile: mobile.update(),
+                       draw=lambda mobile, surface: mobile.draw(surface)),
+    ComponentBenchmark("school",
+                       lambda w, h, i, n: School(spread_x(w, i, n), h - 150),
+                       draw=lambda school, surface: school.draw(surface)),
+    ComponentBenchmark("radiation_waves", create_waves,
+                       update=lambda waves: waves.update(waves.x, waves.y),
+                       draw=lambda waves, surface: waves.draw(surface)),
+    ComponentBenchmark("connection_lines", create_connections,
+                       update=lambda lines: lines.update(lines.satellite_pos, lines.car_pos, lines.mobile_pos),
+                       draw=lambda lines, surface: lines.draw(surface)),
+    ComponentBenchmark("info_panel", create_info_panel,
+                       draw=lambda panel, surface: panel[0].draw(surface, panel[1]),
+                       scalable=False),
+    ComponentBenchmark("fleet", create_fleet,
+                       update=lambda fleet: fleet.update(),
+                       draw=lambda fleet, surface: fleet.draw(surface),
+                       scalable=False),
+    ComponentBenchmark("orbits", create_orbits,
+                       update=lambda orbits: orbits.update(),
+                       draw=lambda orbits, surface: orbits.draw(surface),
+                       scalable=False),
+    ComponentBenchmark("links", create_links, update=update_links,
+                       draw=lambda links, surface: links[4].draw(surface),
+                       scalable=False),
+    ComponentBenchmark("gnss", create_gnss,
+                       update=lambda gnss: gnss[0].update(*gnss[1:]),
+                       scalable=False, throughput=("fixes", GNSS_RECEIVERS)),
+    ComponentBenchmark("grassland", create_grassland,
+                       draw=lambda layer, surface: layer[0].draw_grassland(surface, layer[1]),
+                       scalable=False),
+]
+
+def time_component(component, size, count, iterations, warmup):
+    """Return mean microseconds per iteration for update and draw of count entities"""
+    width, height = size
+    surface = pygame.Surface(size).convert()
+    entities = [component.create(width, height, i, count) for i in range(count)]
+
+    # Let lazily built caches reach their steady state before timing
+    for _ in range(max(warmup, component.warmup)):
+        for entity in entities:
+            if component.update:
+                component.update(entity)
+            if component.draw:
+                component.draw(entity, surface)
+
+    update_time = 0.0
+    draw_time = 0.0
+    for _ in range(iterations):
+        start = time.perf_counter()
+        if component.update:
+            for entity in entities:
+                component.update(entity)
+        middle = time.perf_counter()
+        if component.draw:
+            for entity in entities:
+                component.draw(entity, surface)
+        end = time.perf_counter()
+        update_time += middle - start
+        draw_time += end - middle
+
+    results = {}
+    if component.draw:
+        results["draw"] = draw_time / iterations * 1e6
+    if component.update:
+        results["update"] = update_time / iterations * 1e6
+    return results
+
+def run_benchmarks(components, sizes, counts, iterations, warmup):
+    """Run every component at every size and count; return {key: microseconds}"""
+    results = {}
+    for component in components:
+        for size in sizes:
+            for count in (counts if component.scalable else [1]):
+                timings = time_component(component, size, count, iterations, warmup)
+                for operation, micros in timings.items():
+                    key = f"{component.name}.{operation}@{size[0]}x{size[1]}x{count}"
+                    results[key] = micros
+                    print(f"{key:<44} {micros:12.2f} us")
+                if component.throughput and "update" in timings:
+                    unit, items = component.throughput
+                    rate = items * count / (timings["update"] / 1e6)
+                    print(f"{'':<44} {rate:12,.0f} {unit}/sec")
+    return results
+
+def compare(results, baseline, threshold, min_delta):
+    """Return (key, baseline, current, percent) for every regression past threshold"""
+    regressions = []
+    for key, current in sorted(results.items()):
+        previous = baseline.get(key)
+        if previous is None or previous <= 0:
+            continue
+        percent = (current - previous) / previous * 100
+        # Ignore sub-microsecond jitter on very cheap operations
+        if percent > threshold and current - previous > min_delta:
+            regressions.append((key, previous, current, percent))
+    return regressions
+
+def parse_size(text):
+    width, height = text.lower().split("x")
+    return int(width), int(height)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark scene components headlessly")
+    parser.add_argument("--components", nargs="+", choices=[c.name for c in COMPONENTS],
+                        help="components to benchmark (default: all)")
+    parser.add_argument("--sizes", nargs="+", type=parse_size,
+                        help="screen sizes as WIDTHxHEIGHT (default: 800x600 1200x800 1920x1080)")
+    parser.add_argument("--counts", nargs="+", type=int, help="entity counts (default: 1 10 50)")
+    parser.add_argument("--iterations", type=int, default=2000, help="timed iterations per measurement")
+    parser.add_argument("--warmup", type=int, default=100, help="untimed iterations before measuring")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="baseline JSON file")
+    parser.add_argument("--save-baseline", action="store_true", help="write results as the new baseline")
+    parser.add_argument("--threshold", type=float, default=20.0, help="allowed slowdown in percent")
+    parser.add_argument("--min-delta", type=float, default=1.0,
+                        help="ignore slowdowns smaller than this many microseconds")
+    args = parser.parse_args(argv)
+
+    components = [c for c in COMPONENTS if not args.components or c.name in args.components]
+    sizes = args.sizes or DEFAULT_SIZES
+    counts = args.counts or DEFAULT_COUNTS
+
+    # Display-format surfaces need a video mode, even on the dummy driver
+    pygame.init()
+    pygame.display.set_mode((max(w for w, h in sizes), max(h for w, h in sizes)))
+
+
+    results = run_benchmarks(components, sizes, counts, args.iterations, args.warmup)
+
+    if args.save_baseline:
+        with open(args.baseline, "w") as baseline_file:
+            json.dump(results, baseline_file, indent=2, sort_keys=True)
+        print(f"Saved baseline to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; run with --save-baseline first")
+        return 0
+
+    with open(args.baseline) as baseline_file:
+        baseline = json.load(baseline_file)
+
+    regressions = compare(results, baseline, args.threshold, args.min_delta)
+    for key, previous, current, percent in regressions:
+        print(f"REGRESSION {key}: {previous:.2f} us -> {current:.2f} us (+{percent:.1f}%)")
+    if regressions:
+        print(f"{len(regressions)} measurement(s) regressed past {args.threshold:.0f}%")
+        return 1
+
+    print(f"No regressions past {args.threshold:.0f}%")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,5 +1,5 @@
 import pygame
-import math
+from geometry import spoke_points
 
 class Car:
     def __init__(self, x, y):
@@ -11,6 +11,11 @@ class Car:
         self.speed = 2  # pixels per frame
         self.max_distance = 800  # maximum distance to travel
         
+        # Satellite positioning fix; when set the car is shown where the
+        # receiver believes it is rather than at x
+        self.fix_x = None
+        self.fix_report = None  # Accuracy line for the info panel
+        
         # Realistic car colors
         self.car_red = (139, 0, 0)           # Dark red for body
         self.car_highlight = (220, 20, 60)   # Bright red highlights
@@ -25,6 +30,11 @@ class Car:
         self.grille_dark = (64, 64, 64)      # Dark grille
         self.chrome_silver = (220, 220, 220) # Chrome details
         
+        # Static artwork, rendered once and rebuilt when size or colors change
+        self.sprite = None
+        self.sprite_key = None
+        self.sprite_origin = (0, 0)
+        
     def update(self):
         """Update car (position now controlled externally by slider)"""
         # Car position is now controlled by the slider in main.py
@@ -32,17 +42,52 @@ class Car:
         pass
     
     def draw(self, screen):
-        """Draw the realistic car with detailed features"""
+        """Draw the car from its pre-rendered sprite"""
+        sprite = self.get_sprite()
+        origin_x, origin_y = self.sprite_origin
+        screen.blit(sprite, (int(self.get_display_x()) - origin_x, int(self.y) - origin_y))
+    
+    def get_display_x(self):
+        """Return the x the car is shown at: its positioning fix if it has one"""
+        return self.x if self.fix_x is None else self.fix_x
+    
+    def get_sprite_key(self):
+        """Return everything the baked artwork depends on"""
+        return (self.width, self.height, self.car_red, self.car_highlight, self.car_shadow,
+                self.tire_black, self.rim_silver, self.rim_detail, self.glass_blue,
+                self.glass_reflect, self.headlight_cream, self.headlight_bright,
+                self.grille_dark, self.chrome_silver)
+    
+    def get_sprite(self):
+        """Return the car artwork, rendering it again only if size or palette changed"""
+        key = self.get_sprite_key()
+        if key != self.sprite_key:
+            self.sprite = self.create_sprite()
+            self.sprite_key = key
+        return self.sprite
+    
+    def create_sprite(self):
+        """Render the car once into a sprite the size of get_rect()"""
+        # Car center within the sprite, matching the offsets in get_rect()
+        self.sprite_origin = (self.width//2 + 5, self.height//2 + 7)
+        sprite = pygame.Surface((self.width + 10, self.height + 20), pygame.SRCALPHA)
+        self.draw_artwork(sprite, *self.sprite_origin)
+        if pygame.display.get_surface() is not None:
+            sprite = sprite.convert_alpha()
+        return sprite
+    
+    def draw_artwork(self, screen, x, y):
+        """Draw the realistic car with detailed features, centered on (x, y)"""
         # Draw car shadow for depth
         shadow_offset = 3
         pygame.draw.ellipse(screen, (50, 50, 50), 
-                           (self.x - self.width//2 + shadow_offset, 
-                            self.y + self.height//2 + 2, 
+                           (x - self.width//2 + shadow_offset, 
+                            y + self.height//2 + 2, 
                             self.width, 8))
         
         # Draw car body with 3D effect
         # Main body
-        car_rect = pygame.Rect(self.x - self.width//2, self.y - self.height//2, 
+        car_rect = pygame.Rect(x - self.width//2, y - self.height//2, 
                               self.width, self.height)
         pygame.draw.rect(screen, self.car_shadow, 
                         (car_rect.x + 2, car_rect.y + 2, car_rect.width, car_rect.height))
@@ -53,10 +98,10 @@ class Car:
                         (car_rect.x + 2, car_rect.y + 2, car_rect.width - 4, 3))
         
         # Draw detailed windshield and windows
-        self.draw_windows(screen)
+        self.draw_windows(screen, x, y)
         
         # Draw front grille
-        grille_rect = pygame.Rect(self.x + self.width//2 - 5, self.y - 6, 5, 12)
+        grille_rect = pygame.Rect(x + self.width//2 - 5, y - 6, 5, 12)
         pygame.draw.rect(screen, self.grille_dark, grille_rect)
         # Grille lines
         for i in range(3):
@@ -65,31 +110,31 @@ class Car:
                            (grille_rect.x, y_pos), (grille_rect.x + 4, y_pos), 1)
         
         # Draw enhanced wheels with detailed rims
-        self.draw_wheels(screen)
+        self.draw_wheels(screen, x, y)
         
         # Draw detailed headlights
-        self.draw_headlights(screen)
+        self.draw_headlights(screen, x, y)
         
         # Draw side mirrors
         mirror_size = 3
         pygame.draw.circle(screen, self.chrome_silver, 
-                          (int(self.x - self.width//4), int(self.y - self.height//2 - 2)), mirror_size)
+                          (int(x - self.width//4), int(y - self.height//2 - 2)), mirror_size)
         pygame.draw.circle(screen, self.glass_blue, 
-                          (int(self.x - self.width//4), int(self.y - self.height//2 - 2)), mirror_size - 1)
+                          (int(x - self.width//4), int(y - self.height//2 - 2)), mirror_size - 1)
         
         # Draw door handles
         pygame.draw.circle(screen, self.chrome_silver, 
-                          (int(self.x - 5), int(self.y + 2)), 2)
+                          (int(x - 5), int(y + 2)), 2)
         pygame.draw.circle(screen, self.chrome_silver, 
-                          (int(self.x + 5), int(self.y + 2)), 2)
+                          (int(x + 5), int(y + 2)), 2)
         
         # Draw car outline
         pygame.draw.rect(screen, self.tire_black, car_rect, 2)
     
-    def draw_windows(self, screen):
+    def draw_windows(self, screen, x, y):
         """Draw detailed car windows with reflections"""
         # Front windshield
-        windshield = pygame.Rect(self.x + self.width//4, self.y - self.height//2 + 3, 
+        windshield = pygame.Rect(x + self.width//4, y - self.height//2 + 3, 
                                 self.width//3, self.height//2 - 2)
         pygame.draw.rect(screen, self.glass_blue, windshield)
         # Windshield reflection
@@ -98,7 +143,7 @@ class Car:
         pygame.draw.rect(screen, self.tire_black, windshield, 1)
         
         # Side windows
-        side_window = pygame.Rect(self.x - self.width//6, self.y - self.height//2 + 3, 
+        side_window = pygame.Rect(x - self.width//6, y - self.height//2 + 3, 
                                  self.width//3, self.height//2 - 2)
         pygame.draw.rect(screen, self.glass_blue, side_window)
         pygame.draw.rect(screen, self.glass_reflect, 
@@ -106,84 +151,84 @@ class Car:
         pygame.draw.rect(screen, self.tire_black, side_window, 1)
         
         # Rear window
-        rear_window = pygame.Rect(self.x - self.width//2 + 3, self.y - self.height//2 + 3, 
+        rear_window = pygame.Rect(x - self.width//2 + 3, y - self.height//2 + 3, 
                                  self.width//4, self.height//2 - 2)
         pygame.draw.rect(screen, self.glass_blue, rear_window)
         pygame.draw.rect(screen, self.tire_black, rear_window, 1)
     
-    def draw_wheels(self, screen):
+    def draw_wheels(self, screen, x, y):
         """Draw detailed wheels with realistic rims and tires"""
         wheel_radius = 8
-        wheel_y = self.y + self.height//2 - 3
+        wheel_y = y + self.height//2 - 3
         
         # Left wheel
-        left_wheel_x = int(self.x - self.width//3)
+        left_wheel_x = int(x - self.width//3)
         left_wheel_y = int(wheel_y)
         
         # Tire
         pygame.draw.circle(screen, self.tire_black, (left_wheel_x, left_wheel_y), wheel_radius)
         # Rim
         pygame.draw.circle(screen, self.rim_silver, (left_wheel_x, left_wheel_y), wheel_radius - 2)
-        # Rim spokes
-        for i in range(5):
-            angle = i * 72  # 360/5 = 72 degrees
-            spoke_x = left_wheel_x + int(4 * math.cos(math.radians(angle)))
-            spoke_y = left_wheel_y + int(4 * math.sin(math.radians(angle)))
+        # Rim spokes, 72 degrees apart
+        for spoke_end in spoke_points((left_wheel_x, left_wheel_y), 4, 5):
             pygame.draw.line(screen, self.rim_detail, 
-                           (left_wheel_x, left_wheel_y), (spoke_x, spoke_y), 2)
+                           (left_wheel_x, left_wheel_y), spoke_end, 2)
         # Center cap
         pygame.draw.circle(screen, self.rim_detail, (left_wheel_x, left_wheel_y), 2)
         
         # Right wheel
-        right_wheel_x = int(self.x + self.width//3)
+        right_wheel_x = int(x + self.width//3)
         right_wheel_y = int(wheel_y)
         
         # Tire
         pygame.draw.circle(screen, self.tire_black, (right_wheel_x, right_wheel_y), wheel_radius)
         # Rim
         pygame.draw.circle(screen, self.rim_silver, (right_wheel_x, right_wheel_y), wheel_radius - 2)
-        # Rim spokes
-        for i in range(5):
-            angle = i * 72
-            spoke_x = right_wheel_x + int(4 * math.cos(math.radians(angle)))
-            spoke_y = right_wheel_y + int(4 * math.sin(math.radians(angle)))
+        # Rim spokes, 72 degrees apart
+        for spoke_end in spoke_points((right_wheel_x, right_wheel_y), 4, 5):
             pygame.draw.line(screen, self.rim_detail, 
-                           (right_wheel_x, right_wheel_y), (spoke_x, spoke_y), 2)
+                           (right_wheel_x, right_wheel_y), spoke_end, 2)
         # Center cap
         pygame.draw.circle(screen, self.rim_detail, (right_wheel_x, right_wheel_y), 2)
     
-    def draw_headlights(self, screen):
+    def draw_headlights(self, screen, x, y):
         """Draw detailed headlights with realistic lighting effects"""
-        headlight_x = self.x + self.width//2 - 2
+        headlight_x = x + self.width//2 - 2
         
         # Upper headlight
-        upper_light = (int(headlight_x), int(self.y - 5))
+        upper_light = (int(headlight_x), int(y - 5))
         pygame.draw.circle(screen, self.headlight_cream, upper_light, 4)
         pygame.draw.circle(screen, self.headlight_bright, upper_light, 2)
         pygame.draw.circle(screen, self.chrome_silver, upper_light, 4, 1)
         
         # Lower headlight
-        lower_light = (int(headlight_x), int(self.y + 5))
+        lower_light = (int(headlight_x), int(y + 5))
         pygame.draw.circle(screen, self.headlight_cream, lower_light, 4)
         pygame.draw.circle(screen, self.headlight_bright, lower_light, 2)
         pygame.draw.circle(screen, self.chrome_silver, lower_light, 4, 1)
         
         # Tail lights
-        tail_x = self.x - self.width//2 + 2
-        pygame.draw.circle(screen, (139, 0, 0), (int(tail_x), int(self.y - 3)), 3)
-        pygame.draw.circle(screen, (255, 0, 0), (int(tail_x), int(self.y - 3)), 1)
-        pygame.draw.circle(screen, (139, 0, 0), (int(tail_x), int(self.y + 3)), 3)
-        pygame.draw.circle(screen, (255, 0, 0), (int(tail_x), int(self.y + 3)), 1)
+        tail_x = x - self.width//2 + 2
+        pygame.draw.circle(screen, (139, 0, 0), (int(tail_x), int(y - 3)), 3)
+        pygame.draw.circle(screen, (255, 0, 0), (int(tail_x), int(y - 3)), 1)
+        pygame.draw.circle(screen, (139, 0, 0), (int(tail_x), int(y + 3)), 3)
+        pygame.draw.circle(screen, (255, 0, 0), (int(tail_x), int(y + 3)), 1)
+    
+    def get_rect(self):
+        """Return the screen area covered by the car, shadow and mirrors included"""
+        return pygame.Rect(int(self.get_display_x()) - self.width//2 - 5, int(self.y) - self.height//2 - 7,
+                           self.width + 10, self.height + 20)
     
     def is_clicked(self, pos):
         """Check if car was clicked"""
         mouse_x, mouse_y = pos
-        return (self.x - self.width//2 <= mouse_x <= self.x + self.width//2 and
+        x = self.get_display_x()
+        return (x - self.width//2 <= mouse_x <= x + self.width//2 and
                 self.y - self.height//2 <= mouse_y <= self.y + self.height//2)
     
     def get_info(self):
         """Return information about the car"""
-        return """SMART CAR
+        info = """SMART CAR
         
 GPS-enabled vehicle with satellite
 communication capabilities.
@@ -199,3 +244,7 @@ communication capabilities.
 Modern cars use satellite navigation
 for real-time traffic updates, route
 optimization, and emergency services."""
+        if self.fix_report:
+            info = info.replace("• GPS System: Multi-satellite receiver",
+                                f"• GPS System: Multi-satellite receiver\n• GPS Fix: {self.fix_report}", 1)
+        return info
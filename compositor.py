@@ -0,0 +1,80 @@
+class DirtyRectCompositor:
+    """Redraw only the screen regions that changed since the last frame.
+
+    Each frame the game hands over its sprites back-to-front as
+    (key, rects, state, draw) tuples. A sprite is dirty when its rects or
+    state differ from the previous frame. Dirty regions (old and new) are
+    restored from the cached background, every sprite touching them is
+    redrawn, and the list of regions to push to the display is returned.
+    """
+
+    def __init__(self):
+        self.background = None
+        self.previous = {}  # key -> (rects, state) from the last frame
+        self.full_redraw = True
+
+    def invalidate(self):
+        """Force the next frame to redraw the whole screen"""
+        self.full_redraw = True
+
+    def render(self, screen, background, sprites):
+        """Composite one frame and return the list of rects that changed"""
+        screen_rect = screen.get_rect()
+
+        # A new background means nothing on screen can be trusted
+        if background is not self.background:
+            self.background = background
+            self.full_redraw = True
+
+        current = {}
+        for key, rects, state, draw in sprites:
+            current[key] = ([screen_rect.clip(rect) for rect in rects], state)
+
+        if self.full_redraw:
+            screen.blit(background, (0, 0))
+            for key, rects, state, draw in sprites:
+                draw(screen)
+            self.previous = current
+            self.full_redraw = False
+            return [screen_rect]
+
+        # Collect regions whose content changed, including vacated ones
+        dirty = []
+        for key, (rects, state) in current.items():
+            previous = self.previous.get(key)
+            if previous is None:
+                dirty.extend(rects)
+            elif previous != (rects, state):
+                dirty.extend(rects)
+                dirty.extend(previous[0])
+        for key, (rects, state) in self.previous.items():
+            if key not in current:
+                dirty.extend(rects)
+        dirty = [rect for rect in dirty if rect.width > 0 and rect.height > 0]
+
+        if not dirty:
+            self.previous = current
+            return []
+
+        # Anything overlapping a dirty region must be redrawn in full, which
+        # in turn dirties its whole area; repeat until nothing new is pulled in
+        redraw = set()
+        changed = True
+        while changed:
+            changed = False
+            for key, (rects, state) in current.items():
+                if key in redraw:
+                    continue
+                if any(rect.collidelist(dirty) != -1 for rect in rects):
+                    redraw.add(key)
+                    dirty.extend(rects)
+                    changed = True
+
+        for rect in dirty:
+            screen.blit(background, rect, rect)
+        for key, rects, state, draw in sprites:
+            if key in redraw:
+                draw(screen)
+
+        self.previous = current
+        return dirty
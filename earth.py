@@ -1,9 +1,85 @@
 import pygame
 import math
 import os
+import numpy as np
+from geometry import cos_sin
+from asset_pack import AssetPack, build_pack, pack_key, write_pack
+
+class EarthSpriteCache:
+    """Rotated Earth frames quantized to a fixed number of angular steps.
+    
+    Each frame is the rotated texture composited with the static shadow,
+    outline and rim light, stored premultiplied so it can be drawn with a
+    single BLEND_PREMULTIPLIED blit. Frames are rendered lazily on first use,
+    or taken straight from an asset pack compiled with the rotation frames.
+    """
+    
+    def __init__(self, texture, radius, shadow, rim_light, steps=720, max_bytes=128 * 1024 * 1024,
+                 pack=None):
+        self.texture = texture
+        self.radius = radius
+        
+        # Frames must hold the shadow, which is offset by 3px and padded by 5px
+        self.shadow_offset = 3
+        self.center = radius + 5 + self.shadow_offset
+        self.frame_size = self.center * 2
+        
+        # Premultiply the overlays once; they never change
+        self.shadow = shadow.premul_alpha()
+        self.rim_light = rim_light.premul_alpha()
+        
+        # Respect the memory cap by coarsening the angular step if needed
+        frame_bytes = self.frame_size * self.frame_size * 4
+        self.steps = max(1, min(steps, max_bytes // frame_bytes))
+        if self.steps < steps:
+            print(f"Earth sprite cache limited to {self.steps} rotation steps by memory cap")
+        
+        self.frames = {}
+        
+        # Pre-rendered frames are only usable if they have the same steps
+        self.pack = None
+        if pack is not None and 'rotation' in pack and pack.frame_count('rotation') == self.steps:
+            self.pack = pack
+        
+    def get_frame(self, angle):
+        """Return the composited frame nearest to the given angle in degrees"""
+        step = int(round(angle * self.steps / 360.0)) % self.steps
+        frame = self.frames.get(step)
+        if frame is None:
+            if self.pack is not None:
+                frame = self.pack.frame('rotation', step)
+            else:
+                frame = self.build_frame(step * 360.0 / self.steps)
+            self.frames[step] = frame
+        return frame
+    
+    def build_frame(self, angle):
+        """Composite one rotated Earth frame with its static overlays"""
+        frame = pygame.Surface((self.frame_size, self.frame_size), pygame.SRCALPHA)
+        center = (self.center, self.center)
+        
+        # Shadow sits slightly offset behind the planet
+        shadow_rect = self.shadow.get_rect()
+        shadow_rect.center = (self.center + self.shadow_offset, self.center + self.shadow_offset)
+        frame.blit(self.shadow, shadow_rect, special_flags=pygame.BLEND_PREMULTIPLIED)
+        
+        # Rotated Earth image
+        rotated = pygame.transform.rotate(self.texture, angle).premul_alpha()
+        rotated_rect = rotated.get_rect()
+        rotated_rect.center = center
+        frame.blit(rotated, rotated_rect, special_flags=pygame.BLEND_PREMULTIPLIED)
+        
+        # Circular border to ensure perfect circle appearance
+        pygame.draw.circle(frame, (0, 0, 0), center, self.radius, 2)
+        
+        # Rim light on top
+        rim_rect = self.rim_light.get_rect()
+        rim_rect.center = center
+        frame.blit(self.rim_light, rim_rect, special_flags=pygame.BLEND_PREMULTIPLIED)
+        return frame
 
 class Earth:
-    def __init__(self, x, y):
+    def __init__(self, x, y, load_image=True):
         self.x = x
         self.y = y
         self.radius = 80
@@ -11,39 +87,121 @@ class Earth:
         self.rotation_speed = 0.5  # Slower, more realistic rotation
         self.visible = True  # Earth visibility flag
         
-        # Load Earth image
-        self.load_earth_image()
+        # Rotation sprite cache settings
+        self.rotation_steps = 720  # 0.5 degree steps, matching rotation_speed
+        self.sprite_cache_bytes = 128 * 1024 * 1024
+        
+        # Load Earth image, or start from the plain fallback globe and let
+        # an asset loader call set_assets() once the image is ready
+        self.pack = None          # Asset pack the texture and any rotation frames come from
+        self.texture_version = 0  # Bumped whenever the drawn texture changes
+        if load_image:
+            self.load_earth_image()
+        else:
+            self.create_fallback_earth()
         
-        # Create rotated surface for smooth rotation
-        self.rotated_earth = None
+        # Pre-composited rotation frames
+        self.create_sprite_cache()
         
     def load_earth_image(self):
         """Load and prepare the Earth image"""
+        pack = self.load_assets()
+        if pack is None:
+            # Fallback to creating a simple circle if image fails to load
+            self.create_fallback_earth()
+        else:
+            self.pack = pack
+            self.original_earth = pack.frame('texture')
+    
+    def load_assets(self):
+        """Return the asset pack holding the processed Earth image, or None if it cannot be loaded
+        
+        Touches neither the display nor the Earth's state, so it can run
+        on a background thread.
+        """
         try:
-            # Get the directory where this script is located
-            script_dir = os.path.dirname(os.path.abspath(__file__))
-            earth_path = os.path.join(script_dir, 'assets', 'earth_hd.jpg')
-            
-            # Load the Earth image
-            self.original_earth = pygame.image.load(earth_path)
+            earth_path = self.get_source_path()
+            key = self.get_pack_key(earth_path)
             
-            # Scale the image to fit our desired radius (diameter = 2 * radius)
-            earth_size = self.radius * 2
-            self.original_earth = pygame.transform.scale(self.original_earth, (earth_size, earth_size))
-            
-            # Convert for better performance
-            self.original_earth = self.original_earth.convert()
-            
-            # Create circular mask for the Earth image
-            self.create_circular_mask()
+            # Map the display-ready pixels from a previous launch if they match
+            cache_path = self.get_cache_path()
+            pack = AssetPack.open(cache_path, key)
+            if pack is not None:
+                print(f"Loaded processed Earth image from cache: {cache_path}")
+                return pack
             
+            texture = self.process_image(earth_path)
             print(f"Successfully loaded Earth image from: {earth_path}")
             
-        except pygame.error as e:
+            # Persist the processed image so later launches skip this work
+            data = build_pack(key, {'texture': [texture]})
+            try:
+                write_pack(cache_path, data)
+                pack = AssetPack.open(cache_path, key)
+            except OSError as e:
+                # A read-only install still works, it just reprocesses each launch
+                print(f"Could not cache processed Earth image: {e}")
+            return pack if pack is not None else AssetPack(data)
+            
+        except (pygame.error, OSError) as e:
             print(f"Could not load Earth image: {e}")
-            # Fallback to creating a simple circle if image fails to load
-            self.original_earth = None
-            self.create_fallback_earth()
+            return None
+    
+    def set_assets(self, pack):
+        """Swap in a pack from load_assets() and rebuild the rotation frames"""
+        if pack is None:
+            return  # Loading failed; keep the fallback globe
+        self.pack = pack
+        self.original_earth = pack.frame('texture')
+        self.create_sprite_cache()
+        self.texture_version += 1
+    
+    def compile_assets(self, rotation=False):
+        """Write the asset pack ahead of time, optionally with every rotation frame
+        
+        Returns the pack's path, or None if it could not be built.
+        """
+        try:
+            earth_path = self.get_source_path()
+            texture = self.process_image(earth_path)
+            entries = {'texture': [texture]}
+            if rotation:
+                frames = EarthSpriteCache(texture, self.radius, self.create_earth_shadow(),
+                                          self.create_earth_rim_light(), steps=self.rotation_steps,
+                                          max_bytes=self.sprite_cache_bytes)
+                entries['rotation'] = [frames.build_frame(step * 360.0 / frames.steps)
+                                       for step in range(frames.steps)]
+            cache_path = self.get_cache_path()
+            write_pack(cache_path, build_pack(self.get_pack_key(earth_path), entries))
+            return cache_path
+        except (pygame.error, OSError) as e:
+            print(f"Could not compile Earth assets: {e}")
+            return None
+    
+    def process_image(self, earth_path):
+        """Load the Earth image, scale it to the globe's size and make it round"""
+        texture = pygame.image.load(earth_path)
+        
+        # Scale the image to fit our desired radius (diameter = 2 * radius)
+        earth_size = self.radius * 2
+        texture = pygame.transform.scale(texture, (earth_size, earth_size))
+        
+        # Create circular mask for the Earth image
+        return self.create_circular_mask(texture)
+    
+    def get_source_path(self):
+        """Return the path of the Earth image next to this script"""
+        script_dir = os.path.dirname(os.path.abspath(__file__))
+        return os.path.join(script_dir, 'assets', 'earth_hd.jpg')
+    
+    def get_pack_key(self, earth_path):
+        """Return the key that ties a pack to the source image and everything drawn from it"""
+        return pack_key(earth_path, self.radius, self.rotation_steps)
+    
+    def get_cache_path(self):
+        """Return the asset pack path for this Earth's radius"""
+        cache_dir = os.path.join(os.path.dirname(self.get_source_path()), 'cache')
+        return os.path.join(cache_dir, f"earth_r{self.radius}.pack")
             
     def create_fallback_earth(self):
         """Create a simple fallback Earth if image loading fails"""
@@ -52,33 +210,29 @@ class Earth:
         # Draw a simple blue circle as fallback
         pygame.draw.circle(self.original_earth, (0, 100, 200), (self.radius, self.radius), self.radius)
         
-    def create_circular_mask(self):
-        """Create a circular mask to make Earth appear round"""
+    def create_circular_mask(self, texture):
+        """Return a copy of the texture made round by a circular mask"""
         earth_size = self.radius * 2
         
-        # Convert image for better performance
-        self.original_earth = self.original_earth.convert_alpha()
-        
-        # Create the final circular Earth surface
+        # Work on a per-pixel alpha copy of the image; blitting into a new
+        # surface needs no display, unlike convert_alpha()
         circular_earth = pygame.Surface((earth_size, earth_size), pygame.SRCALPHA)
-        circular_earth.fill((0, 0, 0, 0))  # Transparent background
-        
-        # Use pygame.mask for better performance
-        center_x, center_y = self.radius, self.radius
-        radius_squared = self.radius * self.radius
-        
-        # Copy pixels within the circle from original earth
-        for x in range(earth_size):
-            for y in range(earth_size):
-                # Use squared distance to avoid sqrt calculation
-                distance_squared = (x - center_x) ** 2 + (y - center_y) ** 2
-                if distance_squared <= radius_squared:
-                    # Copy pixel from original earth
-                    pixel = self.original_earth.get_at((x, y))
-                    circular_earth.set_at((x, y), pixel)
-        
-        self.original_earth = circular_earth
+        circular_earth.blit(texture, (0, 0))
+        
+        # Pixels whose squared distance from the center exceeds radius^2 are cleared
+        offsets = np.arange(earth_size) - self.radius
+        outside = offsets[:, np.newaxis] ** 2 + offsets[np.newaxis, :] ** 2 > self.radius * self.radius
+        
+        # surfarray views are indexed [x, y] and write straight into the surface
+        pixels = pygame.surfarray.pixels3d(circular_earth)
+        pixels[outside] = 0
+        del pixels
+        alpha = pygame.surfarray.pixels_alpha(circular_earth)
+        alpha[outside] = 0
+        del alpha
+        
         print("Created circular Earth mask successfully")
+        return circular_earth
         
     def update(self):
         """Update Earth rotation"""
@@ -92,24 +246,11 @@ class Earth:
             return
             
         if self.original_earth:
-            # Create rotated version of the Earth image
-            self.rotated_earth = pygame.transform.rotate(self.original_earth, self.angle)
-            
-            # Get the rect of the rotated image to center it properly
-            rotated_rect = self.rotated_earth.get_rect()
-            rotated_rect.center = (int(self.x), int(self.y))
-            
-            # Add a subtle shadow/glow effect for 3D appearance
-            self.draw_earth_shadow(screen)
-            
-            # Draw the rotated Earth image
-            screen.blit(self.rotated_earth, rotated_rect)
-            
-            # Draw a circular border to ensure perfect circle appearance
-            pygame.draw.circle(screen, (0, 0, 0), (int(self.x), int(self.y)), self.radius, 2)
-            
-            # Add a subtle rim light effect
-            self.draw_earth_rim_light(screen)
+            # Shadow, rotated image, outline and rim light come pre-composited
+            frame = self.sprite_cache.get_frame(self.angle)
+            frame_rect = frame.get_rect()
+            frame_rect.center = (int(self.x), int(self.y))
+            screen.blit(frame, frame_rect, special_flags=pygame.BLEND_PREMULTIPLIED)
         else:
             # Fallback to vector graphics if image failed to load
             self.draw_vector_earth(screen)
@@ -121,8 +262,9 @@ class Earth:
         
         # Draw simple continents
         continent_offset = math.radians(self.angle)
-        cont1_x = self.x + math.cos(continent_offset) * 30
-        cont1_y = self.y + math.sin(continent_offset) * 20
+        cos_a, sin_a = cos_sin(self.angle)
+        cont1_x = self.x + cos_a * 30
+        cont1_y = self.y + sin_a * 20
         if self.is_visible(continent_offset):
             pygame.draw.ellipse(screen, (34, 139, 34), 
                               (cont1_x - 15, cont1_y - 25, 30, 50))
@@ -130,23 +272,18 @@ class Earth:
         # Draw Earth outline
         pygame.draw.circle(screen, (0, 0, 0), (int(self.x), int(self.y)), self.radius, 2)
     
-    def draw_earth_shadow(self, screen):
-        """Draw a subtle shadow behind Earth for 3D effect"""
-        shadow_offset = 3
+    def create_earth_shadow(self):
+        """Create the subtle shadow drawn behind Earth for 3D effect"""
         shadow_alpha = 80
         
         # Create shadow surface
         shadow_surface = pygame.Surface((self.radius * 2 + 10, self.radius * 2 + 10), pygame.SRCALPHA)
         pygame.draw.circle(shadow_surface, (0, 0, 0, shadow_alpha), 
                           (self.radius + 5, self.radius + 5), self.radius + 2)
-        
-        # Draw shadow slightly offset
-        shadow_rect = shadow_surface.get_rect()
-        shadow_rect.center = (int(self.x + shadow_offset), int(self.y + shadow_offset))
-        screen.blit(shadow_surface, shadow_rect)
+        return shadow_surface
     
-    def draw_earth_rim_light(self, screen):
-        """Draw a subtle rim light effect for 3D appearance"""
+    def create_earth_rim_light(self):
+        """Create the subtle rim light drawn over Earth for 3D appearance"""
         # Create rim light surface
         rim_surface = pygame.Surface((self.radius * 2 + 6, self.radius * 2 + 6), pygame.SRCALPHA)
         
@@ -155,11 +292,16 @@ class Earth:
                           (self.radius + 3, self.radius + 3), self.radius + 3)
         pygame.draw.circle(rim_surface, (255, 255, 255, 20), 
                           (self.radius + 3, self.radius + 3), self.radius + 1)
-        
-        # Draw rim light
-        rim_rect = rim_surface.get_rect()
-        rim_rect.center = (int(self.x), int(self.y))
-        screen.blit(rim_surface, rim_rect)
+        return rim_surface
+    
+    def create_sprite_cache(self):
+        """(Re)create the rotation sprite cache for the current Earth texture"""
+        self.sprite_cache = EarthSpriteCache(self.original_earth, self.radius,
+                                             self.create_earth_shadow(),
+                                             self.create_earth_rim_light(),
+                                             steps=self.rotation_steps,
+                                             max_bytes=self.sprite_cache_bytes,
+                                             pack=self.pack)
     
     def is_visible(self, angle):
         """Check if continent is on the visible side of Earth (for fallback)"""
@@ -167,6 +309,13 @@ class Earth:
         normalized_angle = angle % (2 * math.pi)
         return normalized_angle < math.pi
     
+    def get_rect(self):
+        """Return the screen area covered by Earth, shadow and rim light included"""
+        frame_size = self.sprite_cache.frame_size
+        rect = pygame.Rect(0, 0, frame_size, frame_size)
+        rect.center = (int(self.x), int(self.y))
+        return rect
+    
     def is_clicked(self, pos):
         """Check if Earth was clicked"""
         mouse_x, mouse_y = pos
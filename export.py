@@ -0,0 +1,124 @@
+"""Export a long animation as frames across a pool of worker processes.
+
+Usage:
+    python export.py --frames 6000 --output frames/
+    python export.py --frames 6000 --script lesson.json --workers 8 --format raw
+
+The frame range is cut into contiguous chunks, one per worker. Each worker
+runs its own headless Game and seeks to the start of its chunk by
+simulating the frames before it without drawing them; because headless
+stepping is deterministic, it arrives in exactly the state a single
+process would have. Later chunks have more frames to seek through, so
+they are made shorter to let every worker finish at about the same time;
+--seek-cost says how expensive seeking a frame is next to rendering and
+writing one (0.1 is typical with a fleet and a constellation, raw frames
+make writing cheaper and the ratio higher). Frames are encoded and written in the workers and
+named by their global index, so the output is the same ordered sequence
+headless.py writes.
+"""
+import os
+import sys
+import time
+import argparse
+import multiprocessing
+
+# The dummy drivers must be selected before pygame initializes
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+from main import Game
+from headless import HeadlessRenderer, InputScript, FRAME_FORMATS
+from orbits import CONSTELLATIONS
+
+def split_frames(start, count, chunks, seek_cost=0.0):
+    """Return (first frame, frame count) chunks covering the range at equal cost
+
+    A chunk's cost is seek_cost per frame before it (seeking always starts
+    from frame 0) plus one per frame in it. Equal costs make chunk lengths
+    shrink geometrically; with seek_cost 0 the chunks are equal in length.
+    """
+    chunks = max(1, min(chunks, count))
+    end = start + count
+    seek_cost = min(max(seek_cost, 0.0), 0.99)
+    if seek_cost > 0:
+        # Chunk i starts at f_i with f_i+1 = f_i + cost - seek_cost * f_i
+        keep = (1 - seek_cost) ** chunks
+        limit = (start * (1 - keep) + count) / (1 - keep)  # cost / seek_cost
+        bounds = [limit + (start - limit) * (1 - seek_cost) ** index for index in range(chunks)]
+    else:
+        bounds = [start + count * index / chunks for index in range(chunks)]
+
+    # Round to whole frames, giving every chunk at least one
+    firsts = [start]
+    for index in range(1, chunks):
+        firsts.append(min(max(round(bounds[index]), firsts[-1] + 1), end - (chunks - index)))
+    return [(first, following - first) for first, following in zip(firsts, firsts[1:] + [end])]
+
+def export_chunk(job):
+    """Worker: seek a fresh game to the chunk's first frame and write its frames"""
+    first, count, options = job
+    script = InputScript.load(options["script"]) if options["script"] else InputScript.default(options["total"])
+    game = Game(fleet_size=options["fleet"], constellation=options["constellation"], tiles=options["tiles"])
+    game.wait_for_tiles = True
+    renderer = HeadlessRenderer(script, game)
+
+    start_time = time.perf_counter()
+    renderer.seek(first)
+    seek_time = time.perf_counter() - start_time
+    renderer.render_frames(count, options["output"], options["format"])
+
+    if game.tile_map:
+        game.tile_map.close()
+    pygame.quit()
+    return first, count, seek_time, time.perf_counter() - start_time
+
+def export(options, start, count, workers, seek_cost=0.0):
+    """Write frames [start, start + count) with a pool of workers; return frames per second"""
+    os.makedirs(options["output"], exist_ok=True)
+    jobs = [(first, length, options) for first, length in split_frames(start, count, workers, seek_cost)]
+
+    # Spawned workers start from a clean interpreter instead of a forked
+    # copy of this process's SDL state
+    context = multiprocessing.get_context("spawn")
+    start_time = time.perf_counter()
+    with context.Pool(len(jobs)) as pool:
+        for first, length, seek_time, chunk_time in pool.imap_unordered(export_chunk, jobs):
+            print(f"Frames {first}-{first + length - 1} done in {chunk_time:.1f} s "
+                  f"({seek_time:.1f} s seeking)")
+    elapsed = time.perf_counter() - start_time
+    return count / elapsed if elapsed > 0 else float("inf")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export frames in parallel without a display")
+    parser.add_argument("--frames", type=int, default=600, help="number of frames in the animation")
+    parser.add_argument("--start", type=int, default=0, help="first frame to export")
+    parser.add_argument("--count", type=int, help="number of frames to export (default: up to --frames)")
+    parser.add_argument("--output", default="frames", help="directory for the frame files")
+    parser.add_argument("--format", choices=FRAME_FORMATS, default="png", help="frame file format")
+    parser.add_argument("--script", help="JSON input script (defaults to clicking Earth and sweeping the car)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="worker processes")
+    parser.add_argument("--seek-cost", type=float, default=0.1, metavar="RATIO",
+                        help="time to seek one frame relative to rendering and writing one")
+    parser.add_argument("--fleet", type=int, default=0, metavar="N", help="add a traffic fleet of N cars")
+    parser.add_argument("--constellation", choices=sorted(CONSTELLATIONS),
+                        help="fly a satellite constellation across the sky")
+    parser.add_argument("--tiles", metavar="PATH", help="map tile directory or .mbtiles file for the ground")
+    args = parser.parse_args(argv)
+
+    count = args.frames - args.start if args.count is None else args.count
+    options = {
+        "total": args.frames,
+        "script": args.script,
+        "output": args.output,
+        "format": args.format,
+        "fleet": args.fleet,
+        "constellation": args.constellation,
+        "tiles": args.tiles,
+    }
+    fps = export(options, args.start, count, args.workers, args.seek_cost)
+    print(f"Exported {count} frames with {min(args.workers, count)} workers at {fps:.1f} frames/sec")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
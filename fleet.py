@@ -0,0 +1,219 @@
+import pygame
+import numpy as np
+from car import Car
+
+class CarFleet:
+    """Many cars driving along lanes, stored as NumPy struct-of-arrays.
+
+    Each vehicle is one slot in a handful of contiguous arrays (lane
+    position, lane y, speed, palette), so a step moves the whole fleet with
+    a few array operations. Every palette/direction combination is drawn
+    once into a sprite and the fleet is drawn with a single Surface.blits.
+    A full Car object only exists for vehicles someone asked about, e.g.
+    by clicking them. Each step also buckets the vehicles by lane and by
+    car-wide cells along it, so a click only tests the few vehicles in the
+    buckets around it.
+    """
+
+    # Body, highlight and shadow colors; the first matches the single Car
+    PALETTES = [
+        ((139, 0, 0), (220, 20, 60), (100, 0, 0)),       # Red
+        ((0, 51, 153), (65, 105, 225), (0, 30, 100)),    # Blue
+        ((0, 100, 0), (50, 180, 50), (0, 70, 0)),        # Green
+        ((204, 153, 0), (255, 215, 0), (150, 110, 0)),   # Yellow
+        ((128, 128, 128), (200, 200, 200), (90, 90, 90)),  # Silver
+    ]
+    COLORKEY = (255, 0, 255)  # Transparent sprite background
+
+    def __init__(self, count, x_min, x_max, lane_top, lane_bottom,
+                 lane_count=8, scale=0.5, seed=0):
+        self.count = count
+        self.x_min = x_min
+        self.span = x_max - x_min  # Vehicles wrap around after this distance
+        self.scale = scale
+        self.steps = 0
+
+        # Vehicle state, one array element per car
+        rng = np.random.default_rng(seed)
+        lanes = rng.integers(0, lane_count, count)
+        lane_spacing = (lane_bottom - lane_top) / max(1, lane_count - 1)
+        self.position = rng.uniform(0, self.span, count).astype(np.float32)  # Distance from x_min
+        self.y = (lane_top + lanes * lane_spacing).astype(np.float32)
+        self.speed = rng.uniform(0.5, 3.0, count).astype(np.float32)         # Pixels per step
+        self.speed[lanes % 2 == 1] *= -1                                      # Odd lanes drive left
+        self.palette = rng.integers(0, len(self.PALETTES), count).astype(np.uint8)
+
+        # Draw later vehicles on top and keep each lane's cars together
+        order = np.argsort(self.y, kind='stable')
+        self.position = self.position[order]
+        self.y = self.y[order]
+        self.speed = self.speed[order]
+        self.palette = self.palette[order]
+
+        # Clickable half extents of a scaled car
+        template = Car(0, 0)
+        self.half_width = template.width * scale / 2
+        self.half_height = template.height * scale / 2
+
+        # Hit-test buckets: one run of vehicle indices per (lane, cell),
+        # rebuilt every step with a linear-time sort of small integer keys
+        self.lane_ys, self.lane = np.unique(self.y, return_inverse=True)
+        self.cell_size = max(1, int(np.ceil(2 * self.half_width)))
+        self.cell_count = int(self.span // self.cell_size) + 1
+        key_type = np.int16 if len(self.lane_ys) * self.cell_count < 2 ** 15 else np.int32
+        self.lane_keys = self.lane.astype(key_type) * key_type(self.cell_count)  # First bucket of each vehicle's lane
+        self.bucket_order = None   # Vehicle indices sorted by bucket
+        self.bucket_starts = None  # Start of each bucket's run in bucket_order
+        self.index_buckets()
+
+        self.sprites = {}       # (palette, facing_left) -> sprite
+        self.anchor = (0, 0)    # Car center within a sprite
+        self.create_sprites()
+        self.vehicle_sprites = [self.sprites[(palette, speed < 0)]
+                                for palette, speed in zip(self.palette.tolist(), self.speed.tolist())]
+
+        self.cars = {}  # index -> Car, created on demand
+        
+        # Satellite positioning error of each vehicle in pixels; vehicles
+        # are shown at their fix when set, see set_fix_offset()
+        self.fix_offset = None
+        self.fix_reach = 0.0  # Largest offset, which widens hit-test searches
+
+    def create_sprites(self):
+        """Render one scaled car sprite per palette and driving direction"""
+        for index in range(len(self.PALETTES)):
+            car = self.create_car(index)
+            surface = car.get_sprite()
+            width, height = surface.get_size()
+
+            size = (max(1, round(width * self.scale)), max(1, round(height * self.scale)))
+            sprite = pygame.transform.smoothscale(surface, size)
+            self.sprites[(index, False)] = self.create_keyed_sprite(sprite)
+            self.sprites[(index, True)] = self.create_keyed_sprite(pygame.transform.flip(sprite, True, False))
+            self.anchor = (car.sprite_origin[0] * self.scale, car.sprite_origin[1] * self.scale)
+
+    def create_keyed_sprite(self, sprite):
+        """Convert a per-pixel alpha sprite to a hard-edged RLE colorkey sprite"""
+        # RLE colorkey sprites blit several times faster than per-pixel
+        # alpha, which dominates the frame with thousands of cars
+        alpha = pygame.surfarray.pixels_alpha(sprite)
+        alpha[:] = np.where(alpha >= 128, 255, 0)
+        del alpha  # Unlock the surface
+
+        keyed = pygame.Surface(sprite.get_size())
+        if pygame.display.get_surface() is not None:
+            keyed = keyed.convert()
+        keyed.fill(self.COLORKEY)
+        keyed.blit(sprite, (0, 0))
+        keyed.set_colorkey(self.COLORKEY, pygame.RLEACCEL)
+        return keyed
+
+    def create_car(self, palette):
+        """Return a Car painted in one of the fleet palettes"""
+        car = Car(0, 0)
+        car.car_red, car.car_highlight, car.car_shadow = self.PALETTES[palette]
+        return car
+
+    def update(self):
+        """Advance every vehicle one step, wrapping at the end of the lane"""
+        # A new array rather than an in-place update, so snapshots of the
+        # previous step (used for interpolation) stay intact
+        self.position = (self.position + self.speed) % self.span
+        self.steps += 1
+        self.index_buckets()
+
+    def index_buckets(self):
+        """Sort vehicle indices into hit-test buckets by lane and lane position"""
+        # Positions are never negative, so truncating is flooring (and far
+        # cheaper than // on float32)
+        cells = (self.position * (1.0 / self.cell_size)).astype(self.lane_keys.dtype)
+        keys = self.lane_keys + np.minimum(cells, self.cell_count - 1)
+        self.bucket_order = np.argsort(keys, kind='stable')  # A radix sort for 16-bit keys
+        counts = np.bincount(keys, minlength=len(self.lane_ys) * self.cell_count)
+        self.bucket_starts = np.concatenate(([0], np.cumsum(counts)))
+
+    def set_fix_offset(self, fix_offset):
+        """Show vehicles displaced by their positioning errors (pixels), or at their true x with None"""
+        self.fix_offset = fix_offset
+        self.fix_reach = float(np.abs(fix_offset).max()) if fix_offset is not None and len(fix_offset) else 0.0
+
+    def screen_x(self):
+        """Return the screen x of every vehicle"""
+        return self.x_min + self.position
+
+    def display_x(self):
+        """Return the x every vehicle is shown at, including positioning error"""
+        if self.fix_offset is None:
+            return self.screen_x()
+        return self.screen_x() + self.fix_offset
+
+    def draw(self, screen):
+        """Draw the whole fleet with one batched blit"""
+        xs = (self.display_x() - self.anchor[0]).astype(np.int32).tolist()
+        ys = (self.y - self.anchor[1]).astype(np.int32).tolist()
+        screen.blits(zip(self.vehicle_sprites, zip(xs, ys)), False)
+
+    def get_state(self):
+        """Return a value that changes whenever any vehicle moved"""
+        if self.fix_offset is None:
+            return self.position.tobytes()
+        return self.position.tobytes() + self.fix_offset.tobytes()
+
+    def get_rect(self):
+        """Return the screen area all lanes can cover"""
+        width, height = self.sprites[(0, False)].get_size()
+        top = int(self.y.min() - self.anchor[1]) if self.count else 0
+        bottom = int(self.y.max() - self.anchor[1]) + height if self.count else 0
+        return pygame.Rect(int(self.x_min - width), top, int(self.span + 2 * width), bottom - top)
+
+    def hit_test(self, pos):
+        """Return the index of the topmost vehicle under pos, or None"""
+        mouse_x, mouse_y = pos
+        candidates = self.bucket_candidates(mouse_x, mouse_y)
+        if len(candidates) == 0:
+            return None
+        x = self.x_min + self.position[candidates]
+        if self.fix_offset is not None:
+            x = x + self.fix_offset[candidates]
+        hits = candidates[(np.abs(x - mouse_x) <= self.half_width) &
+                          (np.abs(self.y[candidates] - mouse_y) <= self.half_height)]
+        if len(hits) == 0:
+            return None
+        return int(hits.max())  # Later vehicles are drawn on top
+
+    def bucket_candidates(self, mouse_x, mouse_y):
+        """Return the indices of vehicles in the buckets a click could hit"""
+        first_lane = np.searchsorted(self.lane_ys, mouse_y - self.half_height, side='left')
+        last_lane = np.searchsorted(self.lane_ys, mouse_y + self.half_height, side='right')
+        reach = self.half_width + self.fix_reach
+        first_cell = max(0, int((mouse_x - self.x_min - reach) // self.cell_size))
+        last_cell = min(self.cell_count - 1, int((mouse_x - self.x_min + reach) // self.cell_size))
+        if first_cell > last_cell:
+            return np.zeros(0, dtype=np.intp)
+        runs = [self.bucket_order[self.bucket_starts[lane * self.cell_count + first_cell]:
+                                  self.bucket_starts[lane * self.cell_count + last_cell + 1]]
+                for lane in range(first_lane, last_lane)]
+        return np.concatenate(runs) if runs else np.zeros(0, dtype=np.intp)
+
+    def is_clicked(self, pos):
+        """Check if any vehicle was clicked"""
+        return self.hit_test(pos) is not None
+
+    def get_car(self, index):
+        """Return a Car object mirroring one vehicle, creating it on first use"""
+        car = self.cars.get(index)
+        if car is None:
+            car = self.create_car(int(self.palette[index]))
+            self.cars[index] = car
+        car.x = float(self.display_x()[index])
+        car.y = float(self.y[index])
+        return car
+
+    def get_info(self, index):
+        """Return information about one vehicle of the fleet"""
+        speed = abs(float(self.speed[index]))
+        direction = "West" if self.speed[index] < 0 else "East"
+        info = self.get_car(index).get_info()
+        info = info.replace("SMART CAR", f"FLEET CAR {index + 1} OF {self.count}", 1)
+        return info.replace("• Sensors: Lidar, Camera, Radar",
+                            f"• Sensors: Lidar, Camera, Radar\n• Heading: {direction} at {speed:.1f} px/step", 1)
@@ -0,0 +1,67 @@
+import math
+import numpy as np
+
+# Cosine and sine of every tenth of a degree. Rounding drops the last few
+# bits of float noise, so cos(90) is exactly 0 and truncating an offset
+# such as int(2 * cos(60)) lands on the intended pixel.
+ANGLE_STEPS = 3600
+COS_TABLE = np.round(np.cos(np.arange(ANGLE_STEPS) * (2 * math.pi / ANGLE_STEPS)), 12)
+SIN_TABLE = np.round(np.sin(np.arange(ANGLE_STEPS) * (2 * math.pi / ANGLE_STEPS)), 12)
+
+def table_index(degrees):
+    """Return the lookup table index nearest to an angle or array of angles"""
+    return np.rint(np.asarray(degrees) * (ANGLE_STEPS / 360)).astype(np.int64) % ANGLE_STEPS
+
+def cos_sin(degrees):
+    """Return (cos, sin) of an angle or array of angles in degrees, from the tables"""
+    index = table_index(degrees)
+    return COS_TABLE[index], SIN_TABLE[index]
+
+def polar_points(radii, radians):
+    """Return an (N, 2) array of points at the given radii and angles from the origin"""
+    radians = np.asarray(radians, dtype=float)
+    radii = np.broadcast_to(np.asarray(radii, dtype=float), radians.shape)
+    return np.column_stack((radii * np.cos(radians), radii * np.sin(radians)))
+
+def rotate_points(points, degrees, origin=(0, 0)):
+    """Rotate an (N, 2) array of points by an angle, then move them to origin"""
+    cos_a, sin_a = cos_sin(degrees)
+    points = np.asarray(points, dtype=float)
+    rotated = np.empty_like(points)
+    rotated[:, 0] = points[:, 0] * cos_a - points[:, 1] * sin_a + origin[0]
+    rotated[:, 1] = points[:, 0] * sin_a + points[:, 1] * cos_a + origin[1]
+    return rotated
+
+def radial_points(center, radius, count, start=0.0):
+    """Return count evenly spaced integer points around center
+
+    Offsets are truncated toward zero, like center + int(radius * cos(a)).
+    """
+    cos_a, sin_a = cos_sin(start + np.arange(count) * (360 / count))
+    offsets = np.column_stack((np.trunc(radius * cos_a), np.trunc(radius * sin_a))).astype(int)
+    return offsets + np.asarray(center, dtype=int)
+
+def petal_points(center, radius, count):
+    """Return the petal centers of a flower as (x, y) tuples"""
+    return [tuple(point) for point in radial_points(center, radius, count).tolist()]
+
+def spoke_points(center, length, count, start=0.0):
+    """Return the outer ends of a wheel's spokes as (x, y) tuples"""
+    return [tuple(point) for point in radial_points(center, length, count, start).tolist()]
+
+def segment_grid(start, end, direction, steps, offsets):
+    """Return integer points in rows along a segment, spread across it
+
+    Row i sits at fraction i / steps from start to end; each row holds one
+    point per offset, measured perpendicular to direction (a (cos, sin)
+    pair). Returns an (steps * len(offsets), 2) array, row by row.
+    """
+    fractions = np.arange(steps) / steps
+    rows_x = start[0] + (end[0] - start[0]) * fractions
+    rows_y = start[1] + (end[1] - start[1]) * fractions
+    offsets = np.asarray(offsets, dtype=float)
+    perp_x = -direction[1] * offsets
+    perp_y = direction[0] * offsets
+    points_x = np.trunc(rows_x[:, None] + perp_x[None, :])
+    points_y = np.trunc(rows_y[:, None] + perp_y[None, :])
+    return np.column_stack((points_x.ravel(), points_y.ravel())).astype(int)
@@ -0,0 +1,222 @@
+import numpy as np
+from orbits import EARTH_RADIUS
+
+class GnssSolver:
+    """Batched least-squares positioning for many GNSS receivers at once.
+
+    Each step simulates pseudo-ranges from every receiver to its assigned
+    satellites (true range plus the receiver's clock bias and Gaussian
+    noise), then refines every receiver's position and clock estimate
+    with vectorized Gauss-Newton iterations. Estimates carry over between
+    steps and converge live: a new receiver is seeded on the surface under
+    the satellites it tracks, each iteration moves it at most max_step, and
+    an estimate whose residuals blow up is thrown away and seeded again.
+    Only estimates that fit their pseudo-ranges count as fixes. Distances
+    are in km; noise, clock bias and residual limits are given in metres.
+    """
+
+    def __init__(self, noise=5.0, clock_bias=300000.0, iterations_per_step=1, seed=0,
+                 max_step=500.0, fix_residual=50.0, reset_residual=1000000.0):
+        if iterations_per_step < 1:
+            raise ValueError(f"iterations_per_step must be at least 1, got {iterations_per_step}")
+        self.noise = noise / 1000.0             # Pseudo-range noise sigma
+        self.clock_bias = clock_bias / 1000.0   # Largest receiver clock error, as range
+        self.iterations_per_step = iterations_per_step
+        self.max_step = max_step                # Largest change of an estimate per iteration, km
+        self.fix_residual = fix_residual / 1000.0      # RMS residual below which an estimate is a fix
+        self.reset_residual = reset_residual / 1000.0  # RMS residual above which it is reseeded
+        self.random = np.random.default_rng(seed)
+
+        self.biases = np.zeros(0)               # True clock bias of each receiver
+        self.estimates = np.zeros((0, 4))       # Estimated x, y, z and clock bias
+        self.seeded = np.zeros(0, dtype=bool)   # Receivers whose estimate has a starting point
+        self.valid = np.zeros(0, dtype=bool)    # Receivers with a converged fix
+        self.errors = np.zeros(0)               # Distance from estimate to truth
+        self.dop = {}                           # Dilution of precision arrays by name
+
+    def resize(self, count):
+        """Track count receivers; new ones are seeded once they see a satellite"""
+        known = len(self.estimates)
+        if count == known:
+            return
+        if count < known:
+            self.biases = self.biases[:count]
+            self.estimates = self.estimates[:count]
+            self.seeded = self.seeded[:count]
+            return
+        new = count - known
+        self.biases = np.concatenate([self.biases, self.random.uniform(-self.clock_bias, self.clock_bias, new)])
+        self.estimates = np.concatenate([self.estimates, np.zeros((new, 4))])
+        self.seeded = np.concatenate([self.seeded, np.zeros(new, dtype=bool)])
+
+    def measure(self, satellite_positions, receiver_positions, assignments):
+        """Return satellite coordinates (3, K, N) per channel and pseudo-ranges (K, N)
+
+        Channels are the columns of assignments (N, K); pseudo-ranges of
+        unassigned channels (index -1) are NaN.
+        """
+        channels = np.ascontiguousarray(assignments.T)  # Receiver last, like every array here
+        tracked = channels >= 0
+        channels = np.where(tracked, channels, 0)
+        satellites = np.stack([np.ascontiguousarray(axis)[channels] for axis in satellite_positions.T])
+        offsets = satellites - receiver_positions.T[:, None, :]
+        ranges = np.sqrt(offsets[0] ** 2 + offsets[1] ** 2 + offsets[2] ** 2)
+        pseudoranges = ranges + self.biases + self.random.normal(0.0, self.noise, ranges.shape)
+        return satellites, np.where(tracked, pseudoranges, np.nan)
+
+    @staticmethod
+    def seed(satellites, pseudoranges, estimates, receivers):
+        """Start the given receivers on the surface under their tracked satellites
+
+        The clock estimate is the median pseudo-range excess over the range
+        from that point, so the first iteration only has to fix geometry.
+        Receivers tracking no satellite are left alone; return those seeded.
+        """
+        tracked = ~np.isnan(pseudoranges[:, receivers])
+        receivers = receivers[tracked.any(axis=0)]
+        tracked = tracked[:, tracked.any(axis=0)]
+        weights = tracked / tracked.sum(axis=0)
+        center = (satellites[:, :, receivers] * weights).sum(axis=1)
+        surface = EARTH_RADIUS * center / np.linalg.norm(center, axis=0)
+        offsets = satellites[:, :, receivers] - surface[:, None, :]
+        ranges = np.sqrt(offsets[0] ** 2 + offsets[1] ** 2 + offsets[2] ** 2)
+        estimates[receivers, :3] = surface.T
+        estimates[receivers, 3] = np.nanmedian(np.where(tracked, pseudoranges[:, receivers] - ranges, np.nan), axis=0)
+        return receivers
+
+    @staticmethod
+    def residual_rms(satellites, pseudoranges, estimates):
+        """Return each receiver's RMS pseudo-range residual (NaN when it tracks nothing)"""
+        offsets = satellites - estimates.T[:3, None, :]
+        ranges = np.sqrt(offsets[0] ** 2 + offsets[1] ** 2 + offsets[2] ** 2)
+        with np.errstate(invalid='ignore'):
+            return np.sqrt(np.nanmean((pseudoranges - ranges - estimates[:, 3]) ** 2, axis=0))
+
+    @staticmethod
+    def gauss_newton(satellites, pseudoranges, estimates, iterations, max_step=np.inf):
+        """Refine (N, 4) estimates against pseudo-ranges; return estimates, covariance and validity
+
+        Each iteration's step is scaled down to at most max_step, which
+        keeps a far-off start on the well-behaved side of the nonlinearity.
+        Receivers with fewer than four pseudo-ranges, or whose geometry is
+        degenerate, keep their estimate and are marked invalid. Arrays are
+        laid out receiver last, (3, K, N) and (K, N), so every operation
+        and every sum over channels runs along contiguous rows; the 4x4
+        normal equations are solved by a Cholesky factorization unrolled
+        across the batch. The covariance is the unscaled (H^T H)^-1 of the
+        last iteration, stored (4, 4, N), from which DOP is read.
+        """
+        if iterations < 1:
+            raise ValueError(f"Gauss-Newton needs at least one iteration, got {iterations}")
+        tracked = ~np.isnan(pseudoranges)
+        valid = tracked.sum(axis=0) >= 4
+        estimates = estimates.copy()
+        covariance = np.full((4, 4, len(estimates)), np.nan)
+        if not valid.any():
+            return estimates, covariance, valid
+
+        satellites = satellites[:, :, valid]
+        weights = tracked[:, valid].astype(float)
+        measured = np.where(tracked[:, valid], pseudoranges[:, valid], 0.0)
+        solution = np.ascontiguousarray(estimates[valid].T)
+        normal = np.empty((4, 4, len(solution[0])))
+        with np.errstate(invalid='ignore', divide='ignore'):
+            for _ in range(iterations):
+                offsets = satellites - solution[:3, None, :]
+                ranges = np.sqrt(offsets[0] ** 2 + offsets[1] ** 2 + offsets[2] ** 2)
+                residuals = (measured - ranges - solution[3]) * weights
+
+                # Jacobian rows: minus the unit line of sight, then 1 for the clock
+                jacobian = np.empty((4,) + ranges.shape)
+                np.multiply(offsets, -weights / ranges, out=jacobian[:3])
+                jacobian[3] = weights
+
+                # Normal equations H^T H dx = H^T r, one symmetric 4x4 per receiver
+                for i in range(4):
+                    for j in range(i + 1):
+                        normal[i, j] = normal[j, i] = (jacobian[i] * jacobian[j]).sum(axis=0)
+                gradient = (jacobian * residuals).sum(axis=1)
+                factor = cholesky(normal)
+                step = back_substitute(factor, forward_substitute(factor, gradient))
+                length = np.sqrt((step ** 2).sum(axis=0))
+                solution = solution + step * np.minimum(1.0, max_step / length)
+            inverse = lower_inverse(factor)
+
+        # Degenerate geometry leaves NaN behind; those receivers keep their estimate
+        solved = np.isfinite(solution).all(axis=0) & np.isfinite(inverse).all(axis=(0, 1))
+        receivers = np.flatnonzero(valid)
+        covariance[:, :, receivers[solved]] = np.einsum('kin,kjn->ijn', inverse, inverse)[:, :, solved]
+        valid[receivers[~solved]] = False
+        estimates[valid] = solution[:, solved].T
+        return estimates, covariance, valid
+
+    def update(self, satellite_positions, receiver_positions, assignments):
+        """Measure and refine fixes for every receiver; return the (N, 4) estimates"""
+        self.resize(len(receiver_positions))
+        satellites, pseudoranges = self.measure(satellite_positions, receiver_positions, assignments)
+        unseeded = np.flatnonzero(~self.seeded)
+        if len(unseeded):
+            self.seeded[self.seed(satellites, pseudoranges, self.estimates, unseeded)] = True
+        self.estimates, covariance, self.valid = self.gauss_newton(
+            satellites, pseudoranges, self.estimates, self.iterations_per_step, self.max_step)
+
+        # A fix must explain its pseudo-ranges; a diverged estimate starts over
+        rms = self.residual_rms(satellites, pseudoranges, self.estimates)
+        with np.errstate(invalid='ignore'):
+            diverged = ~np.isfinite(self.estimates).all(axis=1) | (rms > self.reset_residual)
+            self.valid &= (rms < self.fix_residual) & ~diverged
+        self.seeded &= ~diverged
+        self.estimates[diverged] = 0.0
+        self.errors = np.linalg.norm(self.estimates[:, :3] - receiver_positions, axis=1)
+        self.dop = self.dilution(covariance, receiver_positions)
+        return self.estimates
+
+    @staticmethod
+    def dilution(covariance, receiver_positions):
+        """Return GDOP, PDOP, HDOP, VDOP and TDOP arrays from fix covariances"""
+        # Local up at each receiver; horizontal is the position block minus up
+        up = (receiver_positions / np.linalg.norm(receiver_positions, axis=1)[:, None]).T
+        position = covariance[:3, :3]
+        position_trace = position[0, 0] + position[1, 1] + position[2, 2]
+        vertical = np.einsum('in,ijn,jn->n', up, position, up)
+        return {
+            'gdop': np.sqrt(position_trace + covariance[3, 3]),
+            'pdop': np.sqrt(position_trace),
+            'hdop': np.sqrt(position_trace - vertical),
+            'vdop': np.sqrt(vertical),
+            'tdop': np.sqrt(covariance[3, 3]),
+        }
+
+def cholesky(matrices):
+    """Return lower Cholesky factors of symmetric matrices stored (n, n, N)"""
+    size = len(matrices)
+    factor = np.zeros_like(matrices)
+    for j in range(size):
+        factor[j, j] = np.sqrt(matrices[j, j] - (factor[j, :j] ** 2).sum(axis=0))
+        for i in range(j + 1, size):
+            factor[i, j] = (matrices[i, j] - (factor[i, :j] * factor[j, :j]).sum(axis=0)) / factor[j, j]
+    return factor
+
+def forward_substitute(factor, vectors):
+    """Solve L y = b for lower-triangular factors (n, n, N) and vectors (n, N)"""
+    result = np.empty_like(vectors)
+    for i in range(len(factor)):
+        result[i] = (vectors[i] - (factor[i, :i] * result[:i]).sum(axis=0)) / factor[i, i]
+    return result
+
+def back_substitute(factor, vectors):
+    """Solve L^T x = y for lower-triangular factors (n, n, N) and vectors (n, N)"""
+    result = np.empty_like(vectors)
+    for i in reversed(range(len(factor))):
+        result[i] = (vectors[i] - (factor[i + 1:, i] * result[i + 1:]).sum(axis=0)) / factor[i, i]
+    return result
+
+def lower_inverse(factor):
+    """Return the inverses of lower-triangular factors stored (n, n, N)"""
+    size = len(factor)
+    inverse = np.zeros_like(factor)
+    for j in range(size):
+        inverse[j, j] = 1 / factor[j, j]
+        for i in range(j + 1, size):
+            inverse[i, j] = -(factor[i, j:i] * inverse[j:i, j]).sum(axis=0) / factor[i, i]
+    return inverse
@@ -0,0 +1,168 @@
+"""Render the scene without a display and export the frames to disk.
+
+Usage:
+    python headless.py --frames 600 --output frames/
+    python headless.py --frames 600 --script lesson.json --format bmp
+
+The simulation advances one fixed step per frame with no clock throttling,
+so the output is identical on every run and is produced as fast as the CPU
+allows.
+"""
+import os
+import sys
+import json
+import time
+import argparse
+
+# The dummy drivers must be selected before pygame initializes
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+from main import Game, SCREEN_WIDTH, SCREEN_HEIGHT
+from orbits import CONSTELLATIONS
+
+FRAME_FORMATS = ("png", "bmp", "raw")
+
+class InputScript:
+    """Scripted mouse input replayed into the game at fixed frame indices.
+
+    Actions are dicts with a "frame" key plus one of:
+        {"frame": 0, "click": [x, y]}
+        {"frame": 30, "slider": 0.0, "to": 1.0, "frames": 240}
+    A slider action grabs the handle, drags it from one ratio to the other
+    over the given number of frames, and releases it.
+    """
+
+    def __init__(self, actions):
+        self.actions = sorted(actions, key=lambda action: action["frame"])
+
+    @classmethod
+    def load(cls, path):
+        """Read a script from a JSON file holding a list of actions"""
+        with open(path) as script_file:
+            return cls(json.load(script_file))
+
+    @classmethod
+    def default(cls, frame_count):
+        """Click the Earth, then sweep the car across the grassland"""
+        drag_frames = max(1, frame_count - 60)
+        return cls([
+            {"frame": 0, "click": [SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2]},
+            {"frame": 30, "slider": 0.0, "to": 1.0, "frames": drag_frames},
+        ])
+
+    def post_events(self, frame, game):
+        """Post the pygame events scheduled for this frame"""
+        for event in self.events_for_frame(frame, game):
+            pygame.event.post(event)
+
+    def events_for_frame(self, frame, game):
+        """Return the pygame events scheduled for this frame"""
+        events = []
+        for action in self.actions:
+            start = action["frame"]
+            if "click" in action and frame == start:
+                pos = tuple(action["click"])
+                events.append(pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=pos))
+                events.append(pygame.event.Event(pygame.MOUSEBUTTONUP, button=1, pos=pos))
+            elif "slider" in action:
+                events.extend(self.slider_events(action, frame, game))
+        return events
+
+    def slider_events(self, action, frame, game):
+        """Return the press/drag/release events of a slider action for this frame"""
+        start = action["frame"]
+        duration = max(1, action.get("frames", 1))
+        if frame < start or frame > start + duration:
+            return []
+
+        handle_y = game.slider_y + game.slider_height // 2
+        progress = (frame - start) / duration
+        ratio = action["slider"] + (action.get("to", action["slider"]) - action["slider"]) * progress
+        target_x = int(round(game.slider_x + ratio * game.slider_width))
+
+        events = []
+        if frame == start:
+            handle_pos = (int(game.slider_handle_x), handle_y)
+            events.append(pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=handle_pos))
+        events.append(pygame.event.Event(pygame.MOUSEMOTION, pos=(target_x, handle_y),
+                                         rel=(0, 0), buttons=(1, 0, 0)))
+        if frame == start + duration:
+            events.append(pygame.event.Event(pygame.MOUSEBUTTONUP, button=1, pos=(target_x, handle_y)))
+        return events
+
+class HeadlessRenderer:
+    def __init__(self, script=None, game=None):
+        self.game = game or Game()
+        self.game.assets.wait()  # Frames start from fully loaded assets, not placeholders
+        self.script = script or InputScript([])
+        self.frame = 0
+
+    def advance(self):
+        """Feed this frame's scripted input and step the game once"""
+        self.script.post_events(self.frame, self.game)
+        self.game.step()
+        self.frame += 1
+
+    def seek(self, frame):
+        """Simulate up to a frame index without drawing the frames on the way"""
+        while self.frame < frame:
+            self.script.post_events(self.frame, self.game)
+            self.game.step(render=False)
+            self.frame += 1
+
+    def render_frames(self, count, output_dir=None, frame_format="png"):
+        """Render count frames, writing each to output_dir; return frames per second"""
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
+
+        start_time = time.perf_counter()
+        for _ in range(count):
+            index = self.frame
+            self.advance()
+            if output_dir:
+                self.write_frame(output_dir, index, frame_format)
+        elapsed = time.perf_counter() - start_time
+
+        return count / elapsed if elapsed > 0 else float("inf")
+
+    def write_frame(self, output_dir, index, frame_format):
+        """Write the current screen contents as one numbered frame file"""
+        path = os.path.join(output_dir, f"frame_{index:06d}.{frame_format}")
+        if frame_format == "raw":
+            # Tightly packed RGB rows, for piping into an encoder
+            with open(path, "wb") as frame_file:
+                frame_file.write(pygame.image.tobytes(self.game.screen, "RGB"))
+        else:
+            pygame.image.save(self.game.screen, path)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export the animation as frames without a display")
+    parser.add_argument("--frames", type=int, default=600, help="number of frames to render")
+    parser.add_argument("--output", default="frames", help="directory for the frame files")
+    parser.add_argument("--format", choices=FRAME_FORMATS, default="png", help="frame file format")
+    parser.add_argument("--script", help="JSON input script (defaults to clicking Earth and sweeping the car)")
+    parser.add_argument("--no-write", action="store_true", help="render without writing frames")
+    parser.add_argument("--fleet", type=int, default=0, metavar="N", help="add a traffic fleet of N cars")
+    parser.add_argument("--constellation", choices=sorted(CONSTELLATIONS),
+                        help="fly a satellite constellation across the sky")
+    parser.add_argument("--tiles", metavar="PATH", help="map tile directory or .mbtiles file for the ground")
+    args = parser.parse_args(argv)
+
+    script = InputScript.load(args.script) if args.script else InputScript.default(args.frames)
+    game = Game(fleet_size=args.fleet, constellation=args.constellation, tiles=args.tiles)
+    game.wait_for_tiles = True  # Every frame shows the fully loaded map
+    renderer = HeadlessRenderer(script, game)
+
+    output_dir = None if args.no_write else args.output
+    fps = renderer.render_frames(args.frames, output_dir, args.format)
+    print(f"Rendered {args.frames} frames at {fps:.1f} frames/sec")
+
+    if game.tile_map:
+        game.tile_map.close()
+    pygame.quit()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,4 +1,6 @@
 import pygame
+from collections import OrderedDict
+from text import get_text_renderer
 
 class InfoPanel:
     def __init__(self):
@@ -13,38 +15,78 @@ class InfoPanel:
         self.text_color = (0, 0, 0)
         self.title_color = (0, 50, 100)
         
-        # Font
-        pygame.font.init()
-        self.title_font = pygame.font.Font(None, 24)
-        self.text_font = pygame.font.Font(None, 18)
+        # Font sizes; fonts come from the shared text renderer
+        self.title_font_size = 24
+        self.text_font_size = 18
+        
+        # LRU caches: wrapped lines and finished panels per text and
+        # everything they are drawn with, so an open panel costs one blit
+        self.cache_size = 8
+        self.layout_cache = OrderedDict()
+        self.panel_cache = OrderedDict()
         
     def draw(self, screen, info_text):
         """Draw the information panel with text"""
+        screen.blit(self.get_panel_surface(info_text), (self.x, self.y))
+    
+    def get_panel_surface(self, info_text):
+        """Return the fully rendered panel for this text, building it if needed"""
+        key = (info_text, self.height, self.bg_color, self.border_color) + self.get_layout_key()
+        panel = self.panel_cache.get(key)
+        if panel is None:
+            panel = self.build_panel_surface(info_text)
+            self.panel_cache[key] = panel
+            if len(self.panel_cache) > self.cache_size:
+                self.panel_cache.popitem(last=False)
+        else:
+            self.panel_cache.move_to_end(key)
+        return panel
+    
+    def build_panel_surface(self, info_text):
+        """Render background, close button and text into a panel-sized surface"""
+        panel = pygame.Surface((self.width, self.height))
+        if pygame.display.get_surface() is not None:
+            panel = panel.convert()
+        
         # Draw panel background
-        panel_rect = pygame.Rect(self.x, self.y, self.width, self.height)
-        pygame.draw.rect(screen, self.bg_color, panel_rect)
-        pygame.draw.rect(screen, self.border_color, panel_rect, 3)
+        panel_rect = panel.get_rect()
+        pygame.draw.rect(panel, self.bg_color, panel_rect)
+        pygame.draw.rect(panel, self.border_color, panel_rect, 3)
         
         # Draw close button
-        close_button = pygame.Rect(self.x + self.width - 25, self.y + 5, 20, 20)
-        pygame.draw.rect(screen, (200, 50, 50), close_button)
-        pygame.draw.rect(screen, self.border_color, close_button, 2)
+        close_button = pygame.Rect(self.width - 25, 5, 20, 20)
+        pygame.draw.rect(panel, (200, 50, 50), close_button)
+        pygame.draw.rect(panel, self.border_color, close_button, 2)
         
         # Draw X in close button
-        pygame.draw.line(screen, (255, 255, 255),
+        pygame.draw.line(panel, (255, 255, 255),
                         (close_button.x + 5, close_button.y + 5),
                         (close_button.x + 15, close_button.y + 15), 2)
-        pygame.draw.line(screen, (255, 255, 255),
+        pygame.draw.line(panel, (255, 255, 255),
                         (close_button.x + 15, close_button.y + 5),
                         (close_button.x + 5, close_button.y + 15), 2)
         
         # Render text
-        self.render_text(screen, info_text)
+        self.render_text(panel, info_text)
+        return panel
+    
+    def render_text(self, panel, text):
+        """Render multi-line text onto a panel surface"""
+        renderer = get_text_renderer()
+        panel.blits([(renderer.render(line, size, color), (10, y_offset))
+                     for line, size, color, y_offset in self.layout_text(text)], False)
     
-    def render_text(self, screen, text):
-        """Render multi-line text in the panel"""
+    def layout_text(self, text):
+        """Return the word-wrapped lines as (text, font size, color, y) tuples"""
+        key = (text,) + self.get_layout_key()
+        layout = self.layout_cache.get(key)
+        if layout is not None:
+            self.layout_cache.move_to_end(key)
+            return layout
+        
+        layout = []
         lines = text.split('\n')
-        y_offset = self.y + 40
+        y_offset = 40
         line_height = 22
         
         for i, line in enumerate(lines):
@@ -55,11 +97,12 @@ class InfoPanel:
                 
             # Use title font for the first non-empty line
             if i == 0 or (i == 1 and not lines[0].strip()):
-                font = self.title_font
+                size = self.title_font_size
                 color = self.title_color
             else:
-                font = self.text_font
+                size = self.text_font_size
                 color = self.text_color
+            font = get_text_renderer().get_font(size)
             
             # Word wrap for long lines
             words = line.split(' ')
@@ -73,16 +116,27 @@ class InfoPanel:
                     current_line = test_line
                 else:
                     if current_line:
-                        text_surface = font.render(current_line.strip(), True, color)
-                        screen.blit(text_surface, (self.x + 10, y_offset))
+                        layout.append((current_line.strip(), size, color, y_offset))
                         y_offset += line_height
                     current_line = word + " "
             
-            # Render remaining text
+            # Remaining text
             if current_line:
-                text_surface = font.render(current_line.strip(), True, color)
-                screen.blit(text_surface, (self.x + 10, y_offset))
+                layout.append((current_line.strip(), size, color, y_offset))
                 y_offset += line_height
+        
+        self.layout_cache[key] = layout
+        if len(self.layout_cache) > self.cache_size:
+            self.layout_cache.popitem(last=False)
+        return layout
+    
+    def get_layout_key(self):
+        """Return everything the text layout depends on besides the text"""
+        return (self.width, self.title_font_size, self.text_font_size, self.title_color, self.text_color)
+    
+    def get_rect(self):
+        """Return the screen area covered by the panel"""
+        return pygame.Rect(self.x, self.y, self.width, self.height)
     
     def is_clicked(self, pos):
         """Check if the panel (or close button) was clicked"""
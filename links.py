@@ -0,0 +1,150 @@
+import math
+import numpy as np
+from orbits import EARTH_RADIUS
+
+class LinkEngine:
+    """Assigns every ground receiver its best visible satellites.
+
+    Satellites and receivers are bucketed by their direction from Earth's
+    center in a uniform grid whose cells are as wide as a satellite's
+    footprint plus a skin margin, so a receiver only looks at satellites in
+    its own and the 26 neighbouring cells. The resulting candidate lists
+    stay valid until satellites and receivers together have drifted
+    further than the skin; until then each step only ranks the cached
+    candidates by elevation.
+    """
+
+    def __init__(self, links_per_receiver=4, min_elevation=10.0, skin=5.0):
+        self.links_per_receiver = links_per_receiver
+        self.min_elevation = math.radians(min_elevation)  # Elevation mask
+        self.skin = math.radians(skin)                    # Drift allowed between rebuilds
+
+        self.blocks = None            # [(receiver indices, candidate satellite indices)]
+        self.build_satellites = None  # Unit directions at the last rebuild
+        self.build_receivers = None
+        self.build_radius = 0.0
+        self.rebuilds = 0
+
+        self.assignments = np.full((0, links_per_receiver), -1)  # Satellite indices, best first
+        self.elevations = np.full((0, links_per_receiver), np.nan)
+
+    def footprint_angle(self, satellite_radius):
+        """Return the Earth-central angle within which a satellite clears the elevation mask"""
+        cos_mask = math.cos(self.min_elevation)
+        return math.acos(min(1.0, EARTH_RADIUS / satellite_radius * cos_mask)) - self.min_elevation
+
+    def update(self, satellite_positions, receiver_positions):
+        """Re-rank links for Earth-fixed satellite and receiver positions (km)
+
+        Returns an (N, K) array of satellite indices per receiver, best
+        first, with -1 where fewer than K satellites clear the mask.
+        """
+        satellite_radii = np.sqrt(np.einsum('ij,ij->i', satellite_positions, satellite_positions))
+        satellite_dirs = satellite_positions / satellite_radii[:, None]
+        receiver_dirs = receiver_positions / np.linalg.norm(receiver_positions, axis=1)[:, None]
+
+        if self.needs_rebuild(satellite_dirs, receiver_dirs, satellite_radii.max()):
+            self.rebuild(satellite_dirs, receiver_dirs, satellite_radii.max())
+        self.rank(satellite_positions, receiver_positions, receiver_dirs)
+        return self.assignments
+
+    def needs_rebuild(self, satellite_dirs, receiver_dirs, max_radius):
+        """Check whether the cached candidate lists may have missed a satellite"""
+        if (self.blocks is None or len(satellite_dirs) != len(self.build_satellites) or
+                len(receiver_dirs) != len(self.build_receivers) or max_radius > self.build_radius):
+            return True
+        satellite_drift = drift_angle(satellite_dirs, self.build_satellites)
+        receiver_drift = drift_angle(receiver_dirs, self.build_receivers)
+        return satellite_drift + receiver_drift > self.skin
+
+    def rebuild(self, satellite_dirs, receiver_dirs, max_radius):
+        """Bucket satellites into the direction grid and gather candidates per receiver cell"""
+        reach = min(math.pi, self.footprint_angle(max_radius) + self.skin)
+        cell_size = 2 * math.sin(reach / 2)  # Chord of the reach angle
+        satellite_cells = grid_cells(satellite_dirs, cell_size)
+        receiver_cells = grid_cells(receiver_dirs, cell_size)
+
+        # Satellites sorted by cell so each cell is one contiguous slice
+        span = int(math.ceil(1 / cell_size)) * 2 + 3
+        satellite_keys = cell_keys(satellite_cells, span)
+        order = np.argsort(satellite_keys, kind='stable')
+        sorted_keys = satellite_keys[order]
+
+        neighbours = np.array([(dx, dy, dz) for dx in (-1, 0, 1)
+                               for dy in (-1, 0, 1) for dz in (-1, 0, 1)])
+        cos_reach = math.cos(reach)
+        unique_cells, receiver_groups = np.unique(receiver_cells, axis=0, return_inverse=True)
+        receiver_groups = receiver_groups.ravel()
+
+        self.blocks = []
+        for group, cell in enumerate(unique_cells):
+            keys = np.unique(cell_keys(cell + neighbours, span))
+            starts = np.searchsorted(sorted_keys, keys, side='left')
+            ends = np.searchsorted(sorted_keys, keys, side='right')
+            candidates = np.concatenate([order[start:end] for start, end in zip(starts, ends)])
+            receivers = np.flatnonzero(receiver_groups == group)
+            if len(candidates):
+                # Drop candidates out of reach of every receiver in the cell
+                dots = receiver_dirs[receivers] @ satellite_dirs[candidates].T
+                candidates = candidates[dots.max(axis=0) >= cos_reach]
+            self.blocks.append((receivers, np.sort(candidates)))
+
+        self.build_satellites = satellite_dirs
+        self.build_receivers = receiver_dirs
+        self.build_radius = max_radius
+        self.rebuilds += 1
+
+    def rank(self, satellite_positions, receiver_positions, receiver_dirs):
+        """Pick each receiver's highest candidates above the elevation mask"""
+        count = self.links_per_receiver
+        sin_mask = math.sin(self.min_elevation)
+        self.assignments = np.full((len(receiver_positions), count), -1)
+        self.elevations = np.full((len(receiver_positions), count), np.nan)
+
+        for receivers, candidates in self.blocks:
+            if not len(candidates):
+                continue
+            # Sine of elevation for every receiver/candidate pair in the block
+            offsets = satellite_positions[candidates][None, :, :] - receiver_positions[receivers][:, None, :]
+            ranges = np.sqrt(np.einsum('rcj,rcj->rc', offsets, offsets))
+            sin_elevation = np.einsum('rcj,rj->rc', offsets, receiver_dirs[receivers]) / ranges
+
+            # Partial sort for the best few, then order just those
+            best = min(count, len(candidates))
+            top = np.argpartition(-sin_elevation, best - 1, axis=1)[:, :best]
+            values = np.take_along_axis(sin_elevation, top, axis=1)
+            order = np.argsort(-values, axis=1)
+            top = np.take_along_axis(top, order, axis=1)
+            values = np.take_along_axis(values, order, axis=1)
+
+            visible = values >= sin_mask
+            self.assignments[receivers, :best] = np.where(visible, candidates[top], -1)
+            self.elevations[receivers, :best] = np.where(visible, np.arcsin(np.clip(values, -1, 1)), np.nan)
+
+    def get_links(self, receivers=None, ranks=None):
+        """Return the current links as (receiver, satellite, rank) triples
+
+        receivers and ranks limit the result to the first receivers and
+        each one's best few links.
+        """
+        assignments = self.assignments[:receivers, :ranks]
+        receivers, ranks = np.nonzero(assignments >= 0)
+        satellites = assignments[receivers, ranks]
+        return list(zip(receivers.tolist(), satellites.tolist(), ranks.tolist()))
+
+def drift_angle(directions, previous):
+    """Return the largest angle any unit direction turned since previous"""
+    if not len(directions):
+        return 0.0
+    cos_drift = np.einsum('ij,ij->i', directions, previous).min()
+    return math.acos(max(-1.0, min(1.0, float(cos_drift))))
+
+def grid_cells(directions, cell_size):
+    """Return the integer grid cell of each unit direction"""
+    return np.floor(directions / cell_size).astype(np.int64)
+
+def cell_keys(cells, span):
+    """Pack integer cells into single sortable keys"""
+    offset = span // 2
+    cells = np.atleast_2d(cells) + offset
+    return (cells[:, 0] * span + cells[:, 1]) * span + cells[:, 2]
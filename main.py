@@ -1,6 +1,9 @@
 import pygame
 import sys
 import math
+import zlib
+import argparse
+import numpy as np
 from earth import Earth
 from satellite import Satellite
 from car import Car
@@ -8,6 +11,20 @@ from mobile import Mobile
 from school import School
 from info_panel import InfoPanel
 from animation_effects import RadiationWaves, ConnectionLines
+from background import BackgroundLayer
+from compositor import DirtyRectCompositor
+from profiler import FrameProfiler
+from text import get_text_renderer
+from simulation import SimulationClock, Interpolator
+from scene import SceneGraph
+from fleet import CarFleet
+from orbits import Constellation, SkyProjection, OrbitLayer, CONSTELLATIONS
+from links import LinkEngine
+from gnss import GnssSolver
+from tilemap import TileMapLayer, open_tile_source
+from animation_cache import get_animation_cache
+from assets import AssetLoader
+from replay import InputRecorder
 
 # Initialize Pygame
 pygame.init()
@@ -15,18 +32,37 @@ pygame.init()
 # Constants
 SCREEN_WIDTH = 1200
 SCREEN_HEIGHT = 800
-FPS = 60
+FPS = 60             # Render rate cap; raise it to match faster monitors
+SIMULATION_HZ = 60   # Fixed simulation step rate, independent of FPS
 
 # Colors
 BLACK = (0, 0, 0)
 WHITE = (255, 255, 255)
-SKY_BLUE = (135, 206, 235)  # More realistic sky color
-GRASS_GREEN = (34, 139, 34)  # Forest green for grass
-DARK_GRASS = (0, 100, 0)    # Darker green for grass texture
 BROWN = (101, 67, 33)
 
+# Ground observer the constellation sky view is seen from (Kolkata)
+OBSERVER_LATITUDE = 22.57
+OBSERVER_LONGITUDE = 88.36
+GNSS_CHANNELS = 8    # Satellites each receiver tracks for its position fix
+LINKS_DRAWN = 4      # Best links drawn per receiver
+MAP_PAN_STEP = 64    # Pixels the ground map moves per arrow key press
+
+# Font sizes preloaded in the background: school sign, info panel text, titles and slider labels
+FONT_SIZES = (16, 18, 24)
+
+# Scene z-order for hit-testing (higher is drawn on top)
+Z_EARTH = 0
+Z_SATELLITE = 1
+Z_FLEET = 2
+Z_SCHOOL = 3
+Z_CAR = 4
+Z_MOBILE = 5
+
 class Game:
-    def __init__(self):
+    def __init__(self, fleet_size=0, constellation=None, tiles=None):
+        # Startup timings are measured from here
+        self.assets = AssetLoader()
+        
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         pygame.display.set_caption("Digital Mapping - Interactive Earth Scene")
         self.clock = pygame.time.Clock()
@@ -46,8 +82,15 @@ class Game:
         self.slider_handle_radius = 15
         self.slider_handle_x = self.slider_x + 50  # Initial position
         
+        # Fixed-step simulation, interpolated while drawing
+        self.sim_clock = SimulationClock(SIMULATION_HZ)
+        self.interpolator = Interpolator()
+        
         # Initialize objects
-        self.earth = Earth(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)
+        self.background = BackgroundLayer(SCREEN_WIDTH, SCREEN_HEIGHT)
+        self.compositor = DirtyRectCompositor()
+        self.profiler = FrameProfiler()
+        self.earth = Earth(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2, load_image=False)
         self.satellite = None
         self.car = None
         self.mobile = None
@@ -56,8 +99,40 @@ class Game:
         self.radiation_waves = None
         self.connection_lines = None
         
+        # Optional traffic fleet, spawned with the rest of the scene
+        self.fleet_size = fleet_size
+        self.fleet = None
+        
+        # Optional satellite constellation; the scene satellite then follows
+        # the highest satellite across the sky
+        self.constellation = constellation
+        self.orbits = None
+        self.links = None
+        self.gnss = None
+        self.receivers = []
+        
+        # Optional map tiles (directory or .mbtiles) covering the ground
+        self.tiles = tiles
+        self.tile_map = None
+        self.wait_for_tiles = False  # Block on tile loading, for reproducible headless frames
+        
+        # Input recorder for bug reports, see replay.py
+        self.recorder = None
+        
+        # Clickable entities, z-ordered to match drawing for hit-testing
+        self.scene = SceneGraph()
+        self.scene.add(self.earth, Z_EARTH)
+        
+        # The first frames show the fallback globe while the Earth image and
+        # fonts load in the background
+        self.assets.add('Earth image', self.earth.load_assets, self.earth.set_assets)
+        self.assets.add('fonts', lambda: [get_text_renderer().get_font(size) for size in FONT_SIZES])
+        self.assets.start()
+        
     def handle_events(self):
         for event in pygame.event.get():
+            if self.recorder:
+                self.recorder.record_event(event, self.slider_dragging)
             if event.type == pygame.QUIT:
                 self.running = False
             elif event.type == pygame.MOUSEBUTTONDOWN:
@@ -73,40 +148,55 @@ class Game:
             elif event.type == pygame.MOUSEMOTION:
                 if self.slider_dragging:
                     self.update_slider_position(event.pos)
+            elif event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_F3:  # Toggle frame profiler HUD
+                    self.profiler.toggle()
+                elif event.key == pygame.K_F4:  # Dump profiler samples to CSV
+                    self.profiler.export_csv()
+                elif self.tile_map:
+                    self.handle_map_key(event.key)
+            elif event.type == pygame.MOUSEWHEEL and self.tile_map:
+                # Zoom the map around the cursor; replayed events carry where it was
+                pos = event.pos if hasattr(event, 'pos') else pygame.mouse.get_pos()
+                if self.tile_map.get_rect().collidepoint(pos):
+                    self.tile_map.zoom_by(1 if event.y > 0 else -1, pos)
+    
+    def handle_map_key(self, key):
+        """Pan the ground map with the arrow keys and zoom with +/-"""
+        pan = {pygame.K_LEFT: (-MAP_PAN_STEP, 0), pygame.K_RIGHT: (MAP_PAN_STEP, 0),
+               pygame.K_UP: (0, -MAP_PAN_STEP), pygame.K_DOWN: (0, MAP_PAN_STEP)}
+        if key in pan:
+            self.tile_map.pan(*pan[key])
+        elif key in (pygame.K_EQUALS, pygame.K_PLUS, pygame.K_KP_PLUS):
+            self.tile_map.zoom_by(1)
+        elif key in (pygame.K_MINUS, pygame.K_KP_MINUS):
+            self.tile_map.zoom_by(-1)
                     
     def handle_click(self, pos):
-        # Check Earth click
-        if self.earth.is_clicked(pos) and self.earth.visible:
-            if not self.earth_clicked:
-                self.earth_clicked = True
-                self.spawn_scene_elements()
-                # Make Earth disappear after spawning scene elements
-                self.earth.visible = False
-            else:
-                self.show_info_panel = True
-                self.info_text = self.earth.get_info()
-        
-        # Check other elements if they exist
-        if self.satellite and self.satellite.is_clicked(pos):
-            self.show_info_panel = True
-            self.info_text = self.satellite.get_info()
-            
-        if self.car and self.car.is_clicked(pos):
-            self.show_info_panel = True
-            self.info_text = self.car.get_info()
-            
-        if self.mobile and self.mobile.is_clicked(pos):
+        # The open info panel sits above everything and takes its own clicks
+        if self.show_info_panel and self.info_panel.get_rect().collidepoint(pos):
+            if not self.info_panel.is_clicked(pos):
+                self.show_info_panel = False  # Close button
+            return
+
+        # Only the topmost entity under the cursor receives the click
+        entity = self.scene.hit_test(pos)
+        if entity is None:
+            # Clicking empty space closes the info panel
+            self.show_info_panel = False
+        elif entity is self.earth and not self.earth_clicked:
+            self.earth_clicked = True
+            self.spawn_scene_elements()
+            # Make Earth disappear after spawning scene elements
+            self.earth.visible = False
+            self.scene.remove(self.earth)
+        elif entity is self.fleet:
+            # Only the clicked vehicle gets a Car object of its own
             self.show_info_panel = True
-            self.info_text = self.mobile.get_info()
-            
-        if self.school and self.school.is_clicked(pos):
+            self.info_text = self.fleet.get_info(self.fleet.hit_test(pos))
+        else:
             self.show_info_panel = True
-            self.info_text = self.school.get_info()
-            
-        # Check if clicking outside info panel to close it
-        if self.show_info_panel:
-            if not self.info_panel.is_clicked(pos):
-                self.show_info_panel = False
+            self.info_text = entity.get_info()
     
     def is_slider_handle_clicked(self, pos):
         """Check if the slider handle was clicked"""
@@ -134,7 +224,8 @@ class Game:
             car_min_x = self.school.x + 50 if self.school else 200
             car_max_x = SCREEN_WIDTH - 100
             self.car.x = car_min_x + slider_ratio * (car_max_x - car_min_x)
-                
+            self.scene.update(self.car)
+
     def spawn_scene_elements(self):
         """Spawn all scene elements when Earth is clicked"""
         # Create satellite high above Earth (topmost part)
@@ -152,7 +243,7 @@ class Game:
         self.update_slider_from_car_position()
         
         # Create mobile phone near the ground (on grassland)
-        grass_y = self.earth.y + self.earth.radius + 50
+        grass_y = self.get_grass_y()
         self.mobile = Mobile(SCREEN_WIDTH - 200, grass_y + 30)
         
         # Create radiation waves
@@ -160,6 +251,47 @@ class Game:
         
         # Create connection lines
         self.connection_lines = ConnectionLines()
+
+        # Register everything clickable with the scene graph
+        self.scene.add(self.satellite, Z_SATELLITE)
+        self.scene.add(self.school, Z_SCHOOL)
+        self.scene.add(self.car, Z_CAR)
+        self.scene.add(self.mobile, Z_MOBILE)
+        
+        # Traffic fleet driving across the grassland
+        if self.fleet_size:
+            self.fleet = CarFleet(self.fleet_size, 0, SCREEN_WIDTH,
+                                  grass_y + 20, self.slider_y - 60)
+            self.scene.add(self.fleet, Z_FLEET)
+        
+        # Constellation propagated in orbit and projected onto the sky
+        if self.constellation:
+            projection = SkyProjection(OBSERVER_LATITUDE, OBSERVER_LONGITUDE, SCREEN_WIDTH // 2,
+                                       grass_y - 60, SCREEN_WIDTH // 2 - 80, grass_y - 140)
+            self.orbits = OrbitLayer(Constellation.from_name(self.constellation), projection)
+            self.orbits.attach(self.satellite)
+            self.scene.update(self.satellite)
+            self.radiation_waves.update(self.satellite.x, self.satellite.y)
+            
+            # Every ground receiver links to its best visible satellites and
+            # positions itself from their pseudo-ranges; the car and any
+            # fleet vehicles are shown where their fix puts them
+            self.links = LinkEngine(links_per_receiver=GNSS_CHANNELS)
+            self.gnss = GnssSolver()
+            self.receivers = [self.car, self.mobile, self.school]
+        
+        # Map tiles covering the grassland, loaded in the background
+        if self.tiles:
+            self.tile_map = TileMapLayer(open_tile_source(self.tiles),
+                                         pygame.Rect(0, grass_y, SCREEN_WIDTH, SCREEN_HEIGHT - grass_y),
+                                         OBSERVER_LATITUDE, OBSERVER_LONGITUDE)
+
+        # Smooth motion between simulation steps. The Earth, satellite and
+        # phone play frame strips with one frame per step, where an in-between
+        # value would only pick a neighbouring frame, so they are not tracked
+        self.interpolator.track(self.connection_lines, 'pulse_offset', 2 * math.pi)
+        if self.fleet:
+            self.interpolator.track(self.fleet, 'position', self.fleet.span)
     
     def update_slider_from_car_position(self):
         """Update slider handle position based on current car position"""
@@ -175,6 +307,11 @@ class Game:
         self.earth.update()
         
         if self.earth_clicked:
+            # Propagate the constellation, which moves the satellite along its orbit
+            if self.orbits:
+                self.orbits.update()
+                self.scene.update(self.satellite)
+            
             # Update satellite
             if self.satellite:
                 self.satellite.update()
@@ -182,156 +319,82 @@ class Game:
             # Update car movement (now controlled by slider, not automatic)
             # Car position is updated by slider interaction
             
+            # Move the whole traffic fleet in one vectorized step
+            if self.fleet:
+                self.fleet.update()
+            
+            # Update mobile screen pulse and notification light
+            if self.mobile:
+                self.mobile.update()
+            
             # Update radiation waves
             if self.radiation_waves:
                 self.radiation_waves.update(self.satellite.x, self.satellite.y)
                 
+            # Position every receiver, then link it to its best satellites
+            if self.links:
+                self.update_positioning()
+            
             # Update connection lines
-            if self.connection_lines and self.satellite and self.car and self.mobile:
+            if self.connection_lines and self.links:
+                self.connection_lines.update_links(self.get_satellite_links())
+            elif self.connection_lines and self.satellite and self.car and self.mobile:
                 self.connection_lines.update(
                     (self.satellite.x, self.satellite.y),
                     (self.car.x, self.car.y),
                     (self.mobile.x, self.mobile.y)
                 )
     
-    def draw_grassland(self):
-        """Draw realistic grassland below Earth with flowers and design elements"""
-        grass_y = self.earth.y + self.earth.radius + 50
-        pygame.draw.rect(self.screen, GRASS_GREEN, 
-                        (0, grass_y, SCREEN_WIDTH, SCREEN_HEIGHT - grass_y))
-        
-        # Add realistic grass texture with varying heights and colors
-        grass_colors = [DARK_GRASS, (46, 125, 50), (27, 94, 32)]
-        for i in range(0, SCREEN_WIDTH, 8):
-            # Vary grass height and color for realism
-            grass_height = 8 + (i % 12)
-            color_idx = (i // 8) % len(grass_colors)
-            pygame.draw.line(self.screen, grass_colors[color_idx], 
-                           (i, grass_y), (i, grass_y + grass_height), 2)
-            pygame.draw.line(self.screen, grass_colors[color_idx], 
-                           (i + 3, grass_y), (i + 3, grass_y + grass_height - 2), 1)
-        
-        # Add flowers scattered across the grassland
-        self.draw_flowers(grass_y)
-        
-        # Add bushes and small plants
-        self.draw_bushes(grass_y)
-        
-        # Add small rocks and pebbles
-        self.draw_rocks(grass_y)
-        
-        # Add dandelions and wildflowers
-        self.draw_wildflowers(grass_y)
+    def update_positioning(self):
+        """Assign satellites to every receiver and solve all their position fixes"""
+        xs = np.array([receiver.x for receiver in self.receivers], dtype=float)
+        if self.fleet:
+            xs = np.concatenate([xs, self.fleet.screen_x()])
+        projection = self.orbits.projection
+        ground = projection.ground_points(xs)
+        self.links.update(self.orbits.fixed_positions, ground)
+        self.gnss.update(self.orbits.fixed_positions, ground, self.links.assignments)
+        
+        # Show each fix on screen; receivers without one stay where they are
+        fix_x = np.clip(projection.scene_x(self.gnss.estimates[:, :3]), 0, SCREEN_WIDTH)
+        fix_x = np.where(self.gnss.valid, fix_x, xs)
+        if self.gnss.valid[0]:
+            accuracy = self.gnss.dop['pdop'][0] * self.gnss.noise * 1000
+            tracked = int((self.links.assignments[0] >= 0).sum())
+            self.car.fix_x = float(fix_x[0])
+            self.car.fix_report = f"{accuracy:.0f} m, PDOP {self.gnss.dop['pdop'][0]:.1f}, {tracked} sats"
+        else:
+            self.car.fix_x = self.car.fix_report = None
+        self.scene.update(self.car)
+        if self.fleet:
+            self.fleet.set_fix_offset((fix_x - xs)[len(self.receivers):].astype(np.float32))
     
-    def draw_flowers(self, grass_y):
-        """Draw colorful flowers scattered across the grassland"""
-        flower_colors = [
-            (255, 105, 180),  # Hot pink
-            (255, 165, 0),    # Orange
-            (255, 255, 0),    # Yellow
-            (138, 43, 226),   # Blue violet
-            (255, 20, 147),   # Deep pink
-            (255, 69, 0),     # Red orange
-        ]
-        
-        # Draw flowers at specific positions for consistency
-        flower_positions = [
-            (150, grass_y + 15), (300, grass_y + 20), (450, grass_y + 12),
-            (600, grass_y + 18), (750, grass_y + 15), (900, grass_y + 22),
-            (1050, grass_y + 16), (200, grass_y + 25), (350, grass_y + 30),
-            (500, grass_y + 28), (650, grass_y + 24), (800, grass_y + 27),
-            (950, grass_y + 29), (1100, grass_y + 26), (100, grass_y + 35),
-            (250, grass_y + 32), (400, grass_y + 38), (550, grass_y + 34),
-            (700, grass_y + 36), (850, grass_y + 33), (1000, grass_y + 37)
-        ]
-        
-        for i, (x, y) in enumerate(flower_positions):
-            if x < SCREEN_WIDTH:
-                color = flower_colors[i % len(flower_colors)]
-                # Flower petals
-                for j in range(5):
-                    angle = j * 72  # 360/5 = 72 degrees
-                    petal_x = x + int(3 * math.cos(math.radians(angle)))
-                    petal_y = y + int(3 * math.sin(math.radians(angle)))
-                    pygame.draw.circle(self.screen, color, (petal_x, petal_y), 2)
-                # Flower center
-                pygame.draw.circle(self.screen, (255, 255, 0), (x, y), 1)
-                # Flower stem
-                pygame.draw.line(self.screen, (0, 100, 0), (x, y), (x, y + 8), 1)
+    def get_satellite_links(self):
+        """Return the best receiver links as connection lines"""
+        # Lines run from the satellite's spot in the sky to the receiver as
+        # shown; each receiver's links pulse a quarter cycle apart
+        links = []
+        for receiver, satellite, rank in self.links.get_links(len(self.receivers), LINKS_DRAWN):
+            receiver = self.receivers[receiver]
+            end = (receiver.get_display_x() if receiver is self.car else receiver.x, receiver.y)
+            links.append((tuple(self.orbits.points[satellite]), end, rank * math.pi / 2))
+        return links
     
-    def draw_bushes(self, grass_y):
-        """Draw small bushes and shrubs"""
-        bush_positions = [
-            (180, grass_y + 20), (380, grass_y + 25), (580, grass_y + 22),
-            (780, grass_y + 24), (980, grass_y + 21), (1180, grass_y + 23)
-        ]
-        
-        bush_green = (34, 139, 34)
-        dark_bush = (0, 100, 0)
-        
-        for x, y in bush_positions:
-            if x < SCREEN_WIDTH:
-                # Main bush body
-                pygame.draw.ellipse(self.screen, bush_green, (x - 8, y, 16, 12))
-                # Bush highlight
-                pygame.draw.ellipse(self.screen, (60, 179, 113), (x - 6, y + 1, 12, 4))
-                # Bush shadow
-                pygame.draw.ellipse(self.screen, dark_bush, (x - 7, y + 8, 14, 6))
+    def get_grass_y(self):
+        """Return the top edge of the grassland"""
+        return self.earth.y + self.earth.radius + 50
     
-    def draw_rocks(self, grass_y):
-        """Draw small rocks and pebbles"""
-        rock_positions = [
-            (120, grass_y + 30), (320, grass_y + 35), (520, grass_y + 32),
-            (720, grass_y + 36), (920, grass_y + 33), (1120, grass_y + 34)
-        ]
-        
-        rock_gray = (105, 105, 105)
-        dark_rock = (69, 69, 69)
-        
-        for x, y in rock_positions:
-            if x < SCREEN_WIDTH:
-                # Main rock
-                pygame.draw.ellipse(self.screen, rock_gray, (x, y, 6, 4))
-                # Rock highlight
-                pygame.draw.ellipse(self.screen, (169, 169, 169), (x + 1, y, 3, 2))
-                # Rock shadow
-                pygame.draw.ellipse(self.screen, dark_rock, (x + 1, y + 2, 4, 3))
+    def get_slider_rect(self):
+        """Return the screen area covered by the slider, handle and labels"""
+        return pygame.Rect(self.slider_x - 55, self.slider_y - 40,
+                           self.slider_width + 110, self.slider_height + 70)
     
-    def draw_wildflowers(self, grass_y):
-        """Draw dandelions and small wildflowers"""
-        wildflower_positions = [
-            (80, grass_y + 18), (280, grass_y + 22), (480, grass_y + 19),
-            (680, grass_y + 21), (880, grass_y + 20), (1080, grass_y + 23)
-        ]
-        
-        for i, (x, y) in enumerate(wildflower_positions):
-            if x < SCREEN_WIDTH:
-                if i % 2 == 0:
-                    # Dandelion
-                    pygame.draw.circle(self.screen, (255, 255, 0), (x, y), 3)
-                    pygame.draw.circle(self.screen, (255, 215, 0), (x, y), 2)
-                    # Dandelion stem
-                    pygame.draw.line(self.screen, (0, 100, 0), (x, y), (x, y + 6), 1)
-                else:
-                    # Small white wildflower
-                    for j in range(4):
-                        angle = j * 90
-                        petal_x = x + int(2 * math.cos(math.radians(angle)))
-                        petal_y = y + int(2 * math.sin(math.radians(angle)))
-                        pygame.draw.circle(self.screen, (255, 255, 255), (petal_x, petal_y), 1)
-                    pygame.draw.circle(self.screen, (255, 255, 0), (x, y), 1)
-                    # Stem
-                    pygame.draw.line(self.screen, (0, 100, 0), (x, y), (x, y + 5), 1)
-    
-    def draw_car_slider(self):
+    def draw_car_slider(self, screen):
         """Draw the interactive car position slider"""
-        if not self.earth_clicked:
-            return
-            
         # Draw slider track
         track_rect = pygame.Rect(self.slider_x, self.slider_y, self.slider_width, self.slider_height)
-        pygame.draw.rect(self.screen, (100, 100, 100), track_rect, border_radius=10)
-        pygame.draw.rect(self.screen, (200, 200, 200), 
+        pygame.draw.rect(screen, (100, 100, 100), track_rect, border_radius=10)
+        pygame.draw.rect(screen, (200, 200, 200), 
                         (track_rect.x + 2, track_rect.y + 2, track_rect.width - 4, track_rect.height - 4), 
                         border_radius=8)
         
@@ -339,95 +402,202 @@ class Game:
         handle_center_y = self.slider_y + self.slider_height // 2
         
         # Handle shadow
-        pygame.draw.circle(self.screen, (50, 50, 50), 
+        pygame.draw.circle(screen, (50, 50, 50), 
                           (int(self.slider_handle_x + 2), int(handle_center_y + 2)), 
                           self.slider_handle_radius)
         
         # Handle body
-        pygame.draw.circle(self.screen, (70, 130, 180), 
+        pygame.draw.circle(screen, (70, 130, 180), 
                           (int(self.slider_handle_x), int(handle_center_y)), 
                           self.slider_handle_radius)
         
         # Handle highlight
-        pygame.draw.circle(self.screen, (100, 150, 200), 
+        pygame.draw.circle(screen, (100, 150, 200), 
                           (int(self.slider_handle_x), int(handle_center_y)), 
                           self.slider_handle_radius - 3)
         
         # Handle border
-        pygame.draw.circle(self.screen, (40, 40, 40), 
+        pygame.draw.circle(screen, (40, 40, 40), 
                           (int(self.slider_handle_x), int(handle_center_y)), 
                           self.slider_handle_radius, 2)
         
-        # Draw slider label
-        pygame.font.init()
-        font = pygame.font.Font(None, 24)
-        label_text = font.render("Car Position Control", True, (0, 0, 0))
+        # Slider label and position indicators, drawn in one batch
+        text = get_text_renderer()
+        label_text = text.render("Car Position Control", 24, (0, 0, 0))
         label_rect = label_text.get_rect(center=(SCREEN_WIDTH // 2, self.slider_y - 25))
-        self.screen.blit(label_text, label_rect)
-        
-        # Draw position indicators
-        # Left indicator
-        left_text = font.render("School", True, (0, 0, 0))
-        self.screen.blit(left_text, (self.slider_x - 50, self.slider_y + 25))
-        
-        # Right indicator
-        right_text = font.render("Mobile", True, (0, 0, 0))
+        left_text = text.render("School", 24, (0, 0, 0))
+        right_text = text.render("Mobile", 24, (0, 0, 0))
         right_rect = right_text.get_rect()
-        self.screen.blit(right_text, (self.slider_x + self.slider_width - right_rect.width + 50, self.slider_y + 25))
+        screen.blits([
+            (label_text, label_rect),
+            (left_text, (self.slider_x - 50, self.slider_y + 25)),
+            (right_text, (self.slider_x + self.slider_width - right_rect.width + 50, self.slider_y + 25)),
+        ], False)
     
-    def render(self):
-        self.screen.fill(SKY_BLUE)  # Realistic sky background
+    def get_sprites(self):
+        """Return the drawable elements back-to-front as compositor sprites"""
+        # Each entry is (key, rects, state, draw); a change in rects or state
+        # tells the compositor that the element needs repainting
+        sprites = []
         
-        # Draw Earth
-        self.earth.draw(self.screen)
+        # Earth
+        if self.earth.visible:
+            sprites.append(('earth', [self.earth.get_rect()], (self.earth.angle, self.earth.texture_version),
+                            self.earth.draw))
         
         if self.earth_clicked:
-            # Draw grassland
-            self.draw_grassland()
+            # Map tiles over the grassland, under everything else
+            if self.tile_map:
+                sprites.append(('tiles', [self.tile_map.get_rect()], self.tile_map.get_state(),
+                                self.tile_map.draw))
             
-            # Draw radiation waves first (behind satellite)
+            # Radiation waves first (behind satellite)
             if self.radiation_waves:
-                self.radiation_waves.draw(self.screen)
+                sprites.append(('waves', [self.radiation_waves.get_rect()],
+                                self.radiation_waves.wave_timer, self.radiation_waves.draw))
+            
+            if self.orbits:
+                sprites.append(('orbits', [self.orbits.get_rect()], self.orbits.get_state(),
+                                self.orbits.draw))
             
-            # Draw satellite
             if self.satellite:
-                self.satellite.draw(self.screen)
+                sprites.append(('satellite', [self.satellite.get_rect()],
+                                self.satellite.angle, self.satellite.draw))
+                
+            if self.fleet:
+                sprites.append(('fleet', [self.fleet.get_rect()], self.fleet.get_state(),
+                                self.fleet.draw))
                 
-            # Draw school
             if self.school:
-                self.school.draw(self.screen)
+                sprites.append(('school', [self.school.get_rect()], None, self.school.draw))
                 
-            # Draw car
             if self.car:
-                self.car.draw(self.screen)
+                sprites.append(('car', [self.car.get_rect()], (self.car.x, self.car.fix_x),
+                                self.car.draw))
                 
-            # Draw mobile
             if self.mobile:
-                self.mobile.draw(self.screen)
+                sprites.append(('mobile', [self.mobile.get_rect()],
+                                (self.mobile.screen_pulse, self.mobile.notification_blink),
+                                self.mobile.draw))
                 
-            # Draw connection lines
             if self.connection_lines:
-                self.connection_lines.draw(self.screen)
-        
-        # Draw car control slider
-        self.draw_car_slider()
+                sprites.append(('connections', self.connection_lines.get_rects(),
+                                self.connection_lines.pulse_offset, self.connection_lines.draw))
+            
+            # Car control slider
+            sprites.append(('slider', [self.get_slider_rect()], self.slider_handle_x,
+                            self.draw_car_slider))
         
-        # Draw info panel if needed
+        # Info panel on top
         if self.show_info_panel:
-            self.info_panel.draw(self.screen, self.info_text)
-            
-        pygame.display.flip()
+            sprites.append(('info_panel', [self.info_panel.get_rect()], self.info_text,
+                            lambda screen: self.info_panel.draw(screen, self.info_text)))
+        
+        # Frame profiler HUD above everything
+        if self.profiler.visible:
+            sprites.append(('profiler', [self.profiler.get_rect()], self.profiler.hud_version,
+                            self.profiler.draw))
+        return sprites
+    
+    def render(self):
+        # The pre-rendered sky and grassland sit underneath everything
+        grass_y = self.get_grass_y() if self.earth_clicked else None
+        background = self.background.get_surface(grass_y)
+        
+        # Time each element's draw separately for the profiler
+        sprites = [(key, rects, state, self.profiler.timed('draw ' + key, draw))
+                   for key, rects, state, draw in self.get_sprites()]
+        
+        # Repaint only what changed and push just those regions to the display
+        dirty_rects = self.compositor.render(self.screen, background, sprites)
+        if dirty_rects:
+            with self.profiler.measure('display.update'):
+                pygame.display.update(dirty_rects)
+            self.assets.frame_shown()
+        
+        # Animation frames of entities no longer drawn can be released
+        get_animation_cache().end_frame()
+    
+    def step(self, elapsed=None, render=True):
+        """Advance the scene by one rendered frame: input, simulation, drawing
+        
+        With elapsed (seconds of wall time) the simulation runs as many fixed
+        steps as that time covers and drawing is interpolated between the
+        last two. Without it exactly one step runs and the exact state is
+        drawn, which keeps headless runs deterministic. Without render the
+        frame is simulated but not drawn, for seeking ahead quickly.
+        """
+        self.profiler.begin_frame()
+        if not self.assets.loaded:
+            self.assets.poll()
+        with self.profiler.measure('handle_events'):
+            self.handle_events()
+        
+        steps = 1 if elapsed is None else self.sim_clock.advance(elapsed)
+        with self.profiler.measure('update'):
+            for _ in range(steps):
+                self.interpolator.snapshot()
+                self.update()
+        
+        # Take in tiles decoded since the last frame, once per frame
+        if self.tile_map:
+            with self.profiler.measure('tiles'):
+                self.tile_map.update(self.wait_for_tiles)
+        
+        if render:
+            with self.profiler.measure('render'):
+                if elapsed is not None:
+                    self.interpolator.apply(self.sim_clock.alpha)
+                try:
+                    self.render()
+                finally:
+                    self.interpolator.restore()
+        
+        if self.recorder:
+            self.recorder.end_frame(elapsed, self.get_checksum())
+    
+    def get_checksum(self):
+        """Return a CRC of the simulation state, for checking that a replay matches"""
+        state = [self.earth.angle, self.earth_clicked, self.show_info_panel, self.info_text,
+                 self.slider_handle_x, self.slider_dragging, self.profiler.visible]
+        if self.earth_clicked:
+            state += [self.satellite.x, self.satellite.y, self.satellite.angle,
+                      self.car.x, self.car.fix_x, self.car.fix_report,
+                      self.mobile.screen_pulse, self.mobile.notification_blink,
+                      self.radiation_waves.wave_timer, self.connection_lines.pulse_offset]
+        if self.orbits:
+            state.append(self.orbits.get_state())
+        if self.tile_map:
+            state.append(self.tile_map.get_state()[:3])  # The loaded-tile count depends on timing
+        checksum = zlib.crc32(repr(state).encode())
+        if self.fleet:
+            checksum = zlib.crc32(self.fleet.get_state(), checksum)
+        return checksum
     
     def run(self):
         while self.running:
-            self.handle_events()
-            self.update()
-            self.render()
-            self.clock.tick(FPS)
+            elapsed = self.clock.tick(FPS) / 1000.0
+            self.step(elapsed)
         
+        if self.recorder:
+            self.recorder.close()
+        if self.tile_map:
+            self.tile_map.close()
         pygame.quit()
         sys.exit()
 
 if __name__ == "__main__":
-    game = Game()
+    parser = argparse.ArgumentParser(description="Interactive Earth scene")
+    parser.add_argument("--fleet", type=int, default=0, metavar="N",
+                        help="add a traffic fleet of N cars to the grassland")
+    parser.add_argument("--constellation", choices=sorted(CONSTELLATIONS),
+                        help="fly a satellite constellation across the sky")
+    parser.add_argument("--tiles", metavar="PATH",
+                        help="draw map tiles from a tile directory or .mbtiles file on the ground")
+    parser.add_argument("--record", metavar="PATH",
+                        help="record the session's input to PATH for replay.py")
+    args = parser.parse_args()
+    game = Game(fleet_size=args.fleet, constellation=args.constellation, tiles=args.tiles)
+    if args.record:
+        game.recorder = InputRecorder(args.record, args.fleet, args.constellation, args.tiles)
     game.run()
@@ -1,5 +1,7 @@
 import pygame
 import math
+import numpy as np
+from animation_cache import get_animation_cache
 
 class Mobile:
     def __init__(self, x, y):
@@ -27,6 +29,14 @@ class Mobile:
         self.pulse_speed = 0.08
         self.notification_blink = 0
         
+        # One pulse cycle is played back from this many cached frames
+        self.animation_frames = round(2 * math.pi / self.pulse_speed)
+        
+        # Static artwork layers, rendered once and rebuilt when size or colors change
+        self.sprites = None
+        self.sprite_key = None
+        self.sprite_origin = (0, 0)
+        
     def update(self):
         """Update mobile phone animations"""
         self.screen_pulse += self.pulse_speed
@@ -38,64 +48,108 @@ class Mobile:
             self.notification_blink = 0
     
     def draw(self, screen):
-        """Draw the realistic mobile phone with detailed features"""
+        """Draw the phone from the cached frame nearest its screen pulse"""
+        led_on = math.sin(self.notification_blink) > 0.5
+        key = (self, 'pulse', led_on, self.get_sprite_key())
+        frame = get_animation_cache().get_frame(key, self.screen_pulse,
+                                                lambda pulse: self.render_frame(pulse, led_on),
+                                                2 * math.pi, self.animation_frames)
+        origin_x, origin_y = self.sprite_origin
+        screen.blit(frame, (int(self.x) - origin_x, int(self.y) - origin_y))
+    
+    def render_frame(self, pulse, led_on):
+        """Composite the static layers and animated parts into one frame"""
+        layers = self.get_sprites()
+        x, y = self.sprite_origin
+        active_screen = self.get_active_screen_rect(x, y)
+        
+        # Static layers sandwich the animated screen glow and signal bars
+        frame = pygame.Surface(layers['body'].get_size(), pygame.SRCALPHA)
+        frame.blit(layers['body'], (0, 0))
+        self.draw_screen_glow(frame, active_screen, pulse)
+        frame.blit(layers['screen'], (0, 0))
+        self.draw_signal_bars(frame, active_screen, pulse)
+        if led_on:
+            self.draw_notification_led(frame, x, y)
+        frame.blit(layers['front'], (0, 0))
+        
+        if pygame.display.get_surface() is not None:
+            frame = frame.convert_alpha()
+        return frame
+    
+    def get_sprite_key(self):
+        """Return everything the baked artwork depends on"""
+        return (self.width, self.height, self.phone_black, self.phone_edge, self.screen_dark,
+                self.screen_bright, self.button_silver, self.button_dark, self.signal_green, self.signal_fade,
+                self.camera_black, self.camera_ring, self.speaker_dark)
+    
+    def get_sprites(self):
+        """Return the static layers, rendering them again only if size or palette changed"""
+        key = self.get_sprite_key()
+        if key != self.sprite_key:
+            self.sprites = self.create_sprites()
+            self.sprite_key = key
+        return self.sprites
+    
+    def create_sprites(self):
+        """Render the static artwork once into layers the size of get_rect()"""
+        # Phone center within the layers, matching the offsets in get_rect()
+        self.sprite_origin = (self.width//2 + 3, self.height//2 + 1)
+        x, y = self.sprite_origin
+        active_screen = self.get_active_screen_rect(x, y)
+        
+        layers = {}
+        for name in ('body', 'screen', 'front'):
+            layers[name] = pygame.Surface((self.width + 6, self.height + 4), pygame.SRCALPHA)
+        self.draw_body(layers['body'], x, y)
+        self.draw_screen_content(layers['screen'], active_screen)
+        self.draw_wifi(layers['front'], active_screen)
+        self.draw_camera(layers['front'], x, y)
+        self.draw_speaker(layers['front'], x, y)
+        self.draw_buttons(layers['front'], x, y)
+        
+        if pygame.display.get_surface() is not None:
+            layers = {name: layer.convert_alpha() for name, layer in layers.items()}
+        return layers
+    
+    def draw_body(self, screen, x, y):
+        """Draw the phone body and the screen bezel"""
         # Draw phone shadow for depth
-        shadow_rect = pygame.Rect(self.x - self.width//2 + 2, self.y - self.height//2 + 2,
+        shadow_rect = pygame.Rect(x - self.width//2 + 2, y - self.height//2 + 2,
                                  self.width, self.height)
         pygame.draw.rect(screen, (10, 10, 10), shadow_rect, border_radius=8)
         
         # Draw phone body with rounded corners
-        phone_rect = pygame.Rect(self.x - self.width//2, self.y - self.height//2,
+        phone_rect = pygame.Rect(x - self.width//2, y - self.height//2,
                                 self.width, self.height)
         pygame.draw.rect(screen, self.phone_black, phone_rect, border_radius=8)
         
         # Draw phone edge highlight for 3D effect
-        edge_rect = pygame.Rect(self.x - self.width//2 + 1, self.y - self.height//2 + 1,
+        edge_rect = pygame.Rect(x - self.width//2 + 1, y - self.height//2 + 1,
                                self.width - 2, self.height - 2)
         pygame.draw.rect(screen, self.phone_edge, edge_rect, 1, border_radius=7)
         
-        # Draw detailed screen
-        self.draw_screen(screen)
-        
-        # Draw camera module
-        self.draw_camera(screen)
-        
-        # Draw speaker grille
-        self.draw_speaker(screen)
-        
-        # Draw home button
-        button_y = self.y + self.height//2 - 8
-        pygame.draw.circle(screen, self.button_dark, (int(self.x + 1), int(button_y + 1)), 5)
-        pygame.draw.circle(screen, self.button_silver, (int(self.x), int(button_y)), 5)
-        pygame.draw.circle(screen, (255, 255, 255), (int(self.x), int(button_y)), 3)
-        pygame.draw.circle(screen, self.button_dark, (int(self.x), int(button_y)), 5, 1)
-        
-        # Draw side buttons (volume, power)
-        # Volume buttons
-        pygame.draw.rect(screen, self.phone_edge, 
-                        (self.x - self.width//2 - 2, self.y - 10, 2, 8))
-        pygame.draw.rect(screen, self.phone_edge, 
-                        (self.x - self.width//2 - 2, self.y, 2, 8))
-        
-        # Power button
-        pygame.draw.rect(screen, self.phone_edge, 
-                        (self.x + self.width//2, self.y - 8, 2, 12))
-    
-    def draw_screen(self, screen):
-        """Draw detailed phone screen with realistic display"""
         # Screen bezel
-        screen_rect = pygame.Rect(self.x - self.width//2 + 4, self.y - self.height//2 + 12,
-                                 self.width - 8, self.height - 24)
-        pygame.draw.rect(screen, self.screen_dark, screen_rect, border_radius=4)
-        
-        # Active screen area with subtle pulsing
-        screen_brightness = int(40 + 20 * math.sin(self.screen_pulse))
+        pygame.draw.rect(screen, self.screen_dark, self.get_bezel_rect(x, y), border_radius=4)
+    
+    def get_bezel_rect(self, x, y):
+        """Return the screen bezel of a phone centered on (x, y)"""
+        return pygame.Rect(x - self.width//2 + 4, y - self.height//2 + 12,
+                           self.width - 8, self.height - 24)
+    
+    def get_active_screen_rect(self, x, y):
+        """Return the lit display area inside the bezel"""
+        bezel = self.get_bezel_rect(x, y)
+        return pygame.Rect(bezel.x + 1, bezel.y + 1, bezel.width - 2, bezel.height - 2)
+    
+    def draw_screen_glow(self, screen, active_screen, pulse):
+        """Fill the display with its brightness at a pulse phase"""
+        screen_brightness = int(40 + 20 * math.sin(pulse))
         screen_color = (screen_brightness, screen_brightness, min(255, screen_brightness + 80))
-        
-        active_screen = pygame.Rect(screen_rect.x + 1, screen_rect.y + 1,
-                                   screen_rect.width - 2, screen_rect.height - 2)
         pygame.draw.rect(screen, screen_color, active_screen, border_radius=3)
-        
+    
+    def draw_screen_content(self, screen, active_screen):
+        """Draw the display's static content: reflection, status bar and app icons"""
         # Screen highlights and reflections
         highlight_rect = pygame.Rect(active_screen.x + 2, active_screen.y + 2,
                                     active_screen.width - 4, 4)
@@ -113,19 +167,36 @@ class Mobile:
                 icon_y = active_screen.y + 12 + i * 8
                 icon_color = [(0, 150, 255), (255, 100, 0), (0, 200, 50), (200, 0, 150)][j]
                 pygame.draw.rect(screen, icon_color, (icon_x, icon_y, 4, 4), border_radius=1)
+    
+    def draw_notification_led(self, screen, x, y):
+        """Draw the lit notification LED"""
+        pygame.draw.circle(screen, (0, 255, 0), 
+                         (int(x + 8), int(y - self.height//2 + 8)), 2)
+    
+    def draw_buttons(self, screen, x, y):
+        """Draw the home button and the side buttons"""
+        # Draw home button
+        button_y = y + self.height//2 - 8
+        pygame.draw.circle(screen, self.button_dark, (int(x + 1), int(button_y + 1)), 5)
+        pygame.draw.circle(screen, self.button_silver, (int(x), int(button_y)), 5)
+        pygame.draw.circle(screen, (255, 255, 255), (int(x), int(button_y)), 3)
+        pygame.draw.circle(screen, self.button_dark, (int(x), int(button_y)), 5, 1)
         
-        # Signal bars
-        self.draw_signal_bars(screen, active_screen)
+        # Draw side buttons (volume, power)
+        # Volume buttons
+        pygame.draw.rect(screen, self.phone_edge, 
+                        (x - self.width//2 - 2, y - 10, 2, 8))
+        pygame.draw.rect(screen, self.phone_edge, 
+                        (x - self.width//2 - 2, y, 2, 8))
         
-        # Notification LED
-        if math.sin(self.notification_blink) > 0.5:
-            pygame.draw.circle(screen, (0, 255, 0), 
-                             (int(self.x + 8), int(self.y - self.height//2 + 8)), 2)
+        # Power button
+        pygame.draw.rect(screen, self.phone_edge, 
+                        (x + self.width//2, y - 8, 2, 12))
     
-    def draw_camera(self, screen):
+    def draw_camera(self, screen, x, y):
         """Draw realistic camera module"""
-        camera_x = self.x + 8
-        camera_y = self.y - self.height//2 + 8
+        camera_x = x + 8
+        camera_y = y - self.height//2 + 8
         
         # Camera module housing
         pygame.draw.circle(screen, self.camera_ring, (int(camera_x), int(camera_y)), 6)
@@ -143,29 +214,28 @@ class Mobile:
         pygame.draw.circle(screen, (255, 255, 200), 
                           (int(camera_x - 8), int(camera_y)), 2)
     
-    def draw_speaker(self, screen):
+    def draw_speaker(self, screen, x, y):
         """Draw speaker grille with realistic holes"""
-        speaker_y = self.y - self.height//2 + 6
-        speaker_rect = pygame.Rect(self.x - 8, speaker_y - 1, 16, 2)
+        speaker_y = y - self.height//2 + 6
+        speaker_rect = pygame.Rect(x - 8, speaker_y - 1, 16, 2)
         pygame.draw.rect(screen, self.speaker_dark, speaker_rect, border_radius=1)
         
         # Speaker holes
         for i in range(8):
-            hole_x = self.x - 7 + i * 2
+            hole_x = x - 7 + i * 2
             pygame.draw.circle(screen, self.phone_black, (int(hole_x), int(speaker_y)), 1)
 
-    def draw_signal_bars(self, screen, screen_rect):
+    def draw_signal_bars(self, screen, screen_rect, pulse):
         """Draw realistic animated signal strength bars"""
         bar_x = screen_rect.x + screen_rect.width - 20
         bar_y = screen_rect.y + 3
         
-        # Draw 4 signal bars with realistic animation
-        for i in range(4):
-            bar_height = (i + 1) * 2
-            # Add subtle pulsing effect with different phases
-            pulse_factor = 1 + 0.1 * math.sin(self.screen_pulse + i * 0.5)
-            animated_height = max(1, int(bar_height * pulse_factor))
-            
+        # Draw 4 signal bars with realistic animation; the subtle pulsing,
+        # with a different phase per bar, is computed for all bars at once
+        bar_heights = np.arange(1, 5) * 2
+        pulse_factors = 1 + 0.1 * np.sin(pulse + np.arange(4) * 0.5)
+        animated_heights = np.maximum(1, (bar_heights * pulse_factors).astype(int)).tolist()
+        for i, animated_height in enumerate(animated_heights):
             # Signal strength color based on bars
             if i < 2:
                 color = self.signal_fade
@@ -175,16 +245,22 @@ class Mobile:
             pygame.draw.rect(screen, color,
                            (bar_x + i * 3, bar_y + (6 - animated_height), 
                             2, animated_height))
-        
-        # WiFi symbol
-        wifi_x = bar_x - 8
-        wifi_y = bar_y + 2
+    
+    def draw_wifi(self, screen, screen_rect):
+        """Draw the WiFi symbol beside the signal bars"""
+        wifi_x = screen_rect.x + screen_rect.width - 28
+        wifi_y = screen_rect.y + 5
         for i in range(3):
             radius = (i + 1) * 2
             pygame.draw.arc(screen, self.signal_green,
                            (wifi_x - radius, wifi_y - radius, radius * 2, radius * 2),
                            -math.pi/4, math.pi/4, 1)
     
+    def get_rect(self):
+        """Return the screen area covered by the phone, side buttons and shadow included"""
+        return pygame.Rect(self.x - self.width//2 - 3, self.y - self.height//2 - 1,
+                           self.width + 6, self.height + 4)
+    
     def is_clicked(self, pos):
         """Check if mobile phone was clicked"""
         mouse_x, mouse_y = pos
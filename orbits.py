@@ -0,0 +1,268 @@
+import math
+import pygame
+import numpy as np
+
+MU_EARTH = 398600.4418         # Gravitational parameter, km^3/s^2
+EARTH_RADIUS = 6378.137        # Equatorial radius, km
+J2 = 1.08262668e-3             # Earth's oblateness coefficient
+EARTH_ROTATION = 7.2921150e-5  # Sidereal rotation rate, rad/s
+
+# Walker-delta presets: (satellites, planes, phasing, altitude km, inclination deg)
+CONSTELLATIONS = {
+    'gps': (24, 6, 1, 20180.0, 55.0),
+    'galileo': (24, 3, 1, 23222.0, 56.0),
+    'starlink': (1584, 72, 17, 550.0, 53.0),
+}
+
+class Constellation:
+    """Keplerian orbits of many satellites, propagated together with NumPy.
+
+    Elements are stored as one array per element. Propagation adds the
+    secular drift J2 causes in the node, perigee and mean anomaly, solves
+    Kepler's equation for every satellite at once and returns Earth-
+    centered inertial positions in km.
+    """
+
+    def __init__(self, semi_major_axis, eccentricity, inclination, raan, arg_perigee, mean_anomaly):
+        self.semi_major_axis = np.asarray(semi_major_axis, dtype=float)  # km
+        self.eccentricity = np.asarray(eccentricity, dtype=float)
+        self.inclination = np.asarray(inclination, dtype=float)          # Angles in radians
+        self.raan = np.asarray(raan, dtype=float)
+        self.arg_perigee = np.asarray(arg_perigee, dtype=float)
+        self.mean_anomaly = np.asarray(mean_anomaly, dtype=float)        # At time 0
+
+        # Mean motion and the J2 secular rates, fixed for each orbit
+        a, e, i = self.semi_major_axis, self.eccentricity, self.inclination
+        self.mean_motion = np.sqrt(MU_EARTH / a ** 3)
+        p = a * (1 - e ** 2)
+        factor = 1.5 * self.mean_motion * J2 * (EARTH_RADIUS / p) ** 2
+        cos_i = np.cos(i)
+        self.raan_rate = -factor * cos_i
+        self.perigee_rate = 0.5 * factor * (5 * cos_i ** 2 - 1)
+        self.anomaly_rate = self.mean_motion + 0.5 * factor * np.sqrt(1 - e ** 2) * (3 * cos_i ** 2 - 1)
+
+        self.time = 0.0
+        self.positions = self.propagate(0.0)
+
+    @classmethod
+    def walker(cls, total, planes, phasing, altitude, inclination, eccentricity=0.0):
+        """Build a Walker-delta constellation total/planes/phasing at an altitude in km"""
+        per_plane = total // planes
+        plane = np.repeat(np.arange(planes), per_plane)
+        slot = np.tile(np.arange(per_plane), planes)
+        count = len(plane)
+        raan = plane * (2 * math.pi / planes)
+        anomaly = slot * (2 * math.pi / per_plane) + plane * (2 * math.pi * phasing / (planes * per_plane))
+        return cls(np.full(count, EARTH_RADIUS + altitude), np.full(count, eccentricity),
+                   np.full(count, math.radians(inclination)), raan, np.zeros(count), anomaly)
+
+    @classmethod
+    def from_name(cls, name):
+        """Build one of the preset constellations"""
+        return cls.walker(*CONSTELLATIONS[name])
+
+    def __len__(self):
+        return len(self.semi_major_axis)
+
+    @staticmethod
+    def solve_kepler(mean_anomaly, eccentricity, iterations=8, tolerance=1e-12):
+        """Solve M = E - e sin E for the eccentric anomaly E by Newton's method"""
+        anomaly = mean_anomaly.copy()
+        if not eccentricity.any():
+            return anomaly  # Circular orbits: E equals M
+        for _ in range(iterations):
+            correction = ((anomaly - eccentricity * np.sin(anomaly) - mean_anomaly) /
+                          (1 - eccentricity * np.cos(anomaly)))
+            anomaly -= correction
+            if np.abs(correction).max() < tolerance:
+                break
+        return anomaly
+
+    def propagate(self, time):
+        """Return the inertial positions (N, 3) in km at time seconds"""
+        e = self.eccentricity
+        mean_anomaly = np.mod(self.mean_anomaly + self.anomaly_rate * time, 2 * math.pi)
+        eccentric = self.solve_kepler(mean_anomaly, e)
+
+        # Position in the orbital plane
+        radius = self.semi_major_axis * (1 - e * np.cos(eccentric))
+        true_anomaly = 2 * np.arctan2(np.sqrt(1 + e) * np.sin(eccentric / 2),
+                                      np.sqrt(1 - e) * np.cos(eccentric / 2))
+
+        # Rotate by argument of latitude, inclination and node
+        raan = self.raan + self.raan_rate * time
+        latitude_arg = self.arg_perigee + self.perigee_rate * time + true_anomaly
+        cos_u, sin_u = np.cos(latitude_arg), np.sin(latitude_arg)
+        cos_raan, sin_raan = np.cos(raan), np.sin(raan)
+        cos_i, sin_i = np.cos(self.inclination), np.sin(self.inclination)
+
+        positions = np.empty((len(self), 3))
+        positions[:, 0] = radius * (cos_raan * cos_u - sin_raan * sin_u * cos_i)
+        positions[:, 1] = radius * (sin_raan * cos_u + cos_raan * sin_u * cos_i)
+        positions[:, 2] = radius * sin_u * sin_i
+        return positions
+
+    def advance(self, seconds):
+        """Move the constellation forward in time; return the new inertial positions"""
+        self.time += seconds
+        self.positions = self.propagate(self.time)
+        return self.positions
+
+    def earth_fixed(self, positions=None, time=None):
+        """Return positions rotated into the Earth-fixed frame"""
+        positions = self.positions if positions is None else positions
+        theta = EARTH_ROTATION * (self.time if time is None else time)
+        cos_t, sin_t = math.cos(theta), math.sin(theta)
+        fixed = np.empty_like(positions)
+        fixed[:, 0] = cos_t * positions[:, 0] + sin_t * positions[:, 1]
+        fixed[:, 1] = -sin_t * positions[:, 0] + cos_t * positions[:, 1]
+        fixed[:, 2] = positions[:, 2]
+        return fixed
+
+def geodetic_to_ecef(latitude, longitude, altitude=0.0):
+    """Return Earth-fixed km coordinates of points on a spherical Earth"""
+    latitude, longitude = np.radians(latitude), np.radians(longitude)
+    radius = EARTH_RADIUS + np.asarray(altitude, dtype=float)
+    return np.stack([radius * np.cos(latitude) * np.cos(longitude),
+                     radius * np.cos(latitude) * np.sin(longitude),
+                     radius * np.sin(latitude)], axis=-1)
+
+def enu_basis(latitude, longitude):
+    """Return the 3x3 matrix whose rows are the local east, north and up directions"""
+    lat, lon = math.radians(latitude), math.radians(longitude)
+    return np.array([
+        [-math.sin(lon), math.cos(lon), 0.0],
+        [-math.sin(lat) * math.cos(lon), -math.sin(lat) * math.sin(lon), math.cos(lat)],
+        [math.cos(lat) * math.cos(lon), math.cos(lat) * math.sin(lon), math.sin(lat)],
+    ])
+
+class SkyProjection:
+    """Maps satellites onto the scene as seen by one ground observer.
+
+    The scene is a side view of the sky: a satellite's east-west direction
+    sets its x and its elevation above the horizon sets its y, so overhead
+    satellites are drawn at the top and setting ones sink to the ground.
+    """
+
+    def __init__(self, latitude, longitude, center_x, horizon_y, half_width, sky_height, ground_scale=1.0):
+        self.latitude = latitude
+        self.longitude = longitude
+        self.observer = geodetic_to_ecef(latitude, longitude)
+        self.basis = enu_basis(latitude, longitude)
+        self.center_x = center_x
+        self.horizon_y = horizon_y
+        self.half_width = half_width
+        self.sky_height = sky_height
+        self.ground_scale = ground_scale  # km of ground per scene pixel, east-west
+
+    def ground_points(self, xs):
+        """Return Earth-fixed positions (N, 3) in km of scene x coordinates on the ground"""
+        east = (np.asarray(xs, dtype=float) - self.center_x) * self.ground_scale
+        longitude = self.longitude + np.degrees(east / (EARTH_RADIUS * math.cos(math.radians(self.latitude))))
+        return geodetic_to_ecef(np.full(len(east), self.latitude), longitude)
+
+    def scene_x(self, positions):
+        """Return the scene x of Earth-fixed positions (N, 3), the inverse of ground_points"""
+        longitude = np.degrees(np.arctan2(positions[:, 1], positions[:, 0]))
+        offset = np.radians((longitude - self.longitude + 180) % 360 - 180)
+        east = offset * EARTH_RADIUS * math.cos(math.radians(self.latitude))
+        return self.center_x + east / self.ground_scale
+
+    def look_angles(self, fixed_positions):
+        """Return unit east/north/up look directions (N, 3) and ranges in km"""
+        offsets = fixed_positions - self.observer
+        ranges = np.sqrt(np.einsum('ij,ij->i', offsets, offsets))
+        directions = offsets @ self.basis.T / ranges[:, None]
+        return directions, ranges
+
+    def project(self, fixed_positions):
+        """Return scene points (N, 2) and elevations in radians"""
+        directions, ranges = self.look_angles(fixed_positions)
+        elevation = np.arcsin(np.clip(directions[:, 2], -1, 1))
+        points = np.empty((len(directions), 2))
+        points[:, 0] = self.center_x + directions[:, 0] * self.half_width
+        points[:, 1] = self.horizon_y - directions[:, 2] * self.sky_height
+        return points, elevation
+
+class OrbitLayer:
+    """Propagates a constellation each step, draws it and drives Satellite sprites.
+
+    Every satellite above the horizon is drawn as a small dot in one batched
+    blit. Attached Satellite renderables are moved to the scene position of
+    their orbit; one attached without an index follows whichever satellite
+    is highest and switches to a new one when it sets.
+    """
+
+    def __init__(self, constellation, projection, time_scale=10.0, min_elevation=0.0):
+        self.constellation = constellation
+        self.projection = projection
+        self.time_scale = time_scale              # Orbit seconds per simulation step
+        self.min_elevation = math.radians(min_elevation)
+        self.attached = []                        # [renderable, index, follow_highest]
+
+        self.dot_color = (25, 25, 112)      # Midnight blue against the sky
+        self.dot_radius = 2
+        self.dot = pygame.Surface((self.dot_radius * 2 + 1, self.dot_radius * 2 + 1), pygame.SRCALPHA)
+        pygame.draw.circle(self.dot, self.dot_color, (self.dot_radius, self.dot_radius), self.dot_radius)
+        if pygame.display.get_surface() is not None:
+            self.dot = self.dot.convert_alpha()
+
+        self.project()
+
+    def project(self):
+        """Recompute scene points, elevations and visibility for the current time"""
+        self.fixed_positions = self.constellation.earth_fixed()
+        self.points, self.elevations = self.projection.project(self.fixed_positions)
+        self.visible = self.elevations > self.min_elevation
+
+    def update(self):
+        """Advance every orbit one simulation step and move attached renderables"""
+        self.constellation.advance(self.time_scale)
+        self.project()
+        for attachment in self.attached:
+            renderable, index, follow_highest = attachment
+            if follow_highest and (index is None or not self.visible[index]):
+                attachment[1] = index = self.highest()
+            if index is not None:
+                self.place(renderable, index)
+
+    def attach(self, renderable, index=None):
+        """Drive a renderable's x and y from one orbit, or from the highest satellite
+
+        While no satellite is above the elevation mask, a renderable
+        following the highest one stays where it is.
+        """
+        follow_highest = index is None
+        if follow_highest:
+            index = self.highest()
+        self.attached.append([renderable, index, follow_highest])
+        if index is not None:
+            self.place(renderable, index)
+
+    def highest(self):
+        """Return the index of the satellite highest above the horizon, or None if none is visible"""
+        if not self.visible.any():
+            return None
+        return int(np.argmax(self.elevations))
+
+    def place(self, renderable, index):
+        x, y = self.points[index]
+        renderable.x, renderable.y = int(round(x)), int(round(y))
+
+    def draw(self, screen):
+        """Draw every visible satellite as a dot"""
+        points = self.points[self.visible] - self.dot_radius
+        screen.blits([(self.dot, point) for point in points.astype(int).tolist()], False)
+
+    def get_state(self):
+        """Return a value that changes whenever the satellites moved"""
+        return self.constellation.time
+
+    def get_rect(self):
+        """Return the screen area of the sky above the horizon"""
+        projection = self.projection
+        margin = self.dot_radius + 1
+        return pygame.Rect(int(projection.center_x - projection.half_width) - margin,
+                           int(projection.horizon_y - projection.sky_height) - margin,
+                           int(projection.half_width * 2) + margin * 2 + 1,
+                           int(projection.sky_height) + margin * 2 + 1)
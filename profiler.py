@@ -0,0 +1,135 @@
+import pygame
+import time
+import csv
+from collections import deque
+from contextlib import contextmanager
+import numpy as np
+from text import get_text_renderer
+
+class FrameProfiler:
+    """Per-frame timings for each stage of the game loop.
+
+    Every frame records the wall time since the previous frame plus the
+    time spent in each named section. Samples live in a fixed-size ring
+    buffer so the last few seconds are always available, either on the
+    HUD or dumped to CSV after a stutter.
+    """
+
+    def __init__(self, capacity=600):
+        self.samples = deque(maxlen=capacity)  # Ring buffer of per-frame dicts
+        self.sections = []                     # Section names in first-seen order
+        self.current = None
+        self.frame_start = None
+        self.frame_index = 0
+
+        # HUD state
+        self.visible = False
+        self.x = 10
+        self.y = 10
+        self.width = 280
+        self.line_height = 16
+        self.refresh_interval = 15  # Frames between HUD text updates
+        self.hud_lines = []
+        self.hud_version = 0
+
+        self.bg_color = (0, 0, 0, 170)
+        self.text_color = (230, 230, 230)
+        self.warn_color = (255, 120, 80)
+        self.frame_budget_ms = 1000.0 / 60
+        self.font_size = 18
+
+    def begin_frame(self):
+        """Start timing a new frame"""
+        now = time.perf_counter()
+        if self.current is not None:
+            # Frame time is the full interval, including any clock.tick sleep
+            self.current['frame'] = (now - self.frame_start) * 1000
+            self.samples.append(self.current)
+            self.frame_index += 1
+            if self.visible and self.frame_index % self.refresh_interval == 0:
+                self.refresh_hud()
+        self.frame_start = now
+        self.current = {'index': self.frame_index}
+
+    @contextmanager
+    def measure(self, name):
+        """Time the enclosed block as one section of the current frame"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_time(name, (time.perf_counter() - start) * 1000)
+
+    def timed(self, name, func):
+        """Wrap a callable so each call is recorded under the given section"""
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.add_time(name, (time.perf_counter() - start) * 1000)
+        return wrapper
+
+    def add_time(self, name, milliseconds):
+        """Accumulate milliseconds into a section of the current frame"""
+        if self.current is None:
+            return
+        if name not in self.sections:
+            self.sections.append(name)
+        self.current[name] = self.current.get(name, 0.0) + milliseconds
+
+    def percentiles(self, name, percents=(50, 95, 99)):
+        """Return the requested percentiles of a section over the ring buffer"""
+        values = [sample.get(name, 0.0) for sample in self.samples if 'frame' in sample]
+        if not values:
+            return [0.0 for _ in percents]
+        return list(np.percentile(values, percents))
+
+    def toggle(self):
+        """Show or hide the HUD"""
+        self.visible = not self.visible
+        if self.visible:
+            self.refresh_hud()
+
+    def refresh_hud(self):
+        """Recompute the HUD text from the ring buffer"""
+        p50, p95, p99 = self.percentiles('frame')
+        lines = [(f"frame  p50 {p50:5.1f}  p95 {p95:5.1f}  p99 {p99:5.1f} ms",
+                  self.warn_color if p95 > self.frame_budget_ms else self.text_color)]
+        for name in self.sections:
+            mean = self.percentiles(name, (50,))[0]
+            peak = self.percentiles(name, (99,))[0]
+            lines.append((f"{name:<22} {mean:6.2f} / {peak:6.2f} ms", self.text_color))
+        lines.append((f"F3 hide  F4 dump CSV  ({len(self.samples)} frames)", self.text_color))
+        self.hud_lines = lines
+        self.hud_version += 1
+
+    def get_rect(self):
+        """Return the screen area covered by the HUD"""
+        height = self.line_height * max(1, len(self.hud_lines)) + 10
+        return pygame.Rect(self.x, self.y, self.width, height)
+
+    def draw(self, screen):
+        """Draw the HUD panel with the latest timing summary"""
+        rect = self.get_rect()
+        panel = pygame.Surface(rect.size, pygame.SRCALPHA)
+        panel.fill(self.bg_color)
+        screen.blit(panel, rect)
+
+        renderer = get_text_renderer()
+        screen.blits([(renderer.render(text, self.font_size, color),
+                       (rect.x + 6, rect.y + 5 + i * self.line_height))
+                      for i, (text, color) in enumerate(self.hud_lines)], False)
+
+    def export_csv(self, path=None):
+        """Write every sample in the ring buffer to a CSV file; return its path"""
+        if path is None:
+            path = time.strftime("profile_%Y%m%d_%H%M%S.csv")
+        columns = ['index', 'frame'] + self.sections
+        with open(path, 'w', newline='') as csv_file:
+            writer = csv.writer(csv_file)
+            writer.writerow(columns)
+            for sample in self.samples:
+                writer.writerow([sample.get(column, 0.0) for column in columns])
+        print(f"Wrote {len(self.samples)} frame samples to {path}")
+        return path
@@ -0,0 +1,202 @@
+"""Record a session's input and replay it deterministically without a display.
+
+Usage:
+    python main.py --record session.replay
+    python replay.py session.replay
+    python replay.py session.replay --output frames/
+
+A recording holds every input event the game handled, each frame's wall
+time step and a checksum of the simulation state after the frame. Replay
+feeds the same events and time steps into a headless Game as fast as the
+CPU allows and reports the first frame whose state differs, so a recorded
+bug report can be reproduced exactly and a recording doubles as a
+repeatable performance workload.
+"""
+import os
+import sys
+import math
+import time
+import struct
+import argparse
+import pygame
+
+REPLAY_MAGIC = b"DMRP"
+REPLAY_VERSION = 1
+
+HEADER = struct.Struct("<4sHI16sH")  # magic, version, fleet size, constellation, tiles path length
+FRAME = struct.Struct("<BdI")        # tag 0, elapsed seconds (NaN for a fixed step), state checksum
+EVENT = struct.Struct("<Bihh")       # event tag, button/key/wheel steps, x, y
+
+# Record tags; 0 closes a frame, the rest are input events
+FRAME_TAG = 0
+EVENT_TAGS = {
+    pygame.MOUSEBUTTONDOWN: 1,
+    pygame.MOUSEBUTTONUP: 2,
+    pygame.MOUSEMOTION: 3,
+    pygame.KEYDOWN: 4,
+    pygame.MOUSEWHEEL: 5,
+    pygame.QUIT: 6,
+}
+EVENT_TYPES = {tag: event_type for event_type, tag in EVENT_TAGS.items()}
+
+class InputRecorder:
+    """Writes the events a Game handles, frame by frame, to a binary log.
+
+    Mouse motion is only recorded while the slider is being dragged, the
+    only time the game reacts to it; every other handled event is kept.
+    """
+
+    def __init__(self, path, fleet_size=0, constellation=None, tiles=None):
+        self.path = path
+        self.file = open(path, "wb")
+        tiles_path = (tiles or "").encode()
+        self.file.write(HEADER.pack(REPLAY_MAGIC, REPLAY_VERSION, fleet_size,
+                                    (constellation or "").encode(), len(tiles_path)))
+        self.file.write(tiles_path)
+        self.frames = 0
+
+    def record_event(self, event, dragging):
+        """Append one input event of the current frame"""
+        tag = EVENT_TAGS.get(event.type)
+        if tag is None or (event.type == pygame.MOUSEMOTION and not dragging):
+            return
+        if event.type in (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP):
+            value, (x, y) = event.button, event.pos
+        elif event.type == pygame.MOUSEMOTION:
+            value, (x, y) = 0, event.pos
+        elif event.type == pygame.KEYDOWN:
+            value, x, y = event.key, 0, 0
+        elif event.type == pygame.MOUSEWHEEL:
+            # The game zooms around the cursor, so keep where it was
+            value, (x, y) = event.y, pygame.mouse.get_pos()
+        else:
+            value, x, y = 0, 0, 0
+        self.file.write(EVENT.pack(tag, value, x, y))
+
+    def end_frame(self, elapsed, checksum):
+        """Close the current frame with its time step and resulting state checksum"""
+        self.file.write(FRAME.pack(FRAME_TAG, math.nan if elapsed is None else elapsed, checksum))
+        self.frames += 1
+
+    def close(self):
+        self.file.close()
+        print(f"Recorded {self.frames} frames to {self.path}")
+
+class InputLog:
+    """A recording read back as per-frame (events, elapsed, checksum) tuples"""
+
+    def __init__(self, fleet_size, constellation, tiles, frames):
+        self.fleet_size = fleet_size
+        self.constellation = constellation
+        self.tiles = tiles
+        self.frames = frames
+
+    @classmethod
+    def load(cls, path):
+        """Read a recording; a frame cut off by a crash mid-write is dropped"""
+        with open(path, "rb") as log_file:
+            data = log_file.read()
+        magic, version, fleet_size, constellation, tiles_length = HEADER.unpack_from(data, 0)
+        if magic != REPLAY_MAGIC or version != REPLAY_VERSION:
+            raise ValueError(f"{path} is not a replay of a supported version")
+        offset = HEADER.size
+        tiles = data[offset:offset + tiles_length].decode() or None
+        offset += tiles_length
+
+        frames = []
+        events = []
+        while offset < len(data):
+            tag = data[offset]
+            record = FRAME if tag == FRAME_TAG else EVENT
+            if offset + record.size > len(data):
+                break
+            if tag == FRAME_TAG:
+                _, elapsed, checksum = FRAME.unpack_from(data, offset)
+                frames.append((events, None if math.isnan(elapsed) else elapsed, checksum))
+                events = []
+            else:
+                events.append(EVENT.unpack_from(data, offset))
+            offset += record.size
+
+        return cls(fleet_size, constellation.rstrip(b"\0").decode() or None, tiles, frames)
+
+    @staticmethod
+    def create_events(records):
+        """Turn event records back into pygame events"""
+        events = []
+        for tag, value, x, y in records:
+            event_type = EVENT_TYPES[tag]
+            if event_type in (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP):
+                events.append(pygame.event.Event(event_type, button=value, pos=(x, y)))
+            elif event_type == pygame.MOUSEMOTION:
+                events.append(pygame.event.Event(event_type, pos=(x, y), rel=(0, 0), buttons=(1, 0, 0)))
+            elif event_type == pygame.KEYDOWN:
+                events.append(pygame.event.Event(event_type, key=value, mod=0, unicode=""))
+            elif event_type == pygame.MOUSEWHEEL:
+                events.append(pygame.event.Event(event_type, x=0, y=value, flipped=False, pos=(x, y)))
+            else:
+                events.append(pygame.event.Event(event_type))
+        return events
+
+def replay(log, game, output_dir=None, frame_format="png", verify=True):
+    """Play a recording into a game; return (first mismatched frame or None, frames per second)"""
+    from headless import HeadlessRenderer
+    renderer = HeadlessRenderer(game=game)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+
+    mismatch = None
+    start_time = time.perf_counter()
+    for index, (records, elapsed, checksum) in enumerate(log.frames):
+        for event in log.create_events(records):
+            pygame.event.post(event)
+        game.step(elapsed)
+        if verify and mismatch is None and game.get_checksum() != checksum:
+            mismatch = index
+        if output_dir:
+            renderer.write_frame(output_dir, index, frame_format)
+    elapsed_time = time.perf_counter() - start_time
+
+    fps = len(log.frames) / elapsed_time if elapsed_time > 0 else float("inf")
+    return mismatch, fps
+
+def main(argv=None):
+    # The dummy drivers must be selected before main.py initializes pygame
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    from main import Game
+    from profiler import FrameProfiler
+    from headless import FRAME_FORMATS
+
+    parser = argparse.ArgumentParser(description="Replay a recorded session without a display")
+    parser.add_argument("recording", help="file written by main.py --record")
+    parser.add_argument("--output", help="also write every frame to this directory")
+    parser.add_argument("--format", choices=FRAME_FORMATS, default="png", help="frame file format")
+    parser.add_argument("--no-verify", action="store_true", help="skip the per-frame state checks")
+    args = parser.parse_args(argv)
+
+    log = InputLog.load(args.recording)
+    game = Game(fleet_size=log.fleet_size, constellation=log.constellation, tiles=log.tiles)
+    game.wait_for_tiles = True
+    game.profiler = FrameProfiler(capacity=max(1, len(log.frames)))  # Keep every frame's timings
+
+    mismatch, fps = replay(log, game, args.output, args.format, not args.no_verify)
+    print(f"Replayed {len(log.frames)} frames at {fps:.1f} frames/sec")
+    for section in ('update', 'render'):
+        p50, p95, p99 = game.profiler.percentiles(section)
+        print(f"  {section:<8} p50 {p50:6.2f}  p95 {p95:6.2f}  p99 {p99:6.2f} ms")
+
+    if game.tile_map:
+        game.tile_map.close()
+    pygame.quit()
+
+    if args.no_verify:
+        return 0
+    if mismatch is not None:
+        print(f"State diverged from the recording at frame {mismatch}")
+        return 1
+    print("Every frame matched the recording")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,5 +1,7 @@
 import pygame
 import math
+from animation_cache import get_animation_cache
+from geometry import cos_sin, polar_points, rotate_points, segment_grid
 
 class Satellite:
     def __init__(self, x, y):
@@ -10,6 +12,16 @@ class Satellite:
         self.angle = 0
         self.rotation_speed = 1.5  # degrees per frame
         
+        # One rotation is played back from this many cached frames
+        self.animation_frames = round(360 / self.rotation_speed)
+        self.sprite_origin = (80, 55)  # Satellite center within a frame
+        
+        # Thruster, three lights, dish and three rod antenna tips around
+        # the body center before rotation
+        self.hardpoints = polar_points([20, 12, 12, 12, 18, 20, 15, 15],
+                                       [math.pi, -0.3, 0, 0.3, -math.pi/2,
+                                        math.pi/4, -math.pi/4, 3*math.pi/4])
+        
         # Realistic satellite colors
         self.body_silver = (192, 192, 192)    # Silver body
         self.body_dark = (128, 128, 128)      # Dark gray shadows
@@ -28,106 +40,125 @@ class Satellite:
             self.angle = 0
             
     def draw(self, screen):
-        """Draw the realistic rotating satellite"""
-        # Calculate rotation
-        rad_angle = math.radians(self.angle)
+        """Draw the satellite from the cached frame nearest its rotation"""
+        key = (self, 'rotation', self.get_sprite_key())
+        frame = get_animation_cache().get_frame(key, self.angle, self.render_frame,
+                                                360, self.animation_frames)
+        origin_x, origin_y = self.sprite_origin
+        screen.blit(frame, (int(self.x) - origin_x, int(self.y) - origin_y))
+    
+    def get_sprite_key(self):
+        """Return everything the rendered frames depend on"""
+        return (self.width, self.height, self.body_silver, self.body_dark, self.panel_blue,
+                self.panel_light, self.panel_frame, self.antenna_gold, self.antenna_black,
+                self.thruster_red, self.light_blue)
+    
+    def render_frame(self, angle):
+        """Render the satellite at one rotation into a frame the size of get_rect()"""
+        frame = pygame.Surface((160, 110), pygame.SRCALPHA)
+        self.draw_artwork(frame, *self.sprite_origin, angle)
+        if pygame.display.get_surface() is not None:
+            frame = frame.convert_alpha()
+        return frame
+    
+    def draw_artwork(self, screen, x, y, angle):
+        """Draw the realistic satellite centered on (x, y), rotated by angle degrees"""
+        # Rotation from the shared angle tables; every rotating hardpoint
+        # is turned in one batch
+        direction = cos_sin(angle)
+        hardpoints = rotate_points(self.hardpoints, angle, (x, y)).tolist()
+        thruster, lights, dish, rod_tips = hardpoints[0], hardpoints[1:4], hardpoints[4], hardpoints[5:]
         
         # Draw satellite shadow for depth
         shadow_offset = 3
         pygame.draw.rect(screen, self.body_dark, 
-                        (self.x - self.width//2 + shadow_offset, self.y - self.height//2 + shadow_offset, 
+                        (x - self.width//2 + shadow_offset, y - self.height//2 + shadow_offset, 
                          self.width, self.height))
         
         # Draw main satellite body with metallic look
         pygame.draw.rect(screen, self.body_silver, 
-                        (self.x - self.width//2, self.y - self.height//2, 
+                        (x - self.width//2, y - self.height//2, 
                          self.width, self.height))
         
         # Add metallic highlights
         pygame.draw.rect(screen, (220, 220, 220), 
-                        (self.x - self.width//2 + 2, self.y - self.height//2 + 2, 
+                        (x - self.width//2 + 2, y - self.height//2 + 2, 
                          self.width - 4, 3))
         
         # Draw detailed equipment compartments
-        self.draw_equipment_details(screen)
+        self.draw_equipment_details(screen, x, y)
         
         # Draw enhanced solar panels
-        self.draw_solar_panels(screen, rad_angle)
+        self.draw_solar_panels(screen, x, y, direction)
         
         # Draw multiple communication antennas
-        self.draw_antennas(screen, rad_angle)
+        self.draw_antennas(screen, x, y, dish, rod_tips)
         
         # Draw thruster
-        thruster_x = self.x + math.cos(rad_angle + math.pi) * 20
-        thruster_y = self.y + math.sin(rad_angle + math.pi) * 20
+        thruster_x, thruster_y = thruster
         pygame.draw.circle(screen, self.thruster_red, (int(thruster_x), int(thruster_y)), 4)
         pygame.draw.circle(screen, (255, 100, 100), (int(thruster_x), int(thruster_y)), 2)
         
         # Draw communication lights
-        for i, offset in enumerate([-0.3, 0, 0.3]):
-            light_x = self.x + math.cos(rad_angle + offset) * 12
-            light_y = self.y + math.sin(rad_angle + offset) * 12
+        for i, (light_x, light_y) in enumerate(lights):
             color = self.light_blue if i % 2 == 0 else (0, 255, 0)
             pygame.draw.circle(screen, color, (int(light_x), int(light_y)), 2)
         
         # Draw satellite outline
         pygame.draw.rect(screen, self.antenna_black, 
-                        (self.x - self.width//2, self.y - self.height//2, 
+                        (x - self.width//2, y - self.height//2, 
                          self.width, self.height), 2)
     
-    def draw_equipment_details(self, screen):
+    def draw_equipment_details(self, screen, x, y):
         """Draw detailed equipment compartments on the satellite"""
         # Communication equipment box
-        equipment_rect = pygame.Rect(self.x - 8, self.y - 6, 16, 12)
+        equipment_rect = pygame.Rect(x - 8, y - 6, 16, 12)
         pygame.draw.rect(screen, self.body_dark, equipment_rect)
         pygame.draw.rect(screen, self.antenna_black, equipment_rect, 1)
         
         # Small equipment details
         for i in range(3):
             for j in range(2):
-                detail_x = self.x - 6 + i * 4
-                detail_y = self.y - 4 + j * 4
+                detail_x = x - 6 + i * 4
+                detail_y = y - 4 + j * 4
                 pygame.draw.rect(screen, (255, 215, 0), (detail_x, detail_y, 2, 2))
     
-    def draw_antennas(self, screen, angle):
+    def draw_antennas(self, screen, x, y, dish, rod_tips):
         """Draw multiple detailed communication antennas"""
         # Main dish antenna
-        dish_x = self.x + math.cos(angle - math.pi/2) * 18
-        dish_y = self.y + math.sin(angle - math.pi/2) * 18
+        dish_x, dish_y = dish
         pygame.draw.circle(screen, self.antenna_gold, (int(dish_x), int(dish_y)), 8)
         pygame.draw.circle(screen, self.antenna_black, (int(dish_x), int(dish_y)), 8, 2)
         pygame.draw.circle(screen, self.antenna_gold, (int(dish_x), int(dish_y)), 3)
         
         # Support beam
         pygame.draw.line(screen, self.antenna_black, 
-                        (self.x, self.y), (dish_x, dish_y), 2)
+                        (x, y), (dish_x, dish_y), 2)
         
         # Secondary rod antennas
-        for i, offset_angle in enumerate([math.pi/4, -math.pi/4, 3*math.pi/4]):
-            rod_length = 20 if i == 0 else 15
-            rod_tip_x = self.x + math.cos(angle + offset_angle) * rod_length
-            rod_tip_y = self.y + math.sin(angle + offset_angle) * rod_length
+        for rod_tip_x, rod_tip_y in rod_tips:
             pygame.draw.line(screen, self.antenna_gold, 
-                            (self.x, self.y), (rod_tip_x, rod_tip_y), 2)
+                            (x, y), (rod_tip_x, rod_tip_y), 2)
             # Antenna tip
             pygame.draw.circle(screen, self.thruster_red, (int(rod_tip_x), int(rod_tip_y)), 2)
 
-    def draw_solar_panels(self, screen, angle):
+    def draw_solar_panels(self, screen, x, y, direction):
         """Draw realistic rotating solar panels with detailed cells"""
         panel_length = 40
         panel_width = 12
+        cos_a, sin_a = direction
         
         # Left panel
-        left_start_x = self.x - self.width//2 - panel_length * math.cos(angle)
-        left_start_y = self.y - panel_length * math.sin(angle)
-        left_end_x = self.x - self.width//2
-        left_end_y = self.y
+        left_start_x = x - self.width//2 - panel_length * cos_a
+        left_start_y = y - panel_length * sin_a
+        left_end_x = x - self.width//2
+        left_end_y = y
         
         # Right panel
-        right_start_x = self.x + self.width//2
-        right_start_y = self.y
-        right_end_x = self.x + self.width//2 + panel_length * math.cos(angle)
-        right_end_y = self.y + panel_length * math.sin(angle)
+        right_start_x = x + self.width//2
+        right_start_y = y
+        right_end_x = x + self.width//2 + panel_length * cos_a
+        right_end_y = y + panel_length * sin_a
         
         # Draw panel shadows
         shadow_offset = 2
@@ -150,34 +181,21 @@ class Satellite:
         pygame.draw.line(screen, self.panel_blue, 
                         (right_start_x, right_start_y), (right_end_x, right_end_y), panel_width)
         
-        # Add realistic panel cell grid pattern
-        for i in range(8):
-            offset_ratio = i / 8.0
-            # Left panel cells
-            cell_x = left_start_x + (left_end_x - left_start_x) * offset_ratio
-            cell_y = left_start_y + (left_end_y - left_start_y) * offset_ratio
-            
-            for j in range(-2, 3):
-                grid_offset = j * 2
-                perp_x = -math.sin(angle) * grid_offset
-                perp_y = math.cos(angle) * grid_offset
-                
-                color = self.panel_light if (i + j) % 2 == 0 else self.panel_blue
-                pygame.draw.circle(screen, color, 
-                                 (int(cell_x + perp_x), int(cell_y + perp_y)), 1)
-            
-            # Right panel cells
-            cell_x = right_start_x + (right_end_x - right_start_x) * offset_ratio
-            cell_y = right_start_y + (right_end_y - right_start_y) * offset_ratio
-            
-            for j in range(-2, 3):
-                grid_offset = j * 2
-                perp_x = -math.sin(angle) * grid_offset
-                perp_y = math.cos(angle) * grid_offset
-                
-                color = self.panel_light if (i + j) % 2 == 0 else self.panel_blue
-                pygame.draw.circle(screen, color, 
-                                 (int(cell_x + perp_x), int(cell_y + perp_y)), 1)
+        # Add realistic panel cell grid pattern: 8 rows of 5 cells per panel,
+        # positioned in bulk and checkered light/dark
+        cell_offsets = [j * 2 for j in range(-2, 3)]
+        colors = [self.panel_light if (i + j) % 2 == 0 else self.panel_blue
+                  for i in range(8) for j in range(-2, 3)]
+        for start, end in (((left_start_x, left_start_y), (left_end_x, left_end_y)),
+                           ((right_start_x, right_start_y), (right_end_x, right_end_y))):
+            cells = segment_grid(start, end, direction, 8, cell_offsets).tolist()
+            for color, cell in zip(colors, cells):
+                pygame.draw.circle(screen, color, cell, 1)
+    
+    def get_rect(self):
+        """Return the screen area the satellite can cover at any rotation"""
+        # Solar panels sweep up to 73px sideways and 48px vertically, plus shadows
+        return pygame.Rect(self.x - 80, self.y - 55, 160, 110)
     
     def is_clicked(self, pos):
         """Check if satellite was clicked"""
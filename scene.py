@@ -0,0 +1,99 @@
+class SpatialGrid:
+    """Uniform grid bucketing node ids by the cells their rects overlap"""
+
+    def __init__(self, cell_size=64):
+        self.cell_size = cell_size
+        self.cells = {}       # (cell_x, cell_y) -> set of node ids
+        self.node_cells = {}  # node id -> list of cells it occupies
+
+    def cells_for_rect(self, rect):
+        """Return every cell a rect overlaps"""
+        size = self.cell_size
+        left, top = rect.left // size, rect.top // size
+        right, bottom = (rect.right - 1) // size, (rect.bottom - 1) // size
+        return [(x, y) for x in range(left, right + 1) for y in range(top, bottom + 1)]
+
+    def insert(self, node_id, rect):
+        cells = self.cells_for_rect(rect)
+        for cell in cells:
+            self.cells.setdefault(cell, set()).add(node_id)
+        self.node_cells[node_id] = cells
+
+    def remove(self, node_id):
+        for cell in self.node_cells.pop(node_id, []):
+            bucket = self.cells.get(cell)
+            if bucket is not None:
+                bucket.discard(node_id)
+                if not bucket:
+                    del self.cells[cell]
+
+    def move(self, node_id, rect):
+        self.remove(node_id)
+        self.insert(node_id, rect)
+
+    def query_point(self, pos):
+        """Return the ids of nodes whose cells contain the point"""
+        cell = (int(pos[0]) // self.cell_size, int(pos[1]) // self.cell_size)
+        return self.cells.get(cell, ())
+
+class SceneNode:
+    def __init__(self, entity, z, order):
+        self.entity = entity
+        self.z = z
+        self.order = order  # Insertion order breaks ties between equal z
+        self.rect = entity.get_rect()
+
+class SceneGraph:
+    """Clickable entities with bounds and z-order, indexed for hit-testing.
+
+    Entities provide get_rect() for their bounds and is_clicked(pos) for the
+    exact test. A click only examines the nodes sharing its grid cell, so the
+    cost does not grow with the number of entities in the scene.
+    """
+
+    def __init__(self, cell_size=64):
+        self.grid = SpatialGrid(cell_size)
+        self.nodes = {}  # id(entity) -> SceneNode
+        self.next_order = 0
+
+    def add(self, entity, z=0):
+        """Register an entity at the given z (higher is on top)"""
+        node = SceneNode(entity, z, self.next_order)
+        self.next_order += 1
+        self.nodes[id(entity)] = node
+        self.grid.insert(id(entity), node.rect)
+        return node
+
+    def remove(self, entity):
+        """Unregister an entity"""
+        if self.nodes.pop(id(entity), None) is not None:
+            self.grid.remove(id(entity))
+
+    def update(self, entity):
+        """Re-read an entity's bounds after it moved or resized"""
+        node = self.nodes.get(id(entity))
+        if node is None:
+            return
+        rect = entity.get_rect()
+        if rect != node.rect:
+            node.rect = rect
+            self.grid.move(id(entity), rect)
+
+    def clear(self):
+        self.grid = SpatialGrid(self.grid.cell_size)
+        self.nodes = {}
+
+    def __contains__(self, entity):
+        return id(entity) in self.nodes
+
+    def __len__(self):
+        return len(self.nodes)
+
+    def hit_test(self, pos):
+        """Return the topmost entity under pos, or None"""
+        candidates = [self.nodes[node_id] for node_id in self.grid.query_point(pos)]
+        candidates.sort(key=lambda node: (node.z, node.order), reverse=True)
+        for node in candidates:
+            if node.rect.collidepoint(pos) and node.entity.is_clicked(pos):
+                return node.entity
+        return None
@@ -1,4 +1,5 @@
 import pygame
+from text import get_text_renderer
 
 class School:
     def __init__(self, x, y):
@@ -22,27 +23,60 @@ class School:
         self.sign_white = (248, 248, 255)     # Ghost white for sign
         self.sign_text = (0, 0, 0)            # Black text
         self.foundation_gray = (105, 105, 105) # Foundation
+        self.sign_font_size = 16
         
-        # Initialize font for sign
-        pygame.font.init()
-        self.sign_font = pygame.font.Font(None, 16)
+        # Static artwork, rendered once and rebuilt when size or colors change
+        self.sprite = None
+        self.sprite_key = None
+        self.sprite_origin = (0, 0)
         
     def draw(self, screen):
-        """Draw the realistic school building with detailed architecture"""
+        """Draw the school from its pre-rendered sprite"""
+        sprite = self.get_sprite()
+        origin_x, origin_y = self.sprite_origin
+        screen.blit(sprite, (int(self.x) - origin_x, int(self.y) - origin_y))
+    
+    def get_sprite_key(self):
+        """Return everything the baked artwork depends on"""
+        return (self.width, self.height, self.brick_red, self.brick_dark, self.brick_light,
+                self.mortar_gray, self.roof_dark, self.roof_tile, self.door_brown,
+                self.door_handle, self.window_glass, self.window_frame, self.window_shadow,
+                self.sign_white, self.sign_text, self.foundation_gray, self.sign_font_size)
+    
+    def get_sprite(self):
+        """Return the school artwork, rendering it again only if size or palette changed"""
+        key = self.get_sprite_key()
+        if key != self.sprite_key:
+            self.sprite = self.create_sprite()
+            self.sprite_key = key
+        return self.sprite
+    
+    def create_sprite(self):
+        """Render the building once into a sprite the size of get_rect()"""
+        # Building center within the sprite, matching the offsets in get_rect()
+        self.sprite_origin = (self.width//2 + 16, self.height//2 + 66)
+        sprite = pygame.Surface((self.width + 32, self.height + 72), pygame.SRCALPHA)
+        self.draw_artwork(sprite, *self.sprite_origin)
+        if pygame.display.get_surface() is not None:
+            sprite = sprite.convert_alpha()
+        return sprite
+    
+    def draw_artwork(self, screen, x, y):
+        """Draw the realistic school building with detailed architecture, centered on (x, y)"""
         # Draw foundation
-        foundation_rect = pygame.Rect(self.x - self.width//2 - 5, 
-                                     self.y + self.height//2 - 5,
+        foundation_rect = pygame.Rect(x - self.width//2 - 5, 
+                                     y + self.height//2 - 5,
                                      self.width + 10, 10)
         pygame.draw.rect(screen, self.foundation_gray, foundation_rect)
         
         # Draw building shadow for depth
-        shadow_rect = pygame.Rect(self.x - self.width//2 + 3, 
-                                 self.y - self.height//2 + 3,
+        shadow_rect = pygame.Rect(x - self.width//2 + 3, 
+                                 y - self.height//2 + 3,
                                  self.width, self.height)
         pygame.draw.rect(screen, self.brick_dark, shadow_rect)
         
         # Draw main building with brick pattern
-        building_rect = pygame.Rect(self.x - self.width//2, self.y - self.height//2, 
+        building_rect = pygame.Rect(x - self.width//2, y - self.height//2, 
                                    self.width, self.height)
         pygame.draw.rect(screen, self.brick_red, building_rect)
         
@@ -50,19 +84,19 @@ class School:
         self.draw_brick_pattern(screen, building_rect)
         
         # Draw detailed roof
-        self.draw_roof(screen)
+        self.draw_roof(screen, x, y)
         
         # Draw windows with realistic details
-        self.draw_windows(screen)
+        self.draw_windows(screen, x, y)
         
         # Draw detailed entrance door
-        self.draw_entrance(screen)
+        self.draw_entrance(screen, x, y)
         
         # Draw school sign with text
-        self.draw_school_sign(screen)
+        self.draw_school_sign(screen, x, y)
         
         # Draw chimney
-        self.draw_chimney(screen)
+        self.draw_chimney(screen, x, y)
         
         # Draw building outline
         pygame.draw.rect(screen, (0, 0, 0), building_rect, 2)
@@ -104,37 +138,37 @@ class School:
                                        (brick_rect.x, brick_rect.y + brick_rect.height - 1),
                                        (brick_rect.x + brick_rect.width, brick_rect.y + brick_rect.height - 1), 1)
     
-    def draw_roof(self, screen):
+    def draw_roof(self, screen, x, y):
         """Draw detailed roof with tiles and gutters"""
         # Main roof shape
         roof_points = [
-            (self.x - self.width//2 - 15, self.y - self.height//2),
-            (self.x, self.y - self.height//2 - 25),
-            (self.x + self.width//2 + 15, self.y - self.height//2)
+            (x - self.width//2 - 15, y - self.height//2),
+            (x, y - self.height//2 - 25),
+            (x + self.width//2 + 15, y - self.height//2)
         ]
         pygame.draw.polygon(screen, self.roof_dark, roof_points)
         
         # Roof tile pattern
         for i in range(5):
-            tile_y = self.y - self.height//2 - 20 + i * 4
-            left_x = self.x - (self.width//2 + 10) + i * 2
-            right_x = self.x + (self.width//2 + 10) - i * 2
+            tile_y = y - self.height//2 - 20 + i * 4
+            left_x = x - (self.width//2 + 10) + i * 2
+            right_x = x + (self.width//2 + 10) - i * 2
             pygame.draw.line(screen, self.roof_tile,
                            (left_x, tile_y), (right_x, tile_y), 2)
         
         # Roof ridge
         pygame.draw.line(screen, (40, 40, 40),
-                        (self.x - 10, self.y - self.height//2 - 25),
-                        (self.x + 10, self.y - self.height//2 - 25), 3)
+                        (x - 10, y - self.height//2 - 25),
+                        (x + 10, y - self.height//2 - 25), 3)
         
         # Gutters
         pygame.draw.line(screen, (80, 80, 80),
-                        (self.x - self.width//2 - 15, self.y - self.height//2),
-                        (self.x + self.width//2 + 15, self.y - self.height//2), 2)
+                        (x - self.width//2 - 15, y - self.height//2),
+                        (x + self.width//2 + 15, y - self.height//2), 2)
     
-    def draw_chimney(self, screen):
+    def draw_chimney(self, screen, x, y):
         """Draw a realistic chimney"""
-        chimney_rect = pygame.Rect(self.x + self.width//3, self.y - self.height//2 - 35,
+        chimney_rect = pygame.Rect(x + self.width//3, y - self.height//2 - 35,
                                   12, 25)
         pygame.draw.rect(screen, self.brick_red, chimney_rect)
         pygame.draw.rect(screen, self.brick_dark, chimney_rect, 1)
@@ -144,7 +178,7 @@ class School:
                               chimney_rect.width + 4, 3)
         pygame.draw.rect(screen, self.roof_dark, cap_rect)
 
-    def draw_windows(self, screen):
+    def draw_windows(self, screen, x, y):
         """Draw realistic school windows with detailed frames and reflections"""
         window_width = 18
         window_height = 24
@@ -152,11 +186,11 @@ class School:
         # First floor windows
         window_positions = [
             # Left side windows
-            (self.x - self.width//2 + 20, self.y - 5),
-            (self.x - self.width//2 + 45, self.y - 5),
+            (x - self.width//2 + 20, y - 5),
+            (x - self.width//2 + 45, y - 5),
             # Right side windows
-            (self.x + 15, self.y - 5),
-            (self.x + 40, self.y - 5),
+            (x + 15, y - 5),
+            (x + 40, y - 5),
         ]
         
         for window_x, window_y in window_positions:
@@ -197,9 +231,9 @@ class School:
         upper_window_width = 15
         upper_window_height = 18
         upper_positions = [
-            (self.x - self.width//2 + 25, self.y - self.height//2 + 15),
-            (self.x - 5, self.y - self.height//2 + 15),
-            (self.x + 25, self.y - self.height//2 + 15),
+            (x - self.width//2 + 25, y - self.height//2 + 15),
+            (x - 5, y - self.height//2 + 15),
+            (x + 25, y - self.height//2 + 15),
         ]
         
         for window_x, window_y in upper_positions:
@@ -211,23 +245,23 @@ class School:
             pygame.draw.rect(screen, self.window_glass, glass_rect)
             pygame.draw.rect(screen, self.window_frame, frame_rect, 1)
 
-    def draw_entrance(self, screen):
+    def draw_entrance(self, screen, x, y):
         """Draw detailed school entrance with steps and door"""
         # Entrance steps
         for i in range(3):
-            step_rect = pygame.Rect(self.x - 25 + i * 2, 
-                                   self.y + self.height//2 - 8 - i * 3,
+            step_rect = pygame.Rect(x - 25 + i * 2, 
+                                   y + self.height//2 - 8 - i * 3,
                                    50 - i * 4, 4)
             pygame.draw.rect(screen, self.foundation_gray, step_rect)
             pygame.draw.rect(screen, (80, 80, 80), step_rect, 1)
         
         # Door frame
-        door_frame_rect = pygame.Rect(self.x - 15, self.y + self.height//2 - 45,
+        door_frame_rect = pygame.Rect(x - 15, y + self.height//2 - 45,
                                      30, 40)
         pygame.draw.rect(screen, self.window_frame, door_frame_rect)
         
         # Main door
-        door_rect = pygame.Rect(self.x - 13, self.y + self.height//2 - 43,
+        door_rect = pygame.Rect(x - 13, y + self.height//2 - 43,
                                26, 36)
         pygame.draw.rect(screen, self.door_brown, door_rect)
         
@@ -253,14 +287,14 @@ class School:
         pygame.draw.rect(screen, self.window_glass, door_window)
         pygame.draw.rect(screen, self.window_frame, door_window, 1)
     
-    def draw_school_sign(self, screen):
+    def draw_school_sign(self, screen, x, y):
         """Draw realistic school identification sign with text"""
         # Sign post
-        post_rect = pygame.Rect(self.x - 2, self.y - self.height//2 - 65, 4, 25)
+        post_rect = pygame.Rect(x - 2, y - self.height//2 - 65, 4, 25)
         pygame.draw.rect(screen, (101, 67, 33), post_rect)
         
         # Main sign board (made larger to accommodate longer text)
-        sign_rect = pygame.Rect(self.x - 50, self.y - self.height//2 - 65, 100, 30)
+        sign_rect = pygame.Rect(x - 50, y - self.height//2 - 65, 100, 30)
         pygame.draw.rect(screen, self.sign_white, sign_rect)
         pygame.draw.rect(screen, self.sign_text, sign_rect, 2)
         
@@ -273,21 +307,28 @@ class School:
         
         # School text - split into two lines to fit properly
         try:
+            text = get_text_renderer()
+            
             # First line
-            text_surface = self.sign_font.render("VIDYASHILP PUBLIC", True, self.sign_text)
-            text_rect = text_surface.get_rect(center=(self.x, self.y - self.height//2 - 55))
-            screen.blit(text_surface, text_rect)
+            text_surface = text.render("VIDYASHILP PUBLIC", self.sign_font_size, self.sign_text)
+            text_rect = text_surface.get_rect(center=(x, y - self.height//2 - 55))
             
             # Second line
-            text_surface2 = self.sign_font.render("SCHOOL", True, self.sign_text)
-            text_rect2 = text_surface2.get_rect(center=(self.x, self.y - self.height//2 - 45))
-            screen.blit(text_surface2, text_rect2)
+            text_surface2 = text.render("SCHOOL", self.sign_font_size, self.sign_text)
+            text_rect2 = text_surface2.get_rect(center=(x, y - self.height//2 - 45))
+            
+            screen.blits([(text_surface, text_rect), (text_surface2, text_rect2)], False)
         except:
             # Fallback if font fails
             pygame.draw.rect(screen, self.sign_text, 
-                            (self.x - 45, self.y - self.height//2 - 58, 90, 3))
+                            (x - 45, y - self.height//2 - 58, 90, 3))
             pygame.draw.rect(screen, self.sign_text, 
-                            (self.x - 20, self.y - self.height//2 - 48, 40, 3))
+                            (x - 20, y - self.height//2 - 48, 40, 3))
+    
+    def get_rect(self):
+        """Return the screen area covered by the building, roof and sign included"""
+        return pygame.Rect(self.x - self.width//2 - 16, self.y - self.height//2 - 66,
+                           self.width + 32, self.height + 72)
     
     def is_clicked(self, pos):
         """Check if school was clicked"""
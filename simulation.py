@@ -0,0 +1,92 @@
+class SimulationClock:
+    """Turns elapsed wall time into a whole number of fixed simulation steps.
+
+    Entity updates advance by a fixed amount per call, so calling them at a
+    fixed rate makes motion speed independent of the achieved frame rate.
+    Leftover time is carried to the next frame and exposed as alpha, the
+    fraction of a step the renderer should interpolate by. When frames take
+    longer than a step, several steps run before the next render (frames are
+    skipped, simulated time is not); max_steps bounds that catch-up so a
+    long stall cannot spiral.
+    """
+
+    def __init__(self, step_rate=60, max_steps=8):
+        self.step_duration = 1.0 / step_rate
+        self.max_steps = max_steps
+        self.accumulator = 0.0
+        self.steps = 0          # Total steps taken
+        self.dropped_time = 0.0  # Time discarded by the catch-up limit
+
+    @property
+    def time(self):
+        """Simulated time in seconds"""
+        return self.steps * self.step_duration
+
+    @property
+    def alpha(self):
+        """Fraction of a step elapsed since the last one, for interpolation"""
+        return self.accumulator / self.step_duration
+
+    def advance(self, elapsed):
+        """Add elapsed seconds and return how many steps to simulate now"""
+        self.accumulator += elapsed
+        steps = int(self.accumulator / self.step_duration)
+        if steps > self.max_steps:
+            self.dropped_time += (steps - self.max_steps) * self.step_duration
+            self.accumulator -= (steps - self.max_steps) * self.step_duration
+            steps = self.max_steps
+        self.accumulator -= steps * self.step_duration
+        self.steps += steps
+        return steps
+
+class Interpolator:
+    """Blends tracked entity attributes between the last two simulation steps.
+
+    Call snapshot() before each step, then apply(alpha) before drawing and
+    restore() afterwards, so drawing sees the in-between state while the
+    simulation keeps its exact values. Periodic attributes (angles, phases)
+    are blended along the short way round their period.
+    """
+
+    def __init__(self):
+        self.tracks = []      # (obj, attribute, period)
+        self.previous = []
+        self.current = None
+
+    def track(self, obj, attribute, period=None):
+        """Interpolate obj.attribute while drawing"""
+        self.tracks.append((obj, attribute, period))
+        self.previous.append(getattr(obj, attribute))
+
+    def clear(self):
+        """Stop tracking everything"""
+        self.tracks = []
+        self.previous = []
+
+    def snapshot(self):
+        """Remember the state before a simulation step"""
+        self.previous = [getattr(obj, attribute) for obj, attribute, period in self.tracks]
+
+    def apply(self, alpha):
+        """Set every tracked attribute to its interpolated value"""
+        self.current = []
+        for (obj, attribute, period), previous in zip(self.tracks, self.previous):
+            current = getattr(obj, attribute)
+            self.current.append(current)
+
+            change = current - previous
+            if period:
+                # Shortest way round, so a wrap from 359.5 to 0 is +0.5
+                change = (change + period / 2) % period - period / 2
+                value = (previous + change * alpha) % period
+            else:
+                value = previous + change * alpha
+            setattr(obj, attribute, value)
+
+    def restore(self):
+        """Put back the exact simulation values after drawing"""
+        if self.current is None:
+            return
+        for (obj, attribute, period), current in zip(self.tracks, self.current):
+            setattr(obj, attribute, current)
+        self.current = None
@@ -0,0 +1,21 @@
+import threading
+from assets import AssetLoader
+
+def fail(error):
+    def load():
+        raise error
+    return load
+
+def test_failed_jobs_keep_placeholders_and_the_rest_still_load():
+    applied = []
+    loader = AssetLoader()
+    loader.add("image", fail(ValueError("bad mask")), lambda result: applied.append("image"))
+    loader.add("pack", fail(MemoryError()), lambda result: applied.append("pack"))
+    loader.add("fonts", lambda: "fonts", applied.append)
+
+    waiter = threading.Thread(target=loader.wait, daemon=True)
+    waiter.start()
+    waiter.join(10)
+    assert not waiter.is_alive()
+    assert loader.loaded
+    assert applied == ["fonts"]
@@ -0,0 +1,40 @@
+import numpy as np
+import pygame
+import pytest
+from fleet import CarFleet
+
+def brute_force_hit(fleet, pos):
+    """The topmost vehicle under pos, scanning every vehicle"""
+    hits = np.flatnonzero((np.abs(fleet.display_x() - pos[0]) <= fleet.half_width) &
+                          (np.abs(fleet.y - pos[1]) <= fleet.half_height))
+    return int(hits[-1]) if len(hits) else None
+
+@pytest.fixture
+def fleet():
+    pygame.init()
+    yield CarFleet(3000, 0, 1200, 560, 760)
+    pygame.quit()
+
+def random_clicks(fleet, count, seed=0):
+    rng = np.random.default_rng(seed)
+    # Half the clicks land on a vehicle, half anywhere around the lanes
+    targets = rng.integers(0, fleet.count, count // 2)
+    on_vehicles = np.column_stack((fleet.display_x()[targets], fleet.y[targets])) + rng.uniform(-8, 8, (len(targets), 2))
+    anywhere = np.column_stack((rng.uniform(-50, 1250, count // 2), rng.uniform(540, 780, count // 2)))
+    return np.concatenate((on_vehicles, anywhere)).tolist()
+
+def test_hit_test_matches_a_full_scan_as_the_fleet_moves(fleet):
+    for step in range(5):
+        for pos in random_clicks(fleet, 200, seed=step):
+            assert fleet.hit_test(pos) == brute_force_hit(fleet, pos)
+        fleet.update()
+
+def test_hit_test_finds_vehicles_shown_at_their_fix(fleet):
+    offsets = np.random.default_rng(1).uniform(-40, 40, fleet.count).astype(np.float32)
+    fleet.set_fix_offset(offsets)
+    for pos in random_clicks(fleet, 400):
+        assert fleet.hit_test(pos) == brute_force_hit(fleet, pos)
+
+def test_a_click_only_examines_nearby_vehicles(fleet):
+    x, y = float(fleet.display_x()[0]), float(fleet.y[0])
+    assert len(fleet.bucket_candidates(x, y)) < fleet.count // 20
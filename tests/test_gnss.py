@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+from gnss import GnssSolver
+from links import LinkEngine
+from orbits import CONSTELLATIONS, Constellation, SkyProjection
+
+def scene_ground(count):
+    """Receivers spread across the scene's grassland"""
+    projection = SkyProjection(22.57, 88.36, 600, 440, 520, 360)
+    return projection.ground_points(np.linspace(0, 1200, count))
+
+@pytest.mark.parametrize("name", sorted(CONSTELLATIONS))
+def test_cold_receivers_converge_for_every_preset(name):
+    ground = scene_ground(300)
+    constellation = Constellation.from_name(name)
+    engine = LinkEngine(links_per_receiver=8)
+    solver = GnssSolver()
+    for _ in range(20):
+        constellation.advance(10.0)
+        satellites = constellation.earth_fixed()
+        solver.update(satellites, ground, engine.update(satellites, ground))
+    assert solver.valid.mean() >= 0.95
+    assert solver.errors[solver.valid].max() * 1000 < 200.0
+
+def test_noiseless_fix_is_exact():
+    ground = scene_ground(5)
+    satellites = Constellation.from_name('gps').earth_fixed()
+    assignments = LinkEngine(links_per_receiver=8).update(satellites, ground)
+    solver = GnssSolver(noise=0.0, iterations_per_step=10)
+    estimates = solver.update(satellites, ground, assignments)
+    assert solver.valid.all()
+    np.testing.assert_allclose(estimates[:, :3], ground, atol=1e-6)
+    np.testing.assert_allclose(estimates[:, 3], solver.biases, atol=1e-6)
+    assert (solver.dop['pdop'] >= 1.0).all()
+
+def test_receivers_with_fewer_than_four_satellites_have_no_fix():
+    ground = scene_ground(2)
+    satellites = Constellation.from_name('gps').earth_fixed()
+    assignments = LinkEngine(links_per_receiver=8).update(satellites, ground)
+    assignments[1, 3:] = -1
+    solver = GnssSolver()
+    for _ in range(5):
+        solver.update(satellites, ground, assignments)
+    assert solver.valid.tolist() == [True, False]
+    assert np.isnan(solver.dop['pdop'][1])
+
+def test_rejects_zero_iterations():
+    with pytest.raises(ValueError):
+        GnssSolver(iterations_per_step=0)
+    with pytest.raises(ValueError):
+        GnssSolver.gauss_newton(np.zeros((3, 4, 1)), np.zeros((4, 1)), np.zeros((1, 4)), 0)
@@ -0,0 +1,35 @@
+import math
+import numpy as np
+import pytest
+from links import LinkEngine
+from orbits import CONSTELLATIONS, Constellation, SkyProjection
+
+def brute_force(satellites, receivers, count, min_elevation):
+    """Each receiver's best satellites by elevation over every satellite"""
+    up = receivers / np.linalg.norm(receivers, axis=1)[:, None]
+    offsets = satellites[None, :, :] - receivers[:, None, :]
+    sin_elevation = np.einsum('rcj,rj->rc', offsets, up) / np.linalg.norm(offsets, axis=2)
+    order = np.argsort(-sin_elevation, axis=1)[:, :count]
+    visible = np.take_along_axis(sin_elevation, order, axis=1) >= math.sin(math.radians(min_elevation))
+    return np.where(visible, order, -1)
+
+@pytest.mark.parametrize("name", sorted(CONSTELLATIONS))
+def test_assignments_match_brute_force_while_satellites_move(name):
+    projection = SkyProjection(22.57, 88.36, 600, 440, 520, 360)
+    receivers = projection.ground_points(np.linspace(0, 1200, 50))
+    constellation = Constellation.from_name(name)
+    engine = LinkEngine(links_per_receiver=8)
+    steps = 30
+    for _ in range(steps):
+        constellation.advance(10.0)
+        satellites = constellation.earth_fixed()
+        assignments = engine.update(satellites, receivers)
+        np.testing.assert_array_equal(assignments, brute_force(satellites, receivers, 8, 10.0))
+    # Candidate lists are reused between rebuilds
+    assert engine.rebuilds < steps
+
+def test_get_links_lists_ranked_links():
+    engine = LinkEngine(links_per_receiver=2)
+    engine.assignments = np.array([[4, 7], [5, -1]])
+    assert engine.get_links() == [(0, 4, 0), (0, 7, 1), (1, 5, 0)]
+    assert engine.get_links(receivers=1, ranks=1) == [(0, 4, 0)]
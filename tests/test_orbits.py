@@ -0,0 +1,67 @@
+import math
+import numpy as np
+import pygame
+import pytest
+from orbits import EARTH_RADIUS, Constellation, OrbitLayer, SkyProjection
+
+def scene_projection():
+    return SkyProjection(22.57, 88.36, 600, 440, 520, 360)
+
+def test_circular_orbits_keep_their_altitude():
+    constellation = Constellation.from_name('starlink')
+    for _ in range(10):
+        radii = np.linalg.norm(constellation.advance(600.0), axis=1)
+        np.testing.assert_allclose(radii, EARTH_RADIUS + 550.0)
+
+def test_kepler_solution_satisfies_keplers_equation():
+    mean_anomaly = np.linspace(0, 2 * math.pi, 50)
+    eccentricity = np.full(50, 0.7)
+    eccentric = Constellation.solve_kepler(mean_anomaly, eccentricity)
+    np.testing.assert_allclose(eccentric - eccentricity * np.sin(eccentric), mean_anomaly, atol=1e-10)
+
+@pytest.mark.parametrize("name,period_hours,node_drift", [
+    ('gps', 11.97, -0.039),       # Half a sidereal day, node drifting ~0.04 deg/day
+    ('starlink', 1.59, -4.49),    # Low orbits precess fast, ~4.5 deg/day westward
+])
+def test_period_and_j2_node_drift(name, period_hours, node_drift):
+    constellation = Constellation.from_name(name)
+    assert 2 * math.pi / constellation.mean_motion[0] / 3600 == pytest.approx(period_hours, abs=0.01)
+    assert math.degrees(constellation.raan_rate[0]) * 86400 == pytest.approx(node_drift, rel=0.01)
+
+def test_scene_x_inverts_ground_points():
+    projection = scene_projection()
+    xs = np.linspace(0, 1200, 13)
+    np.testing.assert_allclose(projection.scene_x(projection.ground_points(xs)), xs, atol=1e-6)
+
+def test_zenith_is_drawn_at_the_top_of_the_sky():
+    projection = scene_projection()
+    overhead = projection.observer * (1 + 20000.0 / EARTH_RADIUS)
+    points, elevations = projection.project(overhead[None, :])
+    assert elevations[0] == pytest.approx(math.pi / 2)
+    np.testing.assert_allclose(points[0], (600, 440 - 360))
+
+class Renderable:
+    def __init__(self):
+        self.x, self.y = 123, 45
+
+@pytest.fixture
+def layer():
+    pygame.init()
+    yield OrbitLayer(Constellation.from_name('gps'), scene_projection())
+    pygame.quit()
+
+def test_follower_tracks_the_highest_visible_satellite(layer):
+    renderable = Renderable()
+    layer.attach(renderable)
+    index = layer.highest()
+    assert layer.visible[index]
+    assert (renderable.x, renderable.y) == tuple(int(round(v)) for v in layer.points[index])
+
+def test_follower_stays_put_when_nothing_is_visible(layer):
+    layer.min_elevation = math.radians(95.0)
+    layer.project()
+    renderable = Renderable()
+    layer.attach(renderable)
+    layer.update()
+    assert layer.highest() is None
+    assert (renderable.x, renderable.y) == (123, 45)
@@ -0,0 +1,69 @@
+import random
+import pygame
+import pytest
+from main import Game, SCREEN_WIDTH, SCREEN_HEIGHT
+from replay import InputLog, InputRecorder, replay
+
+FRAMES = 60
+
+def post(*events):
+    for event in events:
+        pygame.event.post(event)
+
+@pytest.fixture(scope="module")
+def recording(tmp_path_factory):
+    """A short session: click Earth, drag the slider, click the car, with uneven frame times"""
+    path = str(tmp_path_factory.mktemp("replay") / "session.replay")
+    game = Game(constellation='gps')
+    game.recorder = InputRecorder(path, 0, 'gps')
+    rng = random.Random(1)
+    center = (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)
+    post(pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=center),
+         pygame.event.Event(pygame.MOUSEBUTTONUP, button=1, pos=center))
+    for frame in range(FRAMES):
+        if frame == 10:
+            post(pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1,
+                                    pos=(int(game.slider_handle_x), game.slider_y + game.slider_height // 2)))
+        if 10 < frame < 30:
+            post(pygame.event.Event(pygame.MOUSEMOTION, pos=(int(game.slider_x + (frame - 10) * 8), game.slider_y + 10),
+                                    rel=(8, 0), buttons=(1, 0, 0)))
+        if frame == 30:
+            post(pygame.event.Event(pygame.MOUSEBUTTONUP, button=1, pos=(0, 0)))
+        if frame == 40:
+            post(pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=(int(game.car.x), int(game.car.y))))
+        game.step(rng.uniform(0.004, 0.04))
+    game.recorder.close()
+    return path
+
+def test_log_holds_every_frame_and_its_events(recording):
+    log = InputLog.load(recording)
+    assert (log.fleet_size, log.constellation, log.tiles) == (0, 'gps', None)
+    assert len(log.frames) == FRAMES
+    assert all(elapsed is not None for events, elapsed, checksum in log.frames)
+    assert sum(len(events) for events, elapsed, checksum in log.frames) > 20
+
+def test_replay_reproduces_every_checksum(recording):
+    log = InputLog.load(recording)
+    mismatch, fps = replay(log, Game(constellation=log.constellation))
+    assert mismatch is None
+
+def test_replay_reports_the_first_diverging_frame(recording):
+    log = InputLog.load(recording)
+    events, elapsed, checksum = log.frames[45]
+    log.frames[45] = (events, elapsed, checksum ^ 1)
+    mismatch, fps = replay(log, Game(constellation=log.constellation))
+    assert mismatch == 45
+
+def test_frame_cut_off_mid_write_is_dropped(recording, tmp_path):
+    with open(recording, "rb") as log_file:
+        data = log_file.read()
+    truncated = tmp_path / "truncated.replay"
+    truncated.write_bytes(data[:-3])
+    assert len(InputLog.load(str(truncated)).frames) == FRAMES - 1
+
+def test_checksum_follows_simulation_state():
+    game = Game()
+    before = game.get_checksum()
+    assert game.get_checksum() == before
+    game.step()
+    assert game.get_checksum() != before
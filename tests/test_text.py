@@ -0,0 +1,35 @@
+import pygame
+import pytest
+from text import TextRenderer
+
+# Scene strings, and awkward characters, that must draw exactly like font.render
+SAMPLES = [("VIDYASHILP PUBLIC", 16), ("SCHOOL", 16), ("Car Position Control", 24),
+           ("School", 24), ("Mobile", 24), ("SATELLITE", 24), ("• Type: Communication Satellite", 18),
+           ("frame  p50  16.7  p95  17.0  p99  18.2 ms", 18), ("soft\u00adhyphen", 18)]
+
+@pytest.fixture(scope="module")
+def renderer():
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    yield TextRenderer()
+    pygame.quit()
+
+@pytest.mark.parametrize("text,size", SAMPLES)
+def test_render_matches_font_render(renderer, text, size):
+    color = (0, 0, 0)
+    surface = renderer.render(text, size, color)
+    reference = renderer.get_font(size).render(text, True, color)
+    assert surface.get_size() == reference.get_size()
+    assert pygame.image.tobytes(surface, "RGBA") == pygame.image.tobytes(reference, "RGBA")
+
+def test_zero_width_text_renders_empty(renderer):
+    surface = renderer.render("\u00ad", 18, (0, 0, 0))
+    assert surface.get_size() == (0, renderer.get_font(18).get_height())
+
+def test_strings_are_cached_and_evicted_least_recent_first():
+    renderer = TextRenderer(cache_size=2)
+    first = renderer.render("one", 18, (0, 0, 0))
+    renderer.render("two", 18, (0, 0, 0))
+    assert renderer.render("one", 18, (0, 0, 0)) is first
+    renderer.render("three", 18, (0, 0, 0))
+    assert list(key[0] for key in renderer.strings) == ["one", "three"]
@@ -0,0 +1,63 @@
+import io
+import sqlite3
+import threading
+import pygame
+from tilemap import MBTilesSource, TileLoader
+
+def write_mbtiles(path, tiles):
+    """Write an archive of {(zoom, x, y): tile_data} with slippy y"""
+    connection = sqlite3.connect(path)
+    connection.execute("CREATE TABLE metadata (name TEXT, value TEXT)")
+    connection.execute("CREATE TABLE tiles (zoom_level INTEGER, tile_column INTEGER, "
+                       "tile_row INTEGER, tile_data BLOB)")
+    connection.execute("INSERT INTO metadata VALUES ('format', 'png')")
+    for (zoom, x, y), data in tiles.items():
+        connection.execute("INSERT INTO tiles VALUES (?, ?, ?, ?)", (zoom, x, (1 << zoom) - 1 - y, data))
+    connection.commit()
+    connection.close()
+
+def png_bytes(color):
+    surface = pygame.Surface((256, 256))
+    surface.fill(color)
+    buffer = io.BytesIO()
+    pygame.image.save(surface, buffer, "tile.png")
+    return buffer.getvalue()
+
+def wait_with_timeout(loader, seconds=10):
+    waiter = threading.Thread(target=loader.wait, daemon=True)
+    waiter.start()
+    waiter.join(seconds)
+    return not waiter.is_alive()
+
+def test_null_tile_data_reads_as_missing(tmp_path):
+    path = tmp_path / "map.mbtiles"
+    write_mbtiles(path, {(1, 0, 0): png_bytes((0, 128, 0)), (1, 1, 0): None})
+    source = MBTilesSource(str(path))
+    assert source.read(1, 1, 0) is None
+    assert source.read(1, 0, 0)[1] == "png"
+    source.close()
+
+class BrokenSource:
+    """A source whose reads fail in an unexpected way"""
+
+    def read(self, zoom, x, y):
+        if x == 0:
+            raise TypeError("corrupt tile")
+        return None
+
+    def close(self):
+        pass
+
+def test_loader_survives_unexpected_errors():
+    loader = TileLoader(BrokenSource())
+    try:
+        loader.request([(1, 0, 0), (1, 1, 0)])
+        assert wait_with_timeout(loader)
+        assert sorted(loader.poll()) == [((1, 0, 0), None), ((1, 1, 0), None)]
+
+        # The worker is still alive and serves later requests
+        loader.request([(1, 1, 1)])
+        assert wait_with_timeout(loader)
+        assert loader.poll() == [((1, 1, 1), None)]
+    finally:
+        loader.close()
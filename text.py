@@ -0,0 +1,72 @@
+import pygame
+import threading
+from collections import OrderedDict
+
+class FontRegistry:
+    """Loads each font/size combination once and hands out the shared object"""
+
+    def __init__(self):
+        self.fonts = {}
+        self.lock = threading.Lock()  # Fonts may be preloaded on the asset thread
+
+    def get(self, size, name=None):
+        """Return the font for a size (and optional font file), loading it on first use"""
+        key = (name, size)
+        font = self.fonts.get(key)
+        if font is None:
+            with self.lock:
+                font = self.fonts.get(key)
+                if font is None:
+                    pygame.font.init()
+                    font = pygame.font.Font(name, size)
+                    self.fonts[key] = font
+        return font
+
+class TextRenderer:
+    """Scene-wide text drawing built on shared fonts.
+
+    Whole strings are rendered with font.render and kept in an LRU cache,
+    so static labels cost one blit and text that changes only pays for the
+    strings it has not shown recently; callers draw them with batched
+    blits. There is deliberately no glyph atlas: laying glyphs out by
+    font.metrics advances drops the kerning and overhangs font.render
+    applies, so cached strings are the unit of reuse instead.
+    """
+
+    def __init__(self, cache_size=256):
+        self.fonts = FontRegistry()
+        self.strings = OrderedDict()
+        self.cache_size = cache_size
+
+    def get_font(self, size, name=None):
+        """Return the shared font object for measuring text"""
+        return self.fonts.get(size, name)
+
+    def render(self, text, size, color, name=None, antialias=True):
+        """Return a cached surface holding the rendered string"""
+        key = (text, size, tuple(color), name, antialias)
+        surface = self.strings.get(key)
+        if surface is not None:
+            self.strings.move_to_end(key)
+            return surface
+
+        font = self.fonts.get(size, name)
+        if font.size(text)[0] == 0:
+            # font.render raises for text made only of zero-width characters
+            surface = pygame.Surface((0, font.get_height()), pygame.SRCALPHA)
+        else:
+            surface = font.render(text, antialias, color)
+
+        self.strings[key] = surface
+        if len(self.strings) > self.cache_size:
+            self.strings.popitem(last=False)
+        return surface
+
+_text_renderer = None
+
+def get_text_renderer():
+    """Return the shared text renderer, creating it on first use"""
+    global _text_renderer
+    if _text_renderer is None:
+        _text_renderer = TextRenderer()
+    return _text_renderer
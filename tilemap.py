@@ -0,0 +1,320 @@
+import io
+import os
+import math
+import sqlite3
+import threading
+from collections import OrderedDict, deque
+import pygame
+from animation_cache import frame_bytes
+
+TILE_SIZE = 256
+DEFAULT_ZOOM = 12  # Neighbourhood scale
+TILE_FORMATS = ("png", "jpg", "jpeg", "webp")
+
+class DirectoryTileSource:
+    """Map tiles stored as files in a slippy-map tree: root/{z}/{x}/{y}.png"""
+
+    def __init__(self, root):
+        self.root = root
+        zooms = [int(name) for name in os.listdir(root) if name.isdigit()]
+        if not zooms:
+            raise ValueError(f"No zoom level directories in {root}")
+        self.min_zoom = min(zooms)
+        self.max_zoom = max(zooms)
+
+    def read(self, zoom, x, y):
+        """Return a tile's encoded bytes and format, or None if it does not exist"""
+        for extension in TILE_FORMATS:
+            path = os.path.join(self.root, str(zoom), str(x), f"{y}.{extension}")
+            if os.path.exists(path):
+                with open(path, "rb") as tile_file:
+                    return tile_file.read(), extension
+        return None
+
+    def close(self):
+        pass
+
+class MBTilesSource:
+    """Map tiles packed into one MBTiles (SQLite) archive.
+
+    SQLite connections cannot be shared between threads, so each thread
+    that reads tiles opens its own.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.local = threading.local()
+        metadata = dict(self.connection().execute("SELECT name, value FROM metadata"))
+        self.format = metadata.get("format", "png")
+        zooms = self.connection().execute("SELECT MIN(zoom_level), MAX(zoom_level) FROM tiles").fetchone()
+        if zooms[0] is None:
+            raise ValueError(f"No tiles in {path}")
+        self.min_zoom = int(metadata.get("minzoom", zooms[0]))
+        self.max_zoom = int(metadata.get("maxzoom", zooms[1]))
+
+    def connection(self):
+        """Return this thread's read-only connection to the archive"""
+        connection = getattr(self.local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(f"file:{self.path}?mode=ro", uri=True)
+            self.local.connection = connection
+        return connection
+
+    def read(self, zoom, x, y):
+        """Return a tile's encoded bytes and format, or None if it does not exist"""
+        # MBTiles rows count from the bottom of the map (TMS), slippy y from the top
+        row = (1 << zoom) - 1 - y
+        found = self.connection().execute(
+            "SELECT tile_data FROM tiles WHERE zoom_level = ? AND tile_column = ? AND tile_row = ?",
+            (zoom, x, row)).fetchone()
+        if found is None or found[0] is None:
+            return None
+        return bytes(found[0]), self.format
+
+    def close(self):
+        connection = getattr(self.local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self.local.connection = None
+
+def open_tile_source(path):
+    """Open a tile directory or an .mbtiles archive"""
+    if os.path.isdir(path):
+        return DirectoryTileSource(path)
+    return MBTilesSource(path)
+
+class TileCache:
+    """Decoded tiles, least recently drawn evicted first once over the byte budget"""
+
+    def __init__(self, max_bytes=64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.tiles = OrderedDict()  # (zoom, x, y) -> Surface, least recently used first
+        self.total_bytes = 0
+
+    def get(self, key):
+        """Return a cached tile and mark it recently used, or None"""
+        tile = self.tiles.get(key)
+        if tile is not None:
+            self.tiles.move_to_end(key)
+        return tile
+
+    def put(self, key, tile):
+        """Cache a tile, evicting the least recently used ones to make room"""
+        self.discard(key)
+        size = frame_bytes(tile)
+        while self.tiles and self.total_bytes + size > self.max_bytes:
+            self.discard(next(iter(self.tiles)))
+        self.tiles[key] = tile
+        self.total_bytes += size
+
+    def discard(self, key):
+        """Forget one tile"""
+        tile = self.tiles.pop(key, None)
+        if tile is not None:
+            self.total_bytes -= frame_bytes(tile)
+
+    def __contains__(self, key):
+        return key in self.tiles
+
+class TileLoader:
+    """Reads and decodes tiles on a worker thread.
+
+    The render loop hands over the tiles it still needs with request(),
+    nearest first, and collects decoded surfaces with poll(); neither call
+    ever waits on the disk or the decoder. Requests that are no longer
+    wanted are dropped before they are read.
+    """
+
+    def __init__(self, source):
+        self.source = source
+        self.condition = threading.Condition()
+        self.requests = deque()  # Keys waiting to be read, nearest first
+        self.loading = None      # Key the worker is reading right now
+        self.results = deque()   # (key, Surface or None) waiting to be polled
+        self.ready = set()       # Keys in results
+        self.running = True
+        self.thread = threading.Thread(target=self.run, name="tile-loader", daemon=True)
+        self.thread.start()
+
+    def request(self, keys):
+        """Replace the queue with these tiles, skipping any already on their way"""
+        with self.condition:
+            self.requests = deque(key for key in keys
+                                  if key != self.loading and key not in self.ready)
+            self.condition.notify_all()
+
+    def poll(self, limit=None):
+        """Return up to limit decoded (key, surface) pairs; surface is None for missing tiles"""
+        results = []
+        with self.condition:
+            while self.results and (limit is None or len(results) < limit):
+                key, tile = self.results.popleft()
+                self.ready.discard(key)
+                results.append((key, tile))
+        return results
+
+    def wait(self):
+        """Block until every requested tile has been read"""
+        with self.condition:
+            while self.running and (self.requests or self.loading is not None):
+                self.condition.wait()
+
+    def run(self):
+        """Worker thread: read and decode requested tiles until closed"""
+        while True:
+            with self.condition:
+                while self.running and not self.requests:
+                    self.condition.wait()
+                if not self.running:
+                    break
+                key = self.loading = self.requests.popleft()
+
+            # Whatever goes wrong, the tile is reported (as missing) so
+            # wait() and the render loop never wait on it forever
+            tile = None
+            try:
+                found = self.source.read(*key)
+                if found is not None:
+                    data, extension = found
+                    tile = pygame.image.load(io.BytesIO(data), f"tile.{extension}")
+            except Exception as error:
+                print(f"Could not load tile {key}: {error}")
+            finally:
+                with self.condition:
+                    self.loading = None
+                    self.results.append((key, tile))
+                    self.ready.add(key)
+                    self.condition.notify_all()
+        self.source.close()
+
+    def close(self):
+        """Stop the worker thread"""
+        with self.condition:
+            self.running = False
+            self.condition.notify_all()
+        self.thread.join()
+
+class TileMapLayer:
+    """Slippy-map ground layer: Web Mercator tiles filling a screen rect.
+
+    The view is a center in world pixels at the current zoom. Each update
+    collects newly decoded tiles and asks the loader for the visible ones
+    still missing; drawing only blits cached tiles and paints placeholders
+    where tiles are still loading or do not exist.
+    """
+
+    def __init__(self, source, rect, latitude, longitude, zoom=None, max_bytes=64 * 1024 * 1024,
+                 uploads_per_frame=8):
+        self.source = source
+        self.rect = pygame.Rect(rect)
+        self.zoom = min(max(DEFAULT_ZOOM if zoom is None else zoom, source.min_zoom), source.max_zoom)
+        self.center_x, self.center_y = world_pixel(latitude, longitude, self.zoom)
+        self.uploads_per_frame = uploads_per_frame  # Decoded tiles converted per update
+        self.cache = TileCache(max_bytes)
+        self.loader = TileLoader(source)
+        self.missing = set()  # Tiles the source does not have
+        self.version = 0      # Bumped whenever a new tile becomes drawable
+
+        self.placeholder_color = (34, 139, 34)  # Grass green while tiles load
+        self.grid_color = (46, 125, 50)         # Outline of a loading tile
+
+    def visible_tiles(self):
+        """Return (key, screen position) of every tile overlapping the rect, nearest first"""
+        zoom_tiles = 1 << self.zoom
+        left = self.center_x - self.rect.width / 2
+        top = self.center_y - self.rect.height / 2
+        first_x, first_y = int(left // TILE_SIZE), int(top // TILE_SIZE)
+        last_x = int((left + self.rect.width - 1) // TILE_SIZE)
+        last_y = int((top + self.rect.height - 1) // TILE_SIZE)
+
+        tiles = []
+        for tile_y in range(max(0, first_y), min(zoom_tiles - 1, last_y) + 1):
+            for tile_x in range(first_x, last_x + 1):
+                position = (self.rect.x + int(tile_x * TILE_SIZE - left),
+                            self.rect.y + int(tile_y * TILE_SIZE - top))
+                tiles.append(((self.zoom, tile_x % zoom_tiles, tile_y), position))
+
+        # Load from the middle of the view outwards
+        middle = (self.rect.centerx - TILE_SIZE // 2, self.rect.centery - TILE_SIZE // 2)
+        tiles.sort(key=lambda tile: (tile[1][0] - middle[0]) ** 2 + (tile[1][1] - middle[1]) ** 2)
+        return tiles
+
+    def update(self, wait=False):
+        """Take in decoded tiles and request the visible ones still missing
+
+        With wait the visible tiles are loaded before returning, so the map
+        never shows placeholders; headless runs use it to stay reproducible.
+        """
+        if wait:
+            self.request_missing()
+            self.loader.wait()
+        for key, tile in self.loader.poll(None if wait else self.uploads_per_frame):
+            if tile is None:
+                self.missing.add(key)
+                continue
+            if pygame.display.get_surface() is not None:
+                tile = tile.convert_alpha() if tile.get_alpha() is not None else tile.convert()
+            self.cache.put(key, tile)
+            self.version += 1
+        self.request_missing()
+
+    def request_missing(self):
+        """Queue the visible tiles that are neither cached nor known to be missing"""
+        wanted = [key for key, position in self.visible_tiles()
+                  if key not in self.cache and key not in self.missing]
+        self.loader.request(wanted)
+
+    def draw(self, screen):
+        """Blit the visible tiles, cropped to the layer's rect"""
+        blits = []
+        for key, (x, y) in self.visible_tiles():
+            tile_rect = pygame.Rect(x, y, TILE_SIZE, TILE_SIZE).clip(self.rect)
+            if not tile_rect:
+                continue
+            tile = self.cache.get(key)
+            if tile is None:
+                pygame.draw.rect(screen, self.placeholder_color, tile_rect)
+                pygame.draw.rect(screen, self.grid_color, tile_rect, 1)
+                continue
+            blits.append((tile, tile_rect, tile_rect.move(-x, -y)))
+        screen.blits(blits, False)
+
+    def pan(self, dx, dy):
+        """Move the view by a screen distance in pixels"""
+        world_size = TILE_SIZE << self.zoom
+        self.center_x = (self.center_x + dx) % world_size
+        self.center_y = min(max(self.center_y + dy, 0), world_size)
+
+    def zoom_by(self, steps, anchor=None):
+        """Zoom in (positive) or out by whole levels, keeping the anchor point in place"""
+        zoom = min(max(self.zoom + steps, self.source.min_zoom), self.source.max_zoom)
+        if zoom == self.zoom:
+            return
+        anchor_x, anchor_y = anchor if anchor is not None else self.rect.center
+        offset_x = anchor_x - self.rect.centerx
+        offset_y = anchor_y - self.rect.centery
+        scale = 2 ** (zoom - self.zoom)
+        self.center_x = (self.center_x + offset_x) * scale - offset_x
+        self.center_y = (self.center_y + offset_y) * scale - offset_y
+        self.zoom = zoom
+        self.pan(0, 0)  # Wrap and clamp at the new zoom
+
+    def get_state(self):
+        """Return a value that changes whenever the drawn map changed"""
+        return (int(self.center_x), int(self.center_y), self.zoom, self.version)
+
+    def get_rect(self):
+        """Return the screen area the map covers"""
+        return self.rect
+
+    def close(self):
+        """Stop the tile loader"""
+        self.loader.close()
+
+def world_pixel(latitude, longitude, zoom):
+    """Return the Web Mercator world pixel of a coordinate at a zoom level"""
+    world_size = TILE_SIZE << zoom
+    latitude = math.radians(min(max(latitude, -85.0511), 85.0511))
+    x = (longitude + 180.0) / 360.0 * world_size
+    y = (1 - math.log(math.tan(latitude) + 1 / math.cos(latitude)) / math.pi) / 2 * world_size
+    return x, y